@@ -3,15 +3,17 @@
 # SPDX-License-Identifier: MIT
 """Decision Schema: Shared contract for multi-core decision ecosystem."""
 
-from decision_schema.types import Action, Proposal, FinalDecision, MismatchInfo
+from decision_schema.context import DecisionContext
 from decision_schema.packet_v2 import PacketV2
+from decision_schema.types import Action, FinalDecision, MismatchInfo, Proposal
 from decision_schema.version import __version__
 
 __all__ = [
     "Action",
-    "Proposal",
+    "DecisionContext",
     "FinalDecision",
     "MismatchInfo",
     "PacketV2",
+    "Proposal",
     "__version__",
 ]
@@ -0,0 +1,294 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Optional Arrow / Parquet export and import of PacketV2 traces.
+
+Requires pyarrow (`pip install decision-schema[arrow]`). The module imports
+without it; calling any function then raises ImportError with that hint, and
+`HAVE_PYARROW` tells callers up front.
+
+Columns (PACKET_COLUMNS):
+
+- scalars: `run_id` (string), `step` (int64), `latency_ms` (float64),
+  `schema_version` (string)
+- promoted from `final_action`: `action` (string), `allowed` (bool), for
+  predicate pushdown without JSON decoding
+- nested dicts as compact JSON strings: `input`, `external`, `mdm`,
+  `final_action`, `mismatch` (null when absent). `external` keys differ per
+  packet, so a fixed struct schema would not hold across batches.
+
+Packets are streamed into record batches of at most `batch_size` rows; each
+batch becomes one Parquet row group with min/max statistics, so `read_parquet`
+skips row groups by `run_id` / `step` range.
+
+CLI:
+    python -m decision_schema.arrow_io export trace_dir/ trace.parquet
+    python -m decision_schema.arrow_io import trace.parquet trace.jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+from decision_schema.packet_v2 import PacketV2
+from decision_schema.query import resolve_sources
+from decision_schema.trace_io import PacketLike, iter_packet_dicts, packet_to_dict, write_packets
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # optional dependency
+    pa = None
+    pq = None
+
+HAVE_PYARROW = pa is not None
+
+PACKET_COLUMNS = (
+    "run_id",
+    "step",
+    "latency_ms",
+    "schema_version",
+    "action",
+    "allowed",
+    "input",
+    "external",
+    "mdm",
+    "final_action",
+    "mismatch",
+)
+_JSON_COLUMNS = ("input", "external", "mdm", "final_action", "mismatch")
+DEFAULT_BATCH_SIZE = 65_536
+
+_json = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError(
+            "pyarrow is required for decision_schema.arrow_io (pip install decision-schema[arrow])"
+        )
+
+
+def packet_schema() -> Any:
+    """Arrow schema of exported packets."""
+    _require_pyarrow()
+    return pa.schema(
+        [
+            pa.field("run_id", pa.string(), nullable=False),
+            pa.field("step", pa.int64(), nullable=False),
+            pa.field("latency_ms", pa.float64()),
+            pa.field("schema_version", pa.string()),
+            pa.field("action", pa.string()),
+            pa.field("allowed", pa.bool_()),
+            *(pa.field(name, pa.string()) for name in _JSON_COLUMNS),
+        ]
+    )
+
+
+def _columns(rows: list[dict[str, Any]]) -> dict[str, list[Any]]:
+    cols: dict[str, list[Any]] = {name: [] for name in PACKET_COLUMNS}
+    for data in rows:
+        final_action = data.get("final_action")
+        fa = final_action if isinstance(final_action, dict) else {}
+        allowed = fa.get("allowed")
+        cols["run_id"].append(data["run_id"])
+        cols["step"].append(data["step"])
+        cols["latency_ms"].append(data.get("latency_ms"))
+        cols["schema_version"].append(data.get("schema_version"))
+        cols["action"].append(fa.get("action"))
+        cols["allowed"].append(allowed if isinstance(allowed, bool) else None)
+        for name in _JSON_COLUMNS:
+            value = data.get(name)
+            cols[name].append(None if value is None else _json(value))
+    return cols
+
+
+def packet_batches(
+    packets: Iterable[PacketLike], batch_size: int = DEFAULT_BATCH_SIZE
+) -> Iterator[Any]:
+    """Stream packets as pyarrow.RecordBatch objects of at most batch_size rows."""
+    _require_pyarrow()
+    if batch_size <= 0:
+        raise ValueError(f"batch_size must be > 0, got {batch_size}")
+    return _iter_batches(packets, batch_size, packet_schema())
+
+
+def _iter_batches(packets: Iterable[PacketLike], batch_size: int, schema: Any) -> Iterator[Any]:
+    rows: list[dict[str, Any]] = []
+    for packet in packets:
+        rows.append(packet if isinstance(packet, dict) else packet_to_dict(packet))
+        if len(rows) >= batch_size:
+            yield _batch(rows, schema)
+            rows = []
+    if rows:
+        yield _batch(rows, schema)
+
+
+def _batch(rows: list[dict[str, Any]], schema: Any) -> Any:
+    cols = _columns(rows)
+    return pa.RecordBatch.from_arrays(
+        [pa.array(cols[f.name], type=f.type) for f in schema], schema=schema
+    )
+
+
+def write_parquet(
+    packets: Iterable[PacketLike],
+    path: str | Path,
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    compression: str = "zstd",
+) -> int:
+    """
+    Write packets to a Parquet file, one row group per batch; return the row count.
+
+    Row groups carry min/max statistics. Sort traces by (run_id, step) first
+    (trace_sort.py) for tight, non-overlapping row group ranges.
+    """
+    _require_pyarrow()
+    n = 0
+    with pq.ParquetWriter(
+        str(path), packet_schema(), compression=compression, write_statistics=True
+    ) as writer:
+        for batch in packet_batches(packets, batch_size):
+            writer.write_batch(batch, row_group_size=batch.num_rows)
+            n += batch.num_rows
+    return n
+
+
+def _row_groups(
+    pf: Any, run_ids: frozenset[str] | None, step_range: tuple[int, int] | None
+) -> list[int]:
+    meta = pf.metadata
+    names = pf.schema_arrow.names
+    run_col, step_col = names.index("run_id"), names.index("step")
+    keep = []
+    for i in range(meta.num_row_groups):
+        rg = meta.row_group(i)
+        if run_ids is not None:
+            stats = rg.column(run_col).statistics
+            if stats is not None and stats.has_min_max:
+                if not any(stats.min <= r <= stats.max for r in run_ids):
+                    continue
+        if step_range is not None:
+            stats = rg.column(step_col).statistics
+            if stats is not None and stats.has_min_max:
+                lo, hi = step_range
+                if stats.max < lo or stats.min > hi:
+                    continue
+        keep.append(i)
+    return keep
+
+
+def _restore(row: dict[str, Any]) -> dict[str, Any]:
+    data: dict[str, Any] = {"run_id": row["run_id"], "step": row["step"]}
+    for name in ("input", "external", "mdm", "final_action"):
+        raw = row.get(name)
+        data[name] = {} if raw is None else json.loads(raw)
+    latency = row.get("latency_ms")
+    data["latency_ms"] = int(latency) if latency is not None and latency.is_integer() else latency
+    raw = row.get("mismatch")
+    data["mismatch"] = None if raw is None else json.loads(raw)
+    if row.get("schema_version") is not None:
+        data["schema_version"] = row["schema_version"]
+    return data
+
+
+def iter_parquet_dicts(
+    path: str | Path,
+    *,
+    run_ids: Iterable[str] | None = None,
+    step_range: tuple[int, int] | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[dict[str, Any]]:
+    """
+    Stream packet dicts from a Parquet file written by write_parquet.
+
+    Args:
+        run_ids: Only these runs (row groups outside their min/max range are skipped).
+        step_range: Only steps in [lo, hi] (inclusive).
+    """
+    _require_pyarrow()
+    wanted = frozenset(run_ids) if run_ids is not None else None
+    return _iter_rows(pq.ParquetFile(str(path)), wanted, step_range, batch_size)
+
+
+def _iter_rows(
+    pf: Any,
+    wanted: frozenset[str] | None,
+    step_range: tuple[int, int] | None,
+    batch_size: int,
+) -> Iterator[dict[str, Any]]:
+    groups = _row_groups(pf, wanted, step_range)
+    if not groups:
+        return
+    for batch in pf.iter_batches(batch_size=batch_size, row_groups=groups):
+        for row in batch.to_pylist():
+            if wanted is not None and row["run_id"] not in wanted:
+                continue
+            if step_range is not None and not step_range[0] <= row["step"] <= step_range[1]:
+                continue
+            yield _restore(row)
+
+
+def read_parquet(path: str | Path, **kwargs: Any) -> Iterator[PacketV2]:
+    """Stream PacketV2 objects from a Parquet file (kwargs as in iter_parquet_dicts)."""
+    for data in iter_parquet_dicts(path, **kwargs):
+        yield PacketV2.from_dict(data)
+
+
+def export_traces(
+    sources: Iterable[str | Path],
+    output: str | Path,
+    *,
+    prefix: str = "trace",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    compression: str = "zstd",
+) -> int:
+    """Convert JSONL traces / segment directories to one Parquet file; return rows written."""
+    files = resolve_sources(sources, prefix)
+    packets = (data for path in files for data in iter_packet_dicts(path))
+    return write_parquet(packets, output, batch_size=batch_size, compression=compression)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m decision_schema.arrow_io",
+        description="Convert PacketV2 traces between JSONL and Parquet.",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+    exp = sub.add_parser("export", help="JSONL traces -> Parquet")
+    exp.add_argument("sources", nargs="+")
+    exp.add_argument("output")
+    exp.add_argument("--prefix", default="trace")
+    exp.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    exp.add_argument("--compression", default="zstd")
+    imp = sub.add_parser("import", help="Parquet -> JSONL trace")
+    imp.add_argument("parquet")
+    imp.add_argument("output")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == "export":
+            n = export_traces(
+                args.sources,
+                args.output,
+                prefix=args.prefix,
+                batch_size=args.batch_size,
+                compression=args.compression,
+            )
+        else:
+            n = write_packets(args.output, iter_parquet_dicts(args.parquet))
+    except ImportError as exc:
+        print(str(exc), file=sys.stderr)
+        return 2
+    print(f"rows={n}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
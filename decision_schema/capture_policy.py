@@ -0,0 +1,125 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tiered trace capture policy for PacketV2 emission.
+
+Decides per packet whether to emit it in full, in reduced form, or not at all.
+Fail-closed and mismatch packets are always captured in full.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass, field, replace
+from enum import Enum
+from typing import Any
+
+from decision_schema.packet_v2 import PacketV2
+
+# external keys that mark a fail-closed path (context key + registered trace keys)
+FAIL_CLOSED_KEYS = ("fail_closed", "harness.fail_closed", "exec.fail_closed")
+
+_MAX_KEY_BYTES = hashlib.blake2b.MAX_KEY_SIZE
+
+
+class CaptureTier(str, Enum):
+    """Capture fidelity for one packet."""
+
+    FULL = "FULL"
+    REDUCED = "REDUCED"
+    DROP = "DROP"
+
+
+def run_sample_point(run_id: str, salt: str = "") -> float:
+    """
+    Deterministic position of a run in [0.0, 1.0).
+
+    Same (run_id, salt) always maps to the same point, across processes and hosts,
+    so every packet of a run gets the same sampling decision. Salts of any length
+    are accepted.
+    """
+    key = salt.encode("utf-8")
+    if len(key) > _MAX_KEY_BYTES:  # BLAKE2b keys are at most 64 bytes; fold longer salts
+        key = hashlib.blake2b(key, digest_size=_MAX_KEY_BYTES).digest()
+    h = hashlib.blake2b(run_id.encode("utf-8"), digest_size=8, key=key)
+    return int.from_bytes(h.digest(), "big") / 2.0**64
+
+
+def _action_value(final_action: dict[str, Any]) -> str | None:
+    action = final_action.get("action") if isinstance(final_action, dict) else None
+    return getattr(action, "value", action)
+
+
+@dataclass(frozen=True)
+class CapturePolicy:
+    """
+    Per-packet capture decision.
+
+    Decision order:
+    1. `mismatch` has flags or reason codes -> FULL
+    2. any of FAIL_CLOSED_KEYS truthy in `external` -> FULL
+    3. `final_action["action"]` in `full_actions` -> FULL
+    4. run sample point < `full_rate` -> FULL
+    5. action in `drop_actions` -> DROP
+    6. run sample point < `reduced_rate` -> REDUCED, else DROP
+
+    Args:
+        full_rate: Fraction of runs captured in full.
+        reduced_rate: Fraction of runs captured at least in reduced form (>= full_rate).
+        full_actions: Action values always captured in full.
+        drop_actions: Action values dropped unless a rule above applies.
+        reduced_external_keys: Context keys kept in reduced packets (trace keys are always kept).
+        salt: Sampling salt; change it to sample a different subset of runs.
+    """
+
+    full_rate: float = 0.01
+    reduced_rate: float = 1.0
+    full_actions: frozenset[str] = frozenset({"STOP", "EXIT", "CANCEL"})
+    drop_actions: frozenset[str] = frozenset()
+    reduced_external_keys: frozenset[str] = field(
+        default_factory=lambda: frozenset({"now_ms", "run_id", "ops_state", "ops_deny_actions"})
+    )
+    salt: str = ""
+
+    def __post_init__(self) -> None:
+        if not 0.0 <= self.full_rate <= 1.0:
+            raise ValueError(f"full_rate must be in [0.0, 1.0], got {self.full_rate}")
+        if not self.full_rate <= self.reduced_rate <= 1.0:
+            raise ValueError(f"reduced_rate must be in [full_rate, 1.0], got {self.reduced_rate}")
+
+    def decide(self, packet: PacketV2) -> CaptureTier:
+        """Return the capture tier for a packet."""
+        mismatch = packet.mismatch
+        # asdict(MismatchInfo()) has empty lists: not a mismatch.
+        if mismatch and (mismatch.get("flags") or mismatch.get("reason_codes")):
+            return CaptureTier.FULL
+        external = packet.external or {}
+        for key in FAIL_CLOSED_KEYS:
+            if external.get(key):
+                return CaptureTier.FULL
+        action = _action_value(packet.final_action)
+        if action in self.full_actions:
+            return CaptureTier.FULL
+        point = run_sample_point(packet.run_id, self.salt)
+        if point < self.full_rate:
+            return CaptureTier.FULL
+        if action in self.drop_actions:
+            return CaptureTier.DROP
+        if point < self.reduced_rate:
+            return CaptureTier.REDUCED
+        return CaptureTier.DROP
+
+    def reduce(self, packet: PacketV2) -> PacketV2:
+        """Return a reduced copy: empty `input`, `external` limited to kept and trace keys."""
+        keep = self.reduced_external_keys
+        external = {k: v for k, v in (packet.external or {}).items() if k in keep or "." in k}
+        return replace(packet, input={}, external=external)
+
+    def apply(self, packet: PacketV2) -> tuple[CaptureTier, PacketV2 | None]:
+        """Return (tier, packet to emit); the packet is None when the tier is DROP."""
+        tier = self.decide(packet)
+        if tier is CaptureTier.FULL:
+            return tier, packet
+        if tier is CaptureTier.REDUCED:
+            return tier, self.reduce(packet)
+        return tier, None
@@ -0,0 +1,270 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Reason/flag code registry: interned strings, stable small-int ids and bitsets.
+
+`Proposal.reasons`, `FinalDecision.reasons`, `MismatchInfo.flags` and
+`MismatchInfo.reason_codes` repeat the same few codes in every packet. A
+`CodeRegistry` maps each code to an interned string and a small id (assigned in
+registration order), so a set of codes becomes an int bitmask: membership is
+`mask & bit`, union is `a | b`.
+
+Ids are stable for a given registration order. Processes that share bitsets
+must seed their registries with the same code list (`CodeRegistry(codes)`,
+persisted with `registry.codes()`); lists remain the wire format.
+
+Encoding (`MismatchInfo.to_bits`) never grows a registry implicitly: flags and
+reason codes are free-form, so codes the registry does not know travel as
+strings next to the masks. Register the codes you want as bits up front.
+
+`enable_reason_interning()` makes Proposal / FinalDecision intern their
+`reasons` on construction (off by default).
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
+
+class CodeRegistry:
+    """
+    Code string <-> id registry.
+
+    Lookups are plain dict/list reads; registration of new codes is locked.
+
+    Args:
+        codes: Initial codes (ids 0..n-1 in this order).
+        max_codes: Upper bound on registered codes; guards against free-form strings.
+    """
+
+    def __init__(self, codes: Iterable[str] = (), *, max_codes: int = 1024) -> None:
+        self.max_codes = max_codes
+        self._ids: dict[str, int] = {}
+        self._codes: list[str] = []
+        self._lock = threading.Lock()
+        for code in codes:
+            self.id_of(code)
+
+    def id_of(self, code: str) -> int:
+        """Return the id of code, registering it if new."""
+        code_id = self._ids.get(code)
+        if code_id is not None:
+            return code_id
+        if not isinstance(code, str):
+            raise ValueError(f"code must be str, got {type(code).__name__}")
+        with self._lock:
+            code_id = self._ids.get(code)
+            if code_id is None:
+                if len(self._codes) >= self.max_codes:
+                    raise ValueError(f"code registry full ({self.max_codes} codes)")
+                code = sys.intern(code)
+                code_id = len(self._codes)
+                self._codes.append(code)
+                self._ids[code] = code_id
+        return code_id
+
+    def lookup(self, code: str) -> int | None:
+        """Return the id of code without registering it (None if unknown)."""
+        return self._ids.get(code)
+
+    def code_of(self, code_id: int) -> str:
+        """Return the interned code string for an id."""
+        return self._codes[code_id]
+
+    def intern(self, code: str) -> str:
+        """Return the registry's interned instance of code (registering it if new)."""
+        return self._codes[self.id_of(code)]
+
+    def intern_list(self, codes: Iterable[str]) -> list[str]:
+        """Return codes with every entry replaced by its interned instance."""
+        return [self._codes[self.id_of(c)] for c in codes]
+
+    def bit(self, code: str) -> int:
+        """Single-bit mask for code (registering it if new)."""
+        return 1 << self.id_of(code)
+
+    def mask(self, codes: Iterable[str]) -> int:
+        """Bitmask of codes (duplicates and order are not represented)."""
+        m = 0
+        for c in codes:
+            m |= 1 << self.id_of(c)
+        return m
+
+    def codes_of(self, mask: int) -> list[str]:
+        """Codes set in mask, in id order."""
+        out = []
+        codes = self._codes
+        while mask:
+            low = mask & -mask
+            out.append(codes[low.bit_length() - 1])
+            mask ^= low
+        return out
+
+    def codes(self) -> tuple[str, ...]:
+        """All codes in id order (persist this to recreate the same ids)."""
+        return tuple(self._codes)
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def __contains__(self, code: object) -> bool:
+        return code in self._ids
+
+
+# Process-wide default registry.
+CODES = CodeRegistry()
+
+
+def bit_histogram(masks: Iterable[int], registry: CodeRegistry = CODES) -> dict[str, int]:
+    """Count, per code, how many masks have its bit set."""
+    counts: dict[int, int] = {}
+    for mask in masks:
+        while mask:
+            low = mask & -mask
+            counts[low] = counts.get(low, 0) + 1
+            mask ^= low
+    return {registry.code_of(b.bit_length() - 1): n for b, n in sorted(counts.items())}
+
+
+def _encode(
+    registry: CodeRegistry, codes: list[str], register: bool
+) -> tuple[int, tuple[int, ...] | None, tuple[str, ...]]:
+    # Registered codes become bits; unknown codes go to the `extra` sidecar and
+    # are referenced from the order tuple as -(index + 1).
+    mask = 0
+    extra: list[str] = []
+    seq: list[int] = []
+    for code in codes:
+        if not isinstance(code, str):
+            raise ValueError(f"code must be str, got {type(code).__name__}")
+        code_id = registry.lookup(code)
+        if code_id is None and register and len(registry) < registry.max_codes:
+            try:
+                code_id = registry.id_of(code)
+            except ValueError:  # filled up concurrently
+                code_id = None
+        if code_id is None:
+            if code not in extra:
+                extra.append(code)
+            seq.append(-extra.index(code) - 1)
+        else:
+            mask |= 1 << code_id
+            seq.append(code_id)
+    # Implied order: registered codes in strictly increasing id order, then the extras
+    # once each in first-seen order. Anything else keeps the exact sequence.
+    known = [i for i in seq if i >= 0]
+    implied = all(a < b for a, b in zip(known, known[1:], strict=False)) and seq == known + [
+        -k - 1 for k in range(len(extra))
+    ]
+    return mask, (None if implied else tuple(seq)), tuple(extra)
+
+
+def _decode(
+    registry: CodeRegistry, mask: int, order: tuple[int, ...] | None, extra: tuple[str, ...]
+) -> list[str]:
+    if order is None:
+        return registry.codes_of(mask) + list(extra)
+    return [registry.code_of(i) if i >= 0 else extra[-i - 1] for i in order]
+
+
+def _merge_extra(a: tuple[str, ...], b: tuple[str, ...]) -> tuple[str, ...]:
+    return a + tuple(code for code in b if code not in a)
+
+
+@dataclass(frozen=True, slots=True)
+class MismatchBits:
+    """
+    Bitset form of MismatchInfo.flags / reason_codes (see MismatchInfo.to_bits).
+
+    `flags` / `reason_codes` are masks over a CodeRegistry. Codes the registry
+    does not know are kept as strings in `extra_flags` / `extra_reason_codes`
+    (they have no bit). `flag_order` / `reason_order` are only set when the
+    source list was not in implied order or had duplicates, so conversion back
+    to lists is always lossless.
+    """
+
+    flags: int = 0
+    reason_codes: int = 0
+    flag_order: tuple[int, ...] | None = None
+    reason_order: tuple[int, ...] | None = None
+    extra_flags: tuple[str, ...] = ()
+    extra_reason_codes: tuple[str, ...] = ()
+
+    @classmethod
+    def from_lists(
+        cls,
+        flags: list[str],
+        reason_codes: list[str],
+        registry: CodeRegistry = CODES,
+        *,
+        register: bool = False,
+    ) -> MismatchBits:
+        """
+        Encode code lists over registry.
+
+        Args:
+            register: Register unknown codes while the registry has room (default:
+                unknown codes go to the extra_* sidecars and the registry is not changed).
+        """
+        f, f_order, f_extra = _encode(registry, flags, register)
+        r, r_order, r_extra = _encode(registry, reason_codes, register)
+        return cls(f, r, f_order, r_order, f_extra, r_extra)
+
+    def flag_list(self, registry: CodeRegistry = CODES) -> list[str]:
+        return _decode(registry, self.flags, self.flag_order, self.extra_flags)
+
+    def reason_code_list(self, registry: CodeRegistry = CODES) -> list[str]:
+        return _decode(registry, self.reason_codes, self.reason_order, self.extra_reason_codes)
+
+    def has_flag(self, bit: int) -> bool:
+        """True if any bit of `bit` (from registry.bit / registry.mask) is set in flags."""
+        return bool(self.flags & bit)
+
+    def has_reason_code(self, bit: int) -> bool:
+        return bool(self.reason_codes & bit)
+
+    def union(self, other: MismatchBits) -> MismatchBits:
+        """Set union (registered codes in id order, then extras, without duplicates)."""
+        return MismatchBits(
+            self.flags | other.flags,
+            self.reason_codes | other.reason_codes,
+            extra_flags=_merge_extra(self.extra_flags, other.extra_flags),
+            extra_reason_codes=_merge_extra(self.extra_reason_codes, other.extra_reason_codes),
+        )
+
+
+# Active reason interner; read directly by Proposal / FinalDecision (None = disabled).
+reason_interner: Callable[[list[str]], list[str]] | None = None
+
+
+def enable_reason_interning(registry: CodeRegistry = CODES) -> None:
+    """
+    Intern `reasons` of every Proposal / FinalDecision constructed from now on.
+
+    Codes already registered in registry are replaced by the registry's
+    instance; other strings (free-form reasons with ids or numbers) are kept
+    as-is, so neither the registry nor the interpreter's intern table grows.
+    """
+    global reason_interner
+    known = registry._ids
+    codes = registry._codes
+
+    def intern_reasons(reasons: list[str]) -> list[str]:
+        out = []
+        for r in reasons:
+            if type(r) is str:
+                code_id = known.get(r)
+                if code_id is not None:
+                    r = codes[code_id]
+            out.append(r)
+        return out
+
+    reason_interner = intern_reasons
+
+
+def disable_reason_interning() -> None:
+    global reason_interner
+    reason_interner = None
@@ -0,0 +1,143 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Typed, immutable integration context (PARAMETER_INDEX context key registry).
+
+`DecisionContext` carries the documented context keys as slotted attributes and
+is itself a read-only Mapping, so it can be passed anywhere a context dict is
+expected (e.g. `modulate(proposal, policy, context)`) without copying. Key
+format is validated once, at construction.
+"""
+
+from __future__ import annotations
+
+import copy
+from collections.abc import Iterator, Mapping
+from typing import Any
+
+from decision_schema.trace_registry import is_valid_context_key
+
+# Context key registry from docs/PARAMETER_INDEX.md (order is the iteration order).
+CONTEXT_KEYS = (
+    "now_ms",
+    "last_event_ts_ms",
+    "run_id",
+    "fail_closed",
+    "ops_deny_actions",
+    "ops_state",
+    "ops_cooldown_until_ms",
+    "errors_in_window",
+    "steps_in_window",
+    "rate_limit_events",
+    "recent_failures",
+    "cooldown_until_ms",
+)
+_CONTEXT_KEY_SET = frozenset(CONTEXT_KEYS)
+
+
+class DecisionContext(Mapping[str, Any]):
+    """
+    Immutable integration context.
+
+    Documented keys are attributes (None when not provided). Only keys that were
+    provided appear in the Mapping view, so `"ops_state" in ctx` and `ctx.get(...)`
+    behave like the equivalent plain dict. Additional keys go in `extra` and must
+    match CONTEXT_KEY_RE.
+
+    Raises:
+        TypeError: If a keyword is not a documented key, or an extra key is not a str.
+        ValueError: If an extra key is not a valid context key (INV-T1 error code).
+    """
+
+    __slots__ = (*CONTEXT_KEYS, "_extra", "_present", "_keys")
+
+    now_ms: int | None
+    last_event_ts_ms: int | None
+    run_id: str | None
+    fail_closed: bool | None
+    ops_deny_actions: bool | None
+    ops_state: str | None
+    ops_cooldown_until_ms: int | None
+    errors_in_window: int | None
+    steps_in_window: int | None
+    rate_limit_events: int | None
+    recent_failures: int | None
+    cooldown_until_ms: int | None
+
+    def __init__(self, *, extra: Mapping[str, Any] | None = None, **values: Any) -> None:
+        unknown = values.keys() - _CONTEXT_KEY_SET
+        if unknown:
+            raise TypeError(f"unknown context attribute(s): {sorted(unknown)}; use extra=")
+        extra = dict(extra) if extra else {}
+        for k in extra:
+            if not isinstance(k, str):
+                raise TypeError("INV-T1:key_not_str")
+            if k in _CONTEXT_KEY_SET:
+                raise ValueError(f"INV-T1:duplicate_context_key:{k}")
+            if not is_valid_context_key(k):
+                raise ValueError(f"INV-T1:invalid_context_key_format:{k}")
+        setattr_ = object.__setattr__
+        for k in CONTEXT_KEYS:
+            setattr_(self, k, values.get(k))
+        present = tuple(k for k in CONTEXT_KEYS if k in values)
+        setattr_(self, "_extra", extra)
+        setattr_(self, "_present", frozenset(present))
+        setattr_(self, "_keys", present + tuple(extra))
+
+    @classmethod
+    def from_mapping(cls, context: Mapping[str, Any]) -> DecisionContext:
+        """Build from a plain context dict; undocumented keys go to `extra`."""
+        if isinstance(context, DecisionContext):
+            return context
+        values = {k: v for k, v in context.items() if k in _CONTEXT_KEY_SET}
+        extra = {k: v for k, v in context.items() if k not in _CONTEXT_KEY_SET}
+        return cls(extra=extra, **values)
+
+    def replace(self, **changes: Any) -> DecisionContext:
+        """Return a new context with changes applied (undocumented keys go to `extra`)."""
+        values = {k: getattr(self, k) for k in self._present}
+        extra = dict(self._extra)
+        for k, v in changes.items():
+            if k in _CONTEXT_KEY_SET:
+                values[k] = v
+            else:
+                extra[k] = v
+        return DecisionContext(extra=extra, **values)
+
+    def to_external(self) -> dict[str, Any]:
+        """Plain-dict snapshot for PacketV2.external (already validated; no re-check needed)."""
+        return {k: self[k] for k in self._keys}
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._present:
+            return getattr(self, key)
+        return self._extra[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._present or key in self._extra
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    # Slots are restored through __setattr__ by default; rebuild through __init__.
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (DecisionContext.from_mapping, (self.to_external(),))
+
+    def __copy__(self) -> DecisionContext:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> DecisionContext:
+        return DecisionContext.from_mapping(copy.deepcopy(self.to_external(), memo))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("DecisionContext is immutable; use replace()")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("DecisionContext is immutable; use replace()")
+
+    def __repr__(self) -> str:
+        items = ", ".join(f"{k}={self[k]!r}" for k in self._keys)
+        return f"DecisionContext({items})"
@@ -0,0 +1,208 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Content-addressed PacketV2 hashing and streaming deduplication.
+
+The canonical form is JSON with sorted keys, compact separators and normalized
+floats (-0.0 -> 0.0, integral floats -> int). `schema_version` is part of the
+hashed content, so the same step emitted under two schema versions is distinct.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from decision_schema.trace_io import PacketLike, packet_to_dict
+from decision_schema.version import __version__
+
+# Bump if the canonical encoding changes; digests from different formats never compare equal.
+HASH_FORMAT = b"ds-packet-hash:1\n"
+DIGEST_SIZE = 16
+
+T = TypeVar("T", bound=PacketLike)
+
+
+def _normalize(value: Any) -> Any:
+    if isinstance(value, float):
+        if math.isnan(value) or math.isinf(value):
+            raise ValueError(f"non-finite float is not canonicalizable: {value!r}")
+        if value.is_integer():
+            return int(value)
+        return value
+    if isinstance(value, Mapping):
+        return {k: _normalize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    return value
+
+
+def canonical_packet_bytes(packet: PacketLike) -> bytes:
+    """
+    Return the canonical byte encoding of a packet.
+
+    Args:
+        packet: PacketV2 instance or decoded packet dict.
+
+    Returns:
+        UTF-8 JSON bytes with sorted keys and normalized floats.
+
+    Raises:
+        ValueError: If the packet contains NaN or infinite floats.
+    """
+    data = packet_to_dict(packet)
+    data.setdefault("schema_version", __version__)
+    return json.dumps(
+        _normalize(data),
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        allow_nan=False,
+    ).encode("utf-8")
+
+
+def packet_digest(packet: PacketLike) -> bytes:
+    """Return the 16-byte content digest of a packet (BLAKE2b over canonical bytes)."""
+    h = hashlib.blake2b(HASH_FORMAT, digest_size=DIGEST_SIZE)
+    h.update(canonical_packet_bytes(packet))
+    return h.digest()
+
+
+def packet_hash(packet: PacketLike) -> str:
+    """Return the hex content hash of a packet."""
+    return packet_digest(packet).hex()
+
+
+class LRUSeenSet:
+    """Bounded set of digests; the least recently seen digest is evicted first."""
+
+    def __init__(self, max_entries: int) -> None:
+        if max_entries <= 0:
+            raise ValueError(f"max_entries must be > 0, got {max_entries}")
+        self.max_entries = max_entries
+        self._items: OrderedDict[bytes, None] = OrderedDict()
+
+    def check_and_add(self, digest: bytes) -> bool:
+        """Return True if digest was already present; record it either way."""
+        items = self._items
+        if digest in items:
+            items.move_to_end(digest)
+            return True
+        items[digest] = None
+        if len(items) > self.max_entries:
+            items.popitem(last=False)
+        return False
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class BloomSeenSet:
+    """
+    Fixed-size Bloom filter over digests.
+
+    Memory is fixed at construction and nothing is evicted; false positives
+    (a unique packet reported as seen) occur at roughly `error_rate` while
+    fewer than `capacity` digests have been added.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001) -> None:
+        if capacity <= 0:
+            raise ValueError(f"capacity must be > 0, got {capacity}")
+        if not 0.0 < error_rate < 1.0:
+            raise ValueError(f"error_rate must be in (0.0, 1.0), got {error_rate}")
+        ln2 = math.log(2)
+        self.num_bits = max(8, int(math.ceil(-capacity * math.log(error_rate) / (ln2 * ln2))))
+        self.num_hashes = max(1, round(self.num_bits / capacity * ln2))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, digest: bytes) -> Iterator[int]:
+        # Kirsch-Mitzenmacher double hashing over the two digest halves.
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:16], "little") | 1
+        m = self.num_bits
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % m
+
+    def check_and_add(self, digest: bytes) -> bool:
+        """Return True if digest was (probably) already present; record it either way."""
+        bits = self._bits
+        present = True
+        for pos in self._positions(digest):
+            byte, mask = pos >> 3, 1 << (pos & 7)
+            if not bits[byte] & mask:
+                present = False
+                bits[byte] |= mask
+        if not present:
+            self.count += 1
+        return present
+
+    def __len__(self) -> int:
+        return self.count
+
+
+@dataclass
+class DedupStats:
+    """Counters reported by PacketDeduplicator."""
+
+    total: int = 0
+    duplicates: int = 0
+
+    @property
+    def unique(self) -> int:
+        return self.total - self.duplicates
+
+    @property
+    def dedup_ratio(self) -> float:
+        """Fraction of packets dropped as duplicates (0.0 when nothing was seen)."""
+        return self.duplicates / self.total if self.total else 0.0
+
+
+class PacketDeduplicator:
+    """
+    Streaming exact-duplicate filter for PacketV2 records.
+
+    Use the same instance on the read side (`dedup.filter(read_packets(path))`)
+    or the write side (`write_packets(path, dedup.filter(packets))`).
+
+    Args:
+        max_entries: Digests kept in memory (LRU) or Bloom filter capacity.
+        mode: "lru" (exact within the window) or "bloom" (fixed memory, probabilistic).
+        bloom_error_rate: Target false-positive rate in "bloom" mode.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 100_000,
+        mode: str = "lru",
+        bloom_error_rate: float = 0.001,
+    ) -> None:
+        if mode == "lru":
+            self._seen: LRUSeenSet | BloomSeenSet = LRUSeenSet(max_entries)
+        elif mode == "bloom":
+            self._seen = BloomSeenSet(max_entries, bloom_error_rate)
+        else:
+            raise ValueError(f"mode must be 'lru' or 'bloom', got {mode!r}")
+        self.mode = mode
+        self.stats = DedupStats()
+
+    def is_duplicate(self, packet: PacketLike) -> bool:
+        """Record packet and return True if it duplicates one already seen."""
+        dup = self._seen.check_and_add(packet_digest(packet))
+        self.stats.total += 1
+        if dup:
+            self.stats.duplicates += 1
+        return dup
+
+    def filter(self, packets: Iterable[T]) -> Iterator[T]:
+        """Yield only packets not seen before."""
+        for packet in packets:
+            if not self.is_duplicate(packet):
+                yield packet
@@ -0,0 +1,310 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Mergeable exec.* counter totals per run, across workers.
+
+`ExecCounters` sums the per-packet execution counters (`EXEC_COUNT_KEYS`) by
+`run_id` as packets are produced, so dashboards read totals from small
+snapshots instead of rescanning traces.
+
+State is a grow-only counter per worker: every process only increments its
+own `worker_id` slot and `merge` takes the element-wise max per
+(worker, run, key). Merging is therefore commutative and idempotent: workers
+can swap snapshots as often as they like, merge the same snapshot twice or
+merge in any order, and totals (the sum over workers) never double count.
+
+    counters = ExecCounters(worker_id="worker-3")
+    counters.add(packet)                      # or add_all(packets)
+    counters.save_checkpoint("ckpt/worker-3.json")
+    ...
+    counters = ExecCounters.load_checkpoint("ckpt/worker-3.json", worker_id="worker-3")
+
+Resume a restarted worker from its own checkpoint under the same `worker_id`;
+a fresh process that reuses an id without restoring would report lower counts
+than already merged elsewhere, and max-merge keeps the old values.
+
+CLI (fleet totals from checkpoints):
+    python -m decision_schema.exec_counters ckpt/*.json [--by-run]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import threading
+import uuid
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import Any
+
+from decision_schema.query import resolve_sources
+from decision_schema.trace_io import PacketLike, iter_packet_dicts
+from decision_schema.trace_registry import registry_snapshot
+
+EXEC_COUNT_KEYS = (
+    "exec.attempt_count",
+    "exec.success_count",
+    "exec.failed_count",
+    "exec.skipped_count",
+    "exec.denied_count",
+)
+STATE_FORMAT = 1
+
+# Per-run row: [packets, *counts in key order].
+_Row = list[int]
+
+
+class ExecCounters:
+    """
+    Thread-safe accumulator of registered counter keys per run_id.
+
+    Args:
+        keys: Registered trace keys whose integer values are summed.
+        worker_id: This process's slot in merged state (default: random).
+
+    Raises:
+        ValueError: If a key is not registered (INV-T1:unregistered_key).
+    """
+
+    def __init__(self, keys: Iterable[str] = EXEC_COUNT_KEYS, *, worker_id: str | None = None):
+        self.keys = tuple(keys)
+        registered = registry_snapshot().keys
+        for key in self.keys:
+            if key not in registered:
+                raise ValueError(f"INV-T1:unregistered_key:{key}")
+        if len(set(self.keys)) != len(self.keys):
+            raise ValueError("keys must be distinct")
+        self.worker_id = worker_id or uuid.uuid4().hex
+        self._lock = threading.Lock()
+        # worker_id -> run_id -> row; worker_id -> rejected count
+        self._runs: dict[str, dict[str, _Row]] = {self.worker_id: {}}
+        self._rejected: dict[str, int] = {self.worker_id: 0}
+
+    def _add_locked(self, packet: PacketLike, own: dict[str, _Row]) -> int:
+        if isinstance(packet, Mapping):
+            run_id, external = packet.get("run_id"), packet.get("external")
+        else:
+            run_id, external = getattr(packet, "run_id", None), getattr(packet, "external", None)
+        if not isinstance(run_id, str) or not (external is None or isinstance(external, Mapping)):
+            return 1
+        row = own.get(run_id)
+        if row is None:
+            row = own[run_id] = [0] * (len(self.keys) + 1)
+        row[0] += 1
+        if not external:
+            return 0
+        rejected = 0
+        for i, key in enumerate(self.keys, 1):
+            value = external.get(key)
+            if value is None:
+                continue
+            if type(value) is int and value >= 0:
+                row[i] += value
+            else:
+                rejected += 1
+        return rejected
+
+    def add(self, packet: PacketLike) -> None:
+        """
+        Count one packet (PacketV2 or dict) and add its counter values.
+
+        Packets without a str run_id or with a non-mapping external, and values
+        that are not non-negative ints, are skipped and counted in `rejected`.
+        """
+        with self._lock:
+            self._rejected[self.worker_id] += self._add_locked(packet, self._runs[self.worker_id])
+
+    def add_all(self, packets: Iterable[PacketLike]) -> int:
+        """Add packets under one lock acquisition; return the number added."""
+        n = rejected = 0
+        with self._lock:
+            own = self._runs[self.worker_id]
+            for packet in packets:
+                rejected += self._add_locked(packet, own)
+                n += 1
+            self._rejected[self.worker_id] += rejected
+        return n
+
+    def increment(self, run_id: str, key: str, n: int = 1) -> None:
+        """Add n to one counter directly (for callers that count before emitting packets)."""
+        if key not in self.keys:
+            raise ValueError(f"key not tracked: {key!r}")
+        if type(n) is not int or n < 0:
+            raise ValueError(f"n must be a non-negative int, got {n!r}")
+        with self._lock:
+            own = self._runs[self.worker_id]
+            row = own.get(run_id)
+            if row is None:
+                row = own[run_id] = [0] * (len(self.keys) + 1)
+            row[self.keys.index(key) + 1] += n
+
+    @property
+    def rejected(self) -> int:
+        """Skipped packets and values, summed over workers."""
+        with self._lock:
+            return sum(self._rejected.values())
+
+    @property
+    def workers(self) -> list[str]:
+        """Worker ids that have counted anything."""
+        with self._lock:
+            return sorted(w for w, runs in self._runs.items() if runs or self._rejected.get(w))
+
+    def _named(self, row: _Row) -> dict[str, int]:
+        return dict(zip(("packets", *self.keys), row, strict=True))
+
+    def by_run(self) -> dict[str, dict[str, int]]:
+        """run_id -> {"packets": n, key: total, ...}, summed over workers."""
+        merged: dict[str, _Row] = {}
+        with self._lock:
+            for runs in self._runs.values():
+                for run_id, row in runs.items():
+                    acc = merged.get(run_id)
+                    if acc is None:
+                        merged[run_id] = list(row)
+                    else:
+                        for i, value in enumerate(row):
+                            acc[i] += value
+        return {run_id: self._named(row) for run_id, row in merged.items()}
+
+    def run_totals(self, run_id: str) -> dict[str, int]:
+        """Totals for one run (zeros if unseen)."""
+        acc = [0] * (len(self.keys) + 1)
+        with self._lock:
+            for runs in self._runs.values():
+                row = runs.get(run_id)
+                if row is not None:
+                    for i, value in enumerate(row):
+                        acc[i] += value
+        return self._named(acc)
+
+    def totals(self) -> dict[str, int]:
+        """Totals over all runs and workers."""
+        acc = [0] * (len(self.keys) + 1)
+        with self._lock:
+            for runs in self._runs.values():
+                for row in runs.values():
+                    for i, value in enumerate(row):
+                        acc[i] += value
+        return self._named(acc)
+
+    def snapshot(self) -> dict[str, Any]:
+        """JSON-serializable copy of the state of every known worker."""
+        with self._lock:
+            return {
+                "format": STATE_FORMAT,
+                "keys": list(self.keys),
+                "workers": {
+                    worker: {
+                        "rejected": self._rejected.get(worker, 0),
+                        "runs": {run_id: list(row) for run_id, row in runs.items()},
+                    }
+                    for worker, runs in self._runs.items()
+                },
+            }
+
+    def merge(self, other: ExecCounters | Mapping[str, Any]) -> None:
+        """
+        Fold in another accumulator or snapshot (element-wise max per worker slot).
+
+        Raises:
+            ValueError: If the snapshot format or key list differs.
+        """
+        data = other.snapshot() if isinstance(other, ExecCounters) else other
+        if data.get("format") != STATE_FORMAT:
+            raise ValueError(f"unsupported exec counter state format {data.get('format')!r}")
+        if tuple(data.get("keys", ())) != self.keys:
+            raise ValueError(f"key mismatch: {data.get('keys')!r} != {list(self.keys)!r}")
+        width = len(self.keys) + 1
+        with self._lock:
+            for worker, state in data["workers"].items():
+                runs = self._runs.setdefault(worker, {})
+                self._rejected[worker] = max(self._rejected.get(worker, 0), state["rejected"])
+                for run_id, row in state["runs"].items():
+                    if len(row) != width:
+                        raise ValueError(f"row width mismatch for run {run_id!r}")
+                    mine = runs.get(run_id)
+                    if mine is None:
+                        runs[run_id] = [int(v) for v in row]
+                    else:
+                        for i, value in enumerate(row):
+                            if value > mine[i]:
+                                mine[i] = int(value)
+
+    @classmethod
+    def from_snapshot(
+        cls, data: Mapping[str, Any], *, worker_id: str | None = None
+    ) -> ExecCounters:
+        """Restore a snapshot; pass the previous worker_id to keep counting in its slot."""
+        counters = cls(data.get("keys", EXEC_COUNT_KEYS), worker_id=worker_id)
+        counters.merge(data)
+        return counters
+
+    def save_checkpoint(self, path: str | Path) -> None:
+        """Write snapshot() atomically (temp file, fsync, rename)."""
+        path = Path(path)
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, separators=(",", ":"), sort_keys=True)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+    @classmethod
+    def load_checkpoint(cls, path: str | Path, *, worker_id: str | None = None) -> ExecCounters:
+        return cls.from_snapshot(
+            json.loads(Path(path).read_text(encoding="utf-8")), worker_id=worker_id
+        )
+
+
+def merge_checkpoints(paths: Iterable[str | Path]) -> ExecCounters:
+    """Fleet view: merge worker checkpoint files (all must track the same keys)."""
+    merged: ExecCounters | None = None
+    for path in paths:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        if merged is None:
+            merged = ExecCounters.from_snapshot(data)
+        else:
+            merged.merge(data)
+    return merged if merged is not None else ExecCounters()
+
+
+def count_traces(
+    sources: Iterable[str | Path],
+    *,
+    prefix: str = "trace",
+    keys: Iterable[str] = EXEC_COUNT_KEYS,
+    worker_id: str | None = None,
+) -> ExecCounters:
+    """Backfill: count existing JSONL traces / segment directories in one pass."""
+    counters = ExecCounters(keys, worker_id=worker_id)
+    for path in resolve_sources(sources, prefix):
+        counters.add_all(iter_packet_dicts(path))
+    return counters
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m decision_schema.exec_counters",
+        description="Merge exec counter checkpoints and print fleet totals as JSON.",
+    )
+    parser.add_argument("checkpoints", nargs="+", help="Checkpoint files from save_checkpoint")
+    parser.add_argument("--by-run", action="store_true", help="Print totals per run_id")
+    args = parser.parse_args(argv)
+
+    counters = merge_checkpoints(args.checkpoints)
+    out: dict[str, Any] = {
+        "workers": len(counters.workers),
+        "rejected": counters.rejected,
+        "totals": counters.totals(),
+    }
+    if args.by_run:
+        out["runs"] = counters.by_run()
+    print(json.dumps(out, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
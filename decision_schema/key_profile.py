@@ -0,0 +1,470 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Single-pass key usage and cardinality profile of PacketV2.external.
+
+Per key the profiler keeps an exact occurrence count, value type counts, a
+HyperLogLog distinct-value estimate and a count-min sketch of value
+frequencies (with a small top-values list). Memory per key is fixed
+(~4 KiB HLL + 8 * width * depth bytes of counters, ~36 KiB at the defaults),
+independent of trace size; `max_keys` bounds the total (~36 MiB at the default
+1000 keys).
+
+State is mergeable: profile shards in parallel, `merge()` them (or save and
+load with `to_dict()` / `from_dict()`), then call `report()`. Value hashes are
+stable across processes (blake2b over canonical JSON), so shard merges are exact
+unions of the sketches.
+
+`report()` flags:
+- `unregistered_reserved`: trace key in a reserved namespace that is not registered
+- `undocumented_context`: plain (context-format) key not in PARAMETER_INDEX
+- `exploding_cardinality`: distinct values above `cardinality_limit` (timestamp
+  keys listed in `expected_unbounded` are exempt)
+
+CLI:
+    python -m decision_schema.key_profile trace_dir/ --save-state shard0.json
+    python -m decision_schema.key_profile --load-state shard0.json shard1.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import math
+import sys
+from array import array
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from decision_schema.context import CONTEXT_KEYS
+from decision_schema.query import resolve_sources
+from decision_schema.trace_io import PacketLike, iter_packet_dicts
+from decision_schema.trace_registry import (
+    RESERVED_NAMESPACES,
+    is_valid_context_key,
+    is_valid_trace_key,
+    registry_snapshot,
+)
+
+STATE_FORMAT = 1
+# Context keys whose values are timestamps (one distinct value per step by design).
+DEFAULT_EXPECTED_UNBOUNDED = (
+    "now_ms",
+    "last_event_ts_ms",
+    "ops_cooldown_until_ms",
+    "cooldown_until_ms",
+)
+
+_canonical = json.JSONEncoder(
+    separators=(",", ":"), ensure_ascii=False, sort_keys=True, default=str
+).encode
+
+
+def _type_name(value: Any) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, int):
+        return "int"
+    if isinstance(value, float):
+        return "float"
+    if isinstance(value, str):
+        return "str"
+    if isinstance(value, Mapping):
+        return "object"
+    if isinstance(value, (list, tuple)):
+        return "array"
+    return type(value).__name__
+
+
+def _hash64(encoded: str) -> int:
+    return int.from_bytes(hashlib.blake2b(encoded.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class HyperLogLog:
+    """
+    HyperLogLog distinct counter over 64-bit hashes.
+
+    Standard error is about 1.04 / sqrt(2**precision) (~1.6% at precision 12).
+    """
+
+    def __init__(self, precision: int = 12) -> None:
+        if not 4 <= precision <= 18:
+            raise ValueError(f"precision must be in [4, 18], got {precision}")
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+
+    def estimate(self) -> float:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / sum(2.0**-r for r in self.registers)
+        zeros = self.registers.count(0)
+        if raw <= 2.5 * m and zeros:
+            return m * math.log(m / zeros)  # linear counting for small cardinalities
+        return raw
+
+    def merge(self, other: HyperLogLog) -> None:
+        if other.precision != self.precision:
+            raise ValueError("cannot merge HyperLogLog sketches with different precision")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+
+
+class CountMinSketch:
+    """Count-min sketch (depth rows of width counters); estimates never undercount."""
+
+    def __init__(self, width: int = 1024, depth: int = 4) -> None:
+        if width <= 0 or depth <= 0:
+            raise ValueError("width and depth must be > 0")
+        self.width = width
+        self.depth = depth
+        self.table = array("Q", bytes(8 * width * depth))
+
+    @staticmethod
+    def cells(h: int, width: int, depth: int) -> list[int]:
+        """Table indexes of hash h, one per row."""
+        # Kirsch-Mitzenmacher double hashing over the two 32-bit hash halves.
+        h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+        return [row * width + (h1 + row * h2) % width for row in range(depth)]
+
+    def _cells(self, h: int) -> list[int]:
+        return self.cells(h, self.width, self.depth)
+
+    def estimate_hash(self, h: int) -> int:
+        table = self.table
+        return min(table[cell] for cell in self._cells(h))
+
+    def merge(self, other: CountMinSketch) -> None:
+        if (other.width, other.depth) != (self.width, self.depth):
+            raise ValueError("cannot merge count-min sketches with different dimensions")
+        self.table = array("Q", map(int.__add__, self.table, other.table))
+
+
+@dataclass
+class KeyProfile:
+    """Sketch state for one external key."""
+
+    occurrences: int = 0
+    types: dict[str, int] = field(default_factory=dict)
+    hll: HyperLogLog = field(default_factory=HyperLogLog)
+    cms: CountMinSketch = field(default_factory=CountMinSketch)
+    top: dict[str, int] = field(default_factory=dict)  # canonical value JSON -> estimate
+    top_min: int = 0  # smallest estimate in top
+
+
+@dataclass
+class KeyUsage:
+    """One row of ExternalKeyProfiler.report()."""
+
+    key: str
+    kind: str  # "context", "trace" or "invalid" (matches neither key format)
+    occurrences: int
+    presence: float  # fraction of profiled packets containing the key
+    distinct_estimate: int
+    types: dict[str, int]
+    top_values: list[tuple[str, int]]  # (canonical JSON, estimated count), most frequent first
+    registered: bool
+    flags: list[str] = field(default_factory=list)
+
+
+class ExternalKeyProfiler:
+    """
+    Mergeable key usage profile of one packet section (default `external`).
+
+    Args:
+        precision: HyperLogLog precision (2**precision one-byte registers per key).
+        cms_width / cms_depth: Count-min sketch dimensions per key.
+        top_k: Most frequent values tracked per key.
+        max_keys: Keys beyond this are counted in `dropped_keys` only (guards
+            against free-form key explosions and bounds memory at ~36 KiB per
+            key with the default sketch sizes).
+        section: Packet field to profile.
+    """
+
+    def __init__(
+        self,
+        *,
+        precision: int = 12,
+        cms_width: int = 1024,
+        cms_depth: int = 4,
+        top_k: int = 8,
+        max_keys: int = 1_000,
+        section: str = "external",
+    ) -> None:
+        HyperLogLog(precision)  # validate arguments early
+        CountMinSketch(cms_width, cms_depth)
+        self.precision = precision
+        self.cms_width = cms_width
+        self.cms_depth = cms_depth
+        self.top_k = top_k
+        self.max_keys = max_keys
+        self.section = section
+        self.packets = 0
+        self.dropped_keys = 0
+        self.keys: dict[str, KeyProfile] = {}
+        self._hashes: dict[tuple[type, Any], tuple[str, int]] = {}  # scalar value cache
+
+    def _cms_cells(self, h: int) -> list[int]:
+        return CountMinSketch.cells(h, self.cms_width, self.cms_depth)
+
+    def _new_profile(self) -> KeyProfile:
+        return KeyProfile(
+            hll=HyperLogLog(self.precision), cms=CountMinSketch(self.cms_width, self.cms_depth)
+        )
+
+    def _encode(self, value: Any) -> tuple[str, int, str, int, int, list[int]]:
+        # (canonical JSON, hash, type name, HLL register, HLL rank, CMS cells); scalars cached.
+        # add() updates the sketches inline from these instead of per-sketch add methods.
+        scalar = isinstance(value, (str, int, float)) or value is None
+        if scalar:
+            cache_key = (type(value), value)
+            cached = self._hashes.get(cache_key)
+            if cached is not None:
+                return cached
+        encoded = _canonical(value)
+        h = _hash64(encoded)
+        q = 64 - self.precision
+        rank = q - (h & ((1 << q) - 1)).bit_length() + 1  # leading zeros of the low q bits, + 1
+        cells = self._cms_cells(h)
+        entry = (encoded, h, _type_name(value), h >> q, rank, cells)
+        if scalar:
+            if len(self._hashes) >= 65_536:
+                self._hashes.clear()
+            self._hashes[cache_key] = entry
+        return entry
+
+    def add(self, packet: PacketLike) -> None:
+        """Profile one packet (PacketV2 or packet dict)."""
+        section = (
+            packet.get(self.section)
+            if isinstance(packet, Mapping)
+            else getattr(packet, self.section, None)
+        )
+        self.packets += 1
+        if not isinstance(section, Mapping):
+            return
+        keys = self.keys
+        encode = self._encode
+        for key, value in section.items():
+            profile = keys.get(key)
+            if profile is None:
+                if len(keys) >= self.max_keys:
+                    self.dropped_keys += 1
+                    continue
+                profile = keys[key] = self._new_profile()
+            profile.occurrences += 1
+            encoded, _, type_name, idx, rank, cells = encode(value)
+            types = profile.types
+            types[type_name] = types.get(type_name, 0) + 1
+            registers = profile.hll.registers
+            if rank > registers[idx]:
+                registers[idx] = rank
+            table = profile.cms.table
+            est = None
+            for cell in cells:
+                n = table[cell] + 1
+                table[cell] = n
+                if est is None or n < est:
+                    est = n
+            top = profile.top
+            if encoded in top or len(top) < self.top_k:
+                top[encoded] = est
+            elif est > profile.top_min:
+                low = min(top, key=top.__getitem__)
+                del top[low]
+                top[encoded] = est
+            else:
+                continue
+            profile.top_min = min(top.values())
+
+    def add_all(self, packets: Iterable[PacketLike]) -> int:
+        """Profile packets; return how many were added."""
+        n = 0
+        for packet in packets:
+            self.add(packet)
+            n += 1
+        return n
+
+    def value_count(self, key: str, value: Any) -> int:
+        """Estimated occurrences of value under key (never an undercount)."""
+        profile = self.keys.get(key)
+        if profile is None:
+            return 0
+        return profile.cms.estimate_hash(self._encode(value)[1])
+
+    def merge(self, other: ExternalKeyProfiler) -> None:
+        """Fold another shard's state into this one (same sketch parameters required)."""
+        params = ("precision", "cms_width", "cms_depth", "section")
+        if any(getattr(self, p) != getattr(other, p) for p in params):
+            raise ValueError(f"cannot merge profilers with different {'/'.join(params)}")
+        self.packets += other.packets
+        self.dropped_keys += other.dropped_keys
+        for key, theirs in other.keys.items():
+            mine = self.keys.get(key)
+            if mine is None:
+                if len(self.keys) >= self.max_keys:
+                    self.dropped_keys += theirs.occurrences
+                    continue
+                mine = self.keys[key] = self._new_profile()
+            mine.occurrences += theirs.occurrences
+            for t, n in theirs.types.items():
+                mine.types[t] = mine.types.get(t, 0) + n
+            mine.hll.merge(theirs.hll)
+            mine.cms.merge(theirs.cms)
+            # Re-estimate the union of both candidate lists against the merged sketch.
+            candidates = {v: mine.cms.estimate_hash(_hash64(v)) for v in {**mine.top, **theirs.top}}
+            best = sorted(candidates.items(), key=lambda kv: (-kv[1], kv[0]))[: self.top_k]
+            mine.top = dict(best)
+            mine.top_min = min(mine.top.values(), default=0)
+
+    def report(
+        self,
+        *,
+        cardinality_limit: int = 10_000,
+        expected_unbounded: Iterable[str] = DEFAULT_EXPECTED_UNBOUNDED,
+    ) -> list[KeyUsage]:
+        """Per-key usage rows, most frequent key first."""
+        registered = registry_snapshot().keys
+        context_keys = frozenset(CONTEXT_KEYS)
+        unbounded = frozenset(expected_unbounded)
+        rows = []
+        for key, profile in self.keys.items():
+            if is_valid_trace_key(key):
+                kind, is_registered = "trace", key in registered
+            elif key in context_keys:
+                kind, is_registered = "context", True
+            elif isinstance(key, str) and is_valid_context_key(key):
+                kind, is_registered = "context", False
+            else:
+                kind, is_registered = "invalid", False
+            distinct = round(profile.hll.estimate())
+            flags = []
+            if kind == "trace" and not is_registered:
+                if key.split(".", 1)[0] in RESERVED_NAMESPACES:
+                    flags.append("unregistered_reserved")
+            elif kind == "context" and not is_registered:
+                flags.append("undocumented_context")
+            if distinct > cardinality_limit and key not in unbounded:
+                flags.append("exploding_cardinality")
+            rows.append(
+                KeyUsage(
+                    key=key,
+                    kind=kind,
+                    occurrences=profile.occurrences,
+                    presence=profile.occurrences / self.packets if self.packets else 0.0,
+                    distinct_estimate=distinct,
+                    types=dict(profile.types),
+                    top_values=sorted(profile.top.items(), key=lambda kv: (-kv[1], kv[0])),
+                    registered=is_registered,
+                    flags=flags,
+                )
+            )
+        rows.sort(key=lambda r: (-r.occurrences, r.key))
+        return rows
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serializable state (sketch tables hex-encoded)."""
+        return {
+            "format": STATE_FORMAT,
+            "precision": self.precision,
+            "cms_width": self.cms_width,
+            "cms_depth": self.cms_depth,
+            "top_k": self.top_k,
+            "max_keys": self.max_keys,
+            "section": self.section,
+            "packets": self.packets,
+            "dropped_keys": self.dropped_keys,
+            "keys": {
+                key: {
+                    "occurrences": p.occurrences,
+                    "types": p.types,
+                    "hll": p.hll.registers.hex(),
+                    "cms": p.cms.table.tobytes().hex(),
+                    "top": p.top,
+                }
+                for key, p in self.keys.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> ExternalKeyProfiler:
+        """
+        Restore state written by to_dict().
+
+        Raises:
+            ValueError: If the state format is unknown or a sketch has the wrong size.
+        """
+        if data.get("format") != STATE_FORMAT:
+            raise ValueError(f"unsupported key profile state format {data.get('format')!r}")
+        profiler = cls(
+            precision=data["precision"],
+            cms_width=data["cms_width"],
+            cms_depth=data["cms_depth"],
+            top_k=data["top_k"],
+            max_keys=data["max_keys"],
+            section=data["section"],
+        )
+        profiler.packets = data["packets"]
+        profiler.dropped_keys = data["dropped_keys"]
+        for key, state in data["keys"].items():
+            profile = profiler._new_profile()
+            registers = bytearray.fromhex(state["hll"])
+            table = array("Q", bytes.fromhex(state["cms"]))
+            if len(registers) != len(profile.hll.registers) or len(table) != len(profile.cms.table):
+                raise ValueError(f"sketch size mismatch for key {key!r}")
+            profile.hll.registers = registers
+            profile.cms.table = table
+            profile.occurrences = state["occurrences"]
+            profile.types = dict(state["types"])
+            profile.top = dict(state["top"])
+            profile.top_min = min(profile.top.values(), default=0)
+            profiler.keys[key] = profile
+        return profiler
+
+    def save(self, path: str | Path) -> None:
+        Path(path).write_text(json.dumps(self.to_dict()), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: str | Path) -> ExternalKeyProfiler:
+        return cls.from_dict(json.loads(Path(path).read_text(encoding="utf-8")))
+
+
+def profile_traces(
+    sources: Iterable[str | Path], *, prefix: str = "trace", **kwargs: Any
+) -> ExternalKeyProfiler:
+    """Profile JSONL traces and segment directories (kwargs go to ExternalKeyProfiler)."""
+    profiler = ExternalKeyProfiler(**kwargs)
+    for path in resolve_sources(sources, prefix):
+        profiler.add_all(iter_packet_dicts(path))
+    return profiler
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m decision_schema.key_profile",
+        description="Profile PacketV2.external key usage and cardinality.",
+    )
+    parser.add_argument("sources", nargs="*", help="JSONL traces or segment directories")
+    parser.add_argument("--prefix", default="trace", help="Segment file prefix")
+    parser.add_argument("--load-state", nargs="*", default=[], help="Shard states to merge")
+    parser.add_argument("--save-state", help="Write the (merged) state here")
+    parser.add_argument("--cardinality-limit", type=int, default=10_000)
+    parser.add_argument("--max-keys", type=int, default=1_000, help="Keys profiled per shard")
+    args = parser.parse_args(argv)
+
+    profiler = profile_traces(args.sources, prefix=args.prefix, max_keys=args.max_keys)
+    for path in args.load_state:
+        profiler.merge(ExternalKeyProfiler.load(path))
+    if args.save_state:
+        profiler.save(args.save_state)
+    rows = profiler.report(cardinality_limit=args.cardinality_limit)
+    for row in rows:
+        print(json.dumps(row.__dict__, ensure_ascii=False))
+    return 1 if any(row.flags for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,6 +6,7 @@
 from dataclasses import asdict, dataclass, field
 from typing import Any
 
+from decision_schema import profiling as _profiling
 from decision_schema.version import __version__
 
 
@@ -37,6 +38,10 @@ class PacketV2:
         Returns:
             Dictionary representation suitable for JSON serialization.
         """
+        active = _profiling.hook
+        if active is not None:
+            size = _profiling.packet_payload_size(self)
+            return _profiling.timed(active, "PacketV2.to_dict", size, asdict, self)
         return asdict(self)
 
     @classmethod
@@ -50,6 +55,14 @@ class PacketV2:
         Returns:
             PacketV2 instance.
         """
+        active = _profiling.hook
+        if active is not None:
+            size = _profiling.packet_payload_size(data)
+            return _profiling.timed(active, "PacketV2.from_dict", size, cls._from_dict, data)
+        return cls._from_dict(data)
+
+    @classmethod
+    def _from_dict(cls, data: dict[str, Any]) -> "PacketV2":
         # Extract schema_version if present, otherwise use current version
         schema_version = data.pop("schema_version", __version__)
         return cls(schema_version=schema_version, **data)
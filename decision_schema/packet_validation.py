@@ -0,0 +1,287 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Whole-packet validation (INV-P1).
+
+Checks every PacketV2 field, not only `external`:
+
+- required fields present; `run_id` non-empty str; `step` int >= 0
+- `input` / `external` / `mdm` / `final_action` are mappings; `mismatch` is None
+  or a mapping with list `flags` / `reason_codes`
+- `latency_ms` a finite, non-negative number
+- `schema_version` compatible with the configured major/minor range
+- `mdm["confidence"]` (if present) a number in [0.0, 1.0]
+- `final_action["action"]` a member of `Action`
+- `external` key hygiene (INV-T1, see trace_registry.validate_external_dict)
+
+A `PacketValidator` compiles its per-field checks once; validating a packet is a
+loop over that list. `fail_fast=True` stops at the first error (ingest gates);
+the default collects every error (audits).
+
+Error codes: "INV-P1:<check>[:<detail>]" plus the INV-T1 codes for `external`.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from decision_schema.compat import is_compatible
+from decision_schema.packet_v2 import PacketV2
+from decision_schema.trace_registry import registry_snapshot, validate_external_dict
+from decision_schema.types import Action
+
+_ACTIONS = frozenset(a.value for a in Action)
+_MISSING = object()
+_KEY_CACHE_SIZE = 4096
+
+# A check takes the field value and returns error codes (empty: pass).
+Check = Callable[[Any], list[str]]
+_OK: list[str] = []
+
+
+def _check_run_id(value: Any) -> list[str]:
+    if not isinstance(value, str):
+        return ["INV-P1:run_id_not_str"]
+    return _OK if value else ["INV-P1:run_id_empty"]
+
+
+def _check_step(value: Any) -> list[str]:
+    if type(value) is int:
+        return _OK if value >= 0 else ["INV-P1:step_negative"]
+    return ["INV-P1:step_not_int"]
+
+
+def _check_latency(value: Any) -> list[str]:
+    if type(value) is int:
+        return _OK if value >= 0 else ["INV-P1:latency_negative"]
+    if type(value) is float:
+        if not math.isfinite(value):
+            return ["INV-P1:latency_not_finite"]
+        return _OK if value >= 0 else ["INV-P1:latency_negative"]
+    return ["INV-P1:latency_not_number"]
+
+
+def _mapping_check(name: str) -> Check:
+    code = [f"INV-P1:{name}_not_mapping"]
+
+    def check(value: Any) -> list[str]:
+        return _OK if type(value) is dict or isinstance(value, Mapping) else code
+
+    return check
+
+
+def _check_mdm(value: Any) -> list[str]:
+    if type(value) is not dict and not isinstance(value, Mapping):
+        return ["INV-P1:mdm_not_mapping"]
+    confidence = value.get("confidence", _MISSING)
+    if confidence is _MISSING:
+        return _OK
+    if type(confidence) is bool or not isinstance(confidence, (int, float)):
+        return ["INV-P1:confidence_not_number"]
+    return _OK if 0.0 <= confidence <= 1.0 else ["INV-P1:confidence_out_of_range"]
+
+
+def _check_final_action(value: Any) -> list[str]:
+    if type(value) is not dict and not isinstance(value, Mapping):
+        return ["INV-P1:final_action_not_mapping"]
+    action = value.get("action", _MISSING)
+    if action is _MISSING:
+        return ["INV-P1:action_missing"]
+    # str check first: an unhashable value (e.g. a list) must not reach the set lookup.
+    if isinstance(action, Action) or (isinstance(action, str) and action in _ACTIONS):
+        return _OK
+    return [f"INV-P1:unknown_action:{action}"]
+
+
+def _check_mismatch(value: Any) -> list[str]:
+    if value is None:
+        return _OK
+    if not isinstance(value, Mapping):
+        return ["INV-P1:mismatch_not_mapping"]
+    errors = []
+    for key in ("flags", "reason_codes"):
+        if not isinstance(value.get(key, []), list):
+            errors.append(f"INV-P1:mismatch_{key}_not_list")
+    return errors
+
+
+class PacketValidator:
+    """
+    Compiled whole-packet validator.
+
+    Args:
+        expected_major / min_minor / max_minor: Accepted schema_version range
+            (see compat.is_compatible); schema_version may be absent.
+        external_mode: Key format mode for external ("context", "trace", "both").
+        require_registry_for_prefixes: Trace namespaces whose keys must be registered.
+        check_external: Set False to skip INV-T1 checks on external.
+    """
+
+    def __init__(
+        self,
+        *,
+        expected_major: int = 0,
+        min_minor: int | None = None,
+        max_minor: int | None = None,
+        external_mode: str = "both",
+        require_registry_for_prefixes: Iterable[str] | None = None,
+        check_external: bool = True,
+    ) -> None:
+        versions: dict[Any, list[str]] = {}  # schema_version -> result (few distinct values)
+
+        def check_version(value: Any) -> list[str]:
+            if not isinstance(value, str):  # may be unhashable; never cached
+                return [f"INV-P1:schema_version_incompatible:{value}"]
+            cached = versions.get(value)
+            if cached is None:
+                ok = is_compatible(value, expected_major, min_minor, max_minor)
+                cached = _OK if ok else [f"INV-P1:schema_version_incompatible:{value}"]
+                if len(versions) < 64:
+                    versions[value] = cached
+            return cached
+
+        prefixes = frozenset(require_registry_for_prefixes or ())
+        # Per-key INV-T1 results; external key sets are small and repeat across packets.
+        # Cleared when a runtime registration publishes a new registry snapshot.
+        key_results: dict[Any, list[str]] = {}
+        seen_snapshot = [registry_snapshot()]
+
+        def check_external_(value: Any) -> list[str]:
+            if type(value) is not dict and not isinstance(value, Mapping):
+                return ["INV-P1:external_not_mapping"]
+            if not check_external:
+                return _OK
+            snapshot = registry_snapshot()
+            if snapshot is not seen_snapshot[0]:
+                key_results.clear()
+                seen_snapshot[0] = snapshot
+            errors = _OK
+            for key in value:
+                found = key_results.get(key)
+                if found is None:
+                    found = validate_external_dict(
+                        {key: None}, require_registry_for_prefixes=prefixes, mode=external_mode
+                    )
+                    if len(key_results) < _KEY_CACHE_SIZE:
+                        key_results[key] = found
+                if found:
+                    errors = errors + found
+            return errors
+
+        # (field, required, check); order fixes the order of reported errors.
+        self._checks: list[tuple[str, bool, Check]] = [
+            ("run_id", True, _check_run_id),
+            ("step", True, _check_step),
+            ("input", True, _mapping_check("input")),
+            ("external", True, check_external_),
+            ("mdm", True, _check_mdm),
+            ("final_action", True, _check_final_action),
+            ("latency_ms", True, _check_latency),
+            ("mismatch", False, _check_mismatch),
+            ("schema_version", False, check_version),
+        ]
+
+    def validate(self, packet: PacketV2 | Mapping[str, Any], fail_fast: bool = False) -> list[str]:
+        """
+        Validate one packet (PacketV2 or packet dict).
+
+        Returns:
+            Error codes (empty list means PASS); at most one with fail_fast.
+        """
+        if type(packet) is dict:
+            data: Mapping[str, Any] = packet
+        elif isinstance(packet, PacketV2):
+            data = packet.__dict__
+        elif isinstance(packet, Mapping):
+            data = packet
+        else:
+            return ["INV-P1:packet_not_mapping"]
+        errors: list[str] = []
+        for name, required, check in self._checks:
+            value = data.get(name, _MISSING)
+            if value is _MISSING:
+                if required:
+                    errors.append(f"INV-P1:missing_field:{name}")
+                    if fail_fast:
+                        return errors
+                continue
+            found = check(value)
+            if found:
+                if fail_fast:
+                    return found[:1]
+                errors.extend(found)
+        return errors
+
+    __call__ = validate
+
+
+@dataclass
+class ValidationReport:
+    """Result of validate_packets."""
+
+    checked: int = 0
+    invalid: int = 0
+    stopped_early: bool = False  # fail_fast hit an invalid packet
+    # (index, run_id, step, codes) per invalid packet (capped by max_errors)
+    errors: list[tuple[int, Any, Any, list[str]]] = field(default_factory=list)
+    code_counts: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return self.invalid == 0
+
+
+_DEFAULT = PacketValidator()
+
+
+def validate_packet(
+    packet: PacketV2 | Mapping[str, Any],
+    *,
+    fail_fast: bool = False,
+    validator: PacketValidator | None = None,
+) -> list[str]:
+    """Validate one packet with the default (or given) validator; see PacketValidator.validate."""
+    return (validator or _DEFAULT).validate(packet, fail_fast)
+
+
+def validate_packets(
+    packets: Iterable[PacketV2 | Mapping[str, Any]],
+    *,
+    fail_fast: bool = False,
+    validator: PacketValidator | None = None,
+    max_errors: int = 1000,
+) -> ValidationReport:
+    """
+    Validate a packet stream.
+
+    Args:
+        packets: PacketV2 objects or packet dicts (e.g. trace_io.iter_packet_dicts).
+        fail_fast: Stop at the first invalid packet, keeping only its first error.
+        validator: Compiled validator (default: PacketValidator()).
+        max_errors: Keep at most this many per-packet entries in report.errors
+            (code_counts always covers every packet).
+    """
+    validate = (validator or _DEFAULT).validate
+    report = ValidationReport()
+    counts = report.code_counts
+    for index, packet in enumerate(packets):
+        report.checked += 1
+        errors = validate(packet, fail_fast)
+        if not errors:
+            continue
+        report.invalid += 1
+        for code in errors:
+            counts[code] = counts.get(code, 0) + 1
+        if len(report.errors) < max_errors:
+            if isinstance(packet, Mapping):
+                run_id, step = packet.get("run_id"), packet.get("step")
+            else:
+                run_id, step = getattr(packet, "run_id", None), getattr(packet, "step", None)
+            report.errors.append((index, run_id, step, errors))
+        if fail_fast:
+            report.stopped_early = True
+            break
+    return report
@@ -0,0 +1,200 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Lazy view over one PacketV2 binary frame.
+
+`encode_frame` writes an 80-byte header of per-field `(offset, length)` spans
+followed by each field's compact JSON. `PacketV2View` references that buffer
+and locates fields in O(1) without scanning. Scalar fields (`run_id`, `step`,
+`latency_ms`, `schema_version`) are decoded eagerly; dict fields (`input`,
+`external`, `mdm`, `final_action`, `mismatch`) only on first access, then
+cached.
+
+Only binary frames are accepted: for JSON records (trace lines), CPython's C
+decoder is faster than locating fields by scanning the text, so read them with
+`json.loads` / `trace_io.iter_packet_dicts`.
+
+Usage:
+    producer.publish_bytes(encode_frame(packet))
+    for _, payload in consumer.poll_bytes():
+        view = PacketV2View(payload)
+        if view.step > 100 and view.final_action.get("action") == "STOP":
+            packet = view.to_packet()   # full PacketV2 only when needed
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+from types import MappingProxyType
+from typing import Any
+
+from decision_schema.packet_v2 import PacketV2
+from decision_schema.trace_io import PacketLike, packet_to_dict
+
+Buffer = bytes | bytearray | memoryview
+
+SCALAR_FIELDS = ("run_id", "step", "latency_ms", "schema_version")
+
+# Binary frame: magic, field count, then (offset, length) per FRAME_FIELDS entry.
+FRAME_MAGIC = b"PV2F"
+FRAME_FIELDS = (
+    "run_id",
+    "step",
+    "input",
+    "external",
+    "mdm",
+    "final_action",
+    "latency_ms",
+    "mismatch",
+    "schema_version",
+)
+_FRAME_HEAD = struct.Struct("<4sH2x")
+_FRAME_SPANS = struct.Struct("<" + "II" * len(FRAME_FIELDS))
+_FRAME_HEADER_SIZE = _FRAME_HEAD.size + _FRAME_SPANS.size
+_ABSENT = 0xFFFFFFFF
+
+_json = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+
+def _decode_scalar(raw: bytes) -> Any:
+    # Fast paths for the common scalar shapes; json.loads per call costs ~2us.
+    if raw[:1] == b'"' and b"\\" not in raw:
+        return raw[1:-1].decode()
+    if raw == b"null":
+        return None
+    if raw.isdigit() or (raw[:1] == b"-" and raw[1:].isdigit()):
+        return int(raw)
+    return json.loads(raw)
+
+
+def encode_frame(packet: PacketLike) -> bytes:
+    """Encode a packet as a binary frame (field offset header + per-field JSON)."""
+    data = packet_to_dict(packet)
+    spans: list[int] = []
+    parts: list[bytes] = []
+    offset = _FRAME_HEADER_SIZE
+    for name in FRAME_FIELDS:
+        if name not in data:
+            spans += (_ABSENT, 0)
+            continue
+        part = _json(data[name]).encode("utf-8")
+        spans += (offset, len(part))
+        parts.append(part)
+        offset += len(part)
+    head = _FRAME_HEAD.pack(FRAME_MAGIC, len(FRAME_FIELDS)) + _FRAME_SPANS.pack(*spans)
+    return head + b"".join(parts)
+
+
+def _frame_spans(buf: Buffer) -> dict[str, tuple[int, int]]:
+    if len(buf) < _FRAME_HEADER_SIZE:
+        raise ValueError("truncated packet frame header")
+    magic, count = _FRAME_HEAD.unpack_from(buf, 0)
+    if magic != FRAME_MAGIC:
+        raise ValueError("not a packet frame (bad magic)")
+    if count != len(FRAME_FIELDS):
+        raise ValueError(f"unsupported packet frame field count {count}")
+    raw = _FRAME_SPANS.unpack_from(buf, _FRAME_HEAD.size)
+    spans: dict[str, tuple[int, int]] = {}
+    for i, name in enumerate(FRAME_FIELDS):
+        offset, length = raw[2 * i], raw[2 * i + 1]
+        if offset == _ABSENT:
+            continue
+        if offset + length > len(buf):
+            raise ValueError(f"packet frame field {name!r} out of bounds")
+        spans[name] = (offset, offset + length)
+    return spans
+
+
+class PacketV2View:
+    """
+    Lazily decoded PacketV2 over a binary frame (see encode_frame).
+
+    The view keeps a reference to the buffer (keep it alive and unchanged while
+    the view is in use); a field's bytes are copied out only when it is decoded.
+    Attributes cannot be assigned and top-level dict fields are returned as
+    read-only mappings, but values nested inside them are the decoded (cached)
+    dicts and lists: use to_dict() / to_packet() for a copy to modify.
+
+    Raises:
+        ValueError: If the buffer is not a packet frame or lacks run_id/step.
+    """
+
+    __slots__ = ("_buf", "_spans", "_cache", *SCALAR_FIELDS)
+
+    run_id: str
+    step: int
+    latency_ms: int
+    schema_version: str | None
+
+    def __init__(self, data: Buffer) -> None:
+        buf = data
+        if isinstance(buf, memoryview) and buf.format != "B":
+            buf = buf.cast("B")
+        spans = _frame_spans(buf)
+        setattr_ = object.__setattr__
+        setattr_(self, "_buf", buf)
+        setattr_(self, "_spans", spans)
+        setattr_(self, "_cache", {})
+        for name in SCALAR_FIELDS:
+            span = spans.get(name)
+            setattr_(
+                self, name, None if span is None else _decode_scalar(bytes(buf[span[0] : span[1]]))
+            )
+        if self.run_id is None or self.step is None:
+            raise ValueError("packet record must contain run_id and step")
+
+    def raw(self, name: str) -> bytes | None:
+        """Undecoded JSON bytes of a top-level field (None if absent)."""
+        span = self._spans.get(name)
+        return None if span is None else bytes(self._buf[span[0] : span[1]])
+
+    def _lazy(self, name: str) -> Any:
+        cache = self._cache
+        if name in cache:
+            return cache[name]
+        raw = self.raw(name)
+        value = None if raw is None else json.loads(raw)
+        if isinstance(value, dict):
+            value = MappingProxyType(value)
+        cache[name] = value
+        return value
+
+    @property
+    def input(self) -> MappingProxyType:
+        return self._lazy("input")
+
+    @property
+    def external(self) -> MappingProxyType:
+        return self._lazy("external")
+
+    @property
+    def mdm(self) -> MappingProxyType:
+        return self._lazy("mdm")
+
+    @property
+    def final_action(self) -> MappingProxyType:
+        return self._lazy("final_action")
+
+    @property
+    def mismatch(self) -> MappingProxyType | None:
+        return self._lazy("mismatch")
+
+    def decoded_fields(self) -> frozenset[str]:
+        """Lazy fields decoded so far."""
+        return frozenset(self._cache)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Fully decoded, independent packet dict."""
+        buf = self._buf
+        return {name: json.loads(bytes(buf[a:b])) for name, (a, b) in self._spans.items()}
+
+    def to_packet(self) -> PacketV2:
+        """Materialize an independent PacketV2."""
+        return PacketV2.from_dict(self.to_dict())
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("PacketV2View is read-only; use to_packet()")
+
+    def __repr__(self) -> str:
+        return f"PacketV2View(run_id={self.run_id!r}, step={self.step!r})"
@@ -0,0 +1,194 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Proposal / FinalDecision `params` key rules (PARAMETER_INDEX).
+
+Domain-specific params keys must be namespaced as `domain:key`; keys documented
+in PARAMETER_INDEX (`PARAMS_INDEX_KEYS`) may be used bare. The prefixes `x_`,
+`example_` and `_private_` are reserved (on the key or its domain).
+
+A `ParamsKeyValidator` caches the verdict per key (bounded), so checking a
+params dict whose keys were seen before costs one dict lookup per key.
+
+Checks are opt-in at construction time:
+
+    enable_params_key_checks()            # Proposal/FinalDecision raise ValueError
+    enable_params_key_checks(on_error="warn")
+    disable_params_key_checks()
+
+When disabled (the default) constructors pay a single `active is None` branch.
+For existing traces use `audit_packet_params`.
+"""
+
+from __future__ import annotations
+
+import re
+import warnings
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+# Bare keys documented in PARAMETER_INDEX.md ("Proposal.params").
+PARAMS_INDEX_KEYS = frozenset({"value"})
+RESERVED_PARAMS_PREFIXES = ("x_", "example_", "_private_")
+
+# domain:key — lowercase domain, non-empty key without whitespace or further colons.
+PARAMS_KEY_RE = re.compile(r"^[a-z0-9_]+:[^\s:]+$")
+
+_UNSEEN = object()
+
+# Active params check; read directly by Proposal/FinalDecision (None = disabled).
+active: Callable[[Mapping[str, Any]], None] | None = None
+
+
+class ParamsKeyValidator:
+    """
+    Cached params key checks.
+
+    Args:
+        documented: Bare keys that need no namespace.
+        allow_reserved: Reserved prefixes to accept (e.g. ("example_",) in examples).
+        cache_size: Maximum cached verdicts; further unseen keys are checked uncached.
+    """
+
+    def __init__(
+        self,
+        *,
+        documented: Iterable[str] = PARAMS_INDEX_KEYS,
+        allow_reserved: Iterable[str] = (),
+        cache_size: int = 4096,
+    ) -> None:
+        self.documented = frozenset(documented)
+        allowed = set(allow_reserved)
+        self.reserved = tuple(p for p in RESERVED_PARAMS_PREFIXES if p not in allowed)
+        self.cache_size = cache_size
+        self._verdicts: dict[Any, str | None] = {}
+
+    def _check(self, key: Any) -> str | None:
+        if not isinstance(key, str):
+            return "INV-PARAM-KEY:key_not_str"
+        if self.reserved and key.startswith(self.reserved):
+            return f"INV-PARAM-KEY:reserved_prefix:{key}"
+        if key in self.documented:
+            return None
+        if not PARAMS_KEY_RE.match(key):
+            return f"INV-PARAM-KEY:not_namespaced:{key}"
+        return None
+
+    def check_key(self, key: Any) -> str | None:
+        """Error code for key, or None if it is acceptable."""
+        verdict = self._verdicts.get(key, _UNSEEN)
+        if verdict is _UNSEEN:
+            verdict = self._check(key)
+            if len(self._verdicts) < self.cache_size:
+                self._verdicts[key] = verdict
+        return verdict
+
+    def validate(self, params: Mapping[str, Any] | None) -> list[str]:
+        """Error codes for a params dict (empty list means PASS)."""
+        if not params:
+            return []
+        verdicts = self._verdicts
+        errors: list[str] = []
+        for key in params:
+            verdict = verdicts.get(key, _UNSEEN)
+            if verdict is _UNSEEN:
+                verdict = self.check_key(key)
+            if verdict is not None:
+                errors.append(verdict)
+        return errors
+
+
+PARAMS_KEYS = ParamsKeyValidator()
+
+
+def validate_params(
+    params: Mapping[str, Any] | None, validator: ParamsKeyValidator | None = None
+) -> list[str]:
+    """Validate params keys with the default (or given) validator."""
+    return (validator or PARAMS_KEYS).validate(params)
+
+
+def enable_params_key_checks(
+    validator: ParamsKeyValidator | None = None, *, on_error: str = "raise"
+) -> None:
+    """
+    Check params keys whenever a Proposal or FinalDecision is constructed.
+
+    Args:
+        validator: Validator to use (default: PARAMS_KEYS).
+        on_error: "raise" (ValueError) or "warn" (UserWarning).
+    """
+    global active
+    if on_error not in ("raise", "warn"):
+        raise ValueError(f"on_error must be 'raise' or 'warn', got {on_error!r}")
+    validate = (validator or PARAMS_KEYS).validate
+
+    def check(params: Mapping[str, Any]) -> None:
+        errors = validate(params)
+        if not errors:
+            return
+        message = f"invalid params keys: {', '.join(errors)}"
+        if on_error == "raise":
+            raise ValueError(message)
+        warnings.warn(message, stacklevel=4)
+
+    active = check
+
+
+def disable_params_key_checks() -> None:
+    global active
+    active = None
+
+
+@dataclass
+class ParamsAudit:
+    """Result of audit_packet_params."""
+
+    packets: int = 0
+    params_dicts: int = 0
+    invalid: int = 0
+    code_counts: dict[str, int] = field(default_factory=dict)
+    # (run_id, step, section, codes) for the first invalid params dicts (capped)
+    examples: list[tuple[Any, Any, str, list[str]]] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return self.invalid == 0
+
+
+def audit_packet_params(
+    packets: Iterable[Any],
+    *,
+    validator: ParamsKeyValidator | None = None,
+    max_examples: int = 100,
+) -> ParamsAudit:
+    """
+    Check `mdm["params"]` and `final_action["params"]` of recorded packets.
+
+    Args:
+        packets: PacketV2 objects or packet dicts.
+        validator: Validator to use (default: PARAMS_KEYS).
+        max_examples: Keep at most this many examples (counts cover everything).
+    """
+    validate = (validator or PARAMS_KEYS).validate
+    audit = ParamsAudit()
+    counts = audit.code_counts
+    for packet in packets:
+        get = packet.get if isinstance(packet, Mapping) else lambda k, p=packet: getattr(p, k, None)
+        audit.packets += 1
+        for section in ("mdm", "final_action"):
+            value = get(section)
+            params = value.get("params") if isinstance(value, Mapping) else None
+            if not isinstance(params, Mapping):
+                continue
+            audit.params_dicts += 1
+            errors = validate(params)
+            if not errors:
+                continue
+            audit.invalid += 1
+            for code in errors:
+                counts[code] = counts.get(code, 0) + 1
+            if len(audit.examples) < max_examples:
+                audit.examples.append((get("run_id"), get("step"), section, errors))
+    return audit
@@ -0,0 +1,172 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Opt-in profiling hooks for contract operations.
+
+Instrumented operations report `(op, elapsed_ns, size)` to the active hook:
+
+- `PacketV2.to_dict`, `PacketV2.from_dict` (size: items in input/external/mdm/final_action)
+- `validate_external_dict` (size: number of keys)
+- type construction `Proposal`, `FinalDecision`, `MismatchInfo`, `PacketV2`
+  (size: reasons + params items, flags + reason codes, or packet items)
+
+When profiling is off, the function sites cost a single `hook is None` branch and
+constructors are not wrapped at all (originals are restored on disable).
+
+Usage:
+    collector = enable_profiling()
+    ...
+    print_profile_report(collector)
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from time import perf_counter_ns
+from typing import IO, Any
+
+ProfileHook = Callable[[str, int, int], None]
+
+# Active hook; read directly by instrumented call sites (None = disabled).
+hook: ProfileHook | None = None
+
+_original_inits: dict[type, Callable[..., None]] = {}
+
+
+def packet_payload_size(data: Mapping[str, Any] | Any) -> int:
+    """Top-level items in the four PacketV2 dict fields (dict or PacketV2)."""
+    get = data.get if isinstance(data, Mapping) else lambda k: getattr(data, k, None)
+    total = 0
+    for name in ("input", "external", "mdm", "final_action"):
+        value = get(name)
+        if isinstance(value, Mapping):
+            total += len(value)
+    return total
+
+
+def timed(active: ProfileHook, op: str, size: int, fn: Callable[..., Any], *args: Any) -> Any:
+    """Call fn(*args) and report its duration to `active`."""
+    t0 = perf_counter_ns()
+    try:
+        return fn(*args)
+    finally:
+        active(op, perf_counter_ns() - t0, size)
+
+
+@dataclass
+class OpStats:
+    """Accumulated cost of one operation."""
+
+    calls: int = 0
+    total_ns: int = 0
+    max_ns: int = 0
+    total_size: int = 0
+
+    @property
+    def mean_ns(self) -> float:
+        return self.total_ns / self.calls if self.calls else 0.0
+
+
+class ProfileCollector:
+    """In-memory hook: per-operation call counts, cumulative/max ns and payload sizes."""
+
+    def __init__(self) -> None:
+        self.ops: dict[str, OpStats] = {}
+
+    def __call__(self, op: str, elapsed_ns: int, size: int) -> None:
+        stats = self.ops.get(op)
+        if stats is None:
+            stats = self.ops[op] = OpStats()
+        stats.calls += 1
+        stats.total_ns += elapsed_ns
+        stats.total_size += size
+        if elapsed_ns > stats.max_ns:
+            stats.max_ns = elapsed_ns
+
+    def reset(self) -> None:
+        self.ops.clear()
+
+
+def _type_sizes() -> dict[type, Callable[[Any], int]]:
+    from decision_schema.packet_v2 import PacketV2
+    from decision_schema.types import FinalDecision, MismatchInfo, Proposal
+
+    return {
+        Proposal: lambda o: len(o.reasons) + len(o.params or {}),
+        FinalDecision: lambda o: len(o.reasons) + len(o.params or {}),
+        MismatchInfo: lambda o: len(o.flags) + len(o.reason_codes),
+        PacketV2: packet_payload_size,
+    }
+
+
+def _wrap_init(cls: type, size_of: Callable[[Any], int]) -> None:
+    original = cls.__init__
+    op = cls.__name__
+
+    def __init__(self: Any, *args: Any, **kwargs: Any) -> None:
+        active = hook
+        if active is None:
+            original(self, *args, **kwargs)
+            return
+        t0 = perf_counter_ns()
+        original(self, *args, **kwargs)
+        active(op, perf_counter_ns() - t0, size_of(self))
+
+    __init__.__wrapped__ = original  # type: ignore[attr-defined]
+    _original_inits[cls] = original
+    cls.__init__ = __init__  # type: ignore[method-assign]
+
+
+def set_profile_hook(callback: ProfileHook | None, *, types: bool = True) -> None:
+    """
+    Install `callback(op, elapsed_ns, size)` as the active hook (None disables).
+
+    Args:
+        callback: Hook to install, or None to disable profiling.
+        types: Also time type construction (wraps constructors while enabled).
+    """
+    global hook
+    hook = callback
+    if callback is not None and types:
+        for cls, size_of in _type_sizes().items():
+            if cls not in _original_inits:
+                _wrap_init(cls, size_of)
+    else:
+        for cls, original in _original_inits.items():
+            cls.__init__ = original  # type: ignore[method-assign]
+        _original_inits.clear()
+
+
+def enable_profiling(
+    collector: ProfileCollector | None = None, *, types: bool = True
+) -> ProfileCollector:
+    """Install a ProfileCollector (a new one if not given) and return it."""
+    collector = collector if collector is not None else ProfileCollector()
+    set_profile_hook(collector, types=types)
+    return collector
+
+
+def disable_profiling() -> None:
+    """Remove the hook and restore unwrapped constructors."""
+    set_profile_hook(None)
+
+
+def format_profile_report(collector: ProfileCollector) -> str:
+    """Return a per-operation cost table, most expensive (total time) first."""
+    header = ("operation", "calls", "total_ms", "mean_us", "max_us", "avg_size")
+    lines = ["{:<24} {:>9} {:>10} {:>9} {:>9} {:>9}".format(*header)]
+    ranked = sorted(collector.ops.items(), key=lambda kv: kv[1].total_ns, reverse=True)
+    for op, s in ranked:
+        avg_size = s.total_size / s.calls if s.calls else 0.0
+        lines.append(
+            f"{op:<24} {s.calls:>9} {s.total_ns / 1e6:>10.3f} {s.mean_ns / 1e3:>9.2f} "
+            f"{s.max_ns / 1e3:>9.2f} {avg_size:>9.1f}"
+        )
+    return "\n".join(lines)
+
+
+def print_profile_report(collector: ProfileCollector, file: IO[str] | None = None) -> None:
+    """Print format_profile_report(collector) (stdout by default)."""
+    print(format_profile_report(collector), file=file or sys.stdout)
@@ -0,0 +1,278 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Streaming query over PacketV2 JSONL traces with predicate pushdown.
+
+Predicates are applied in three stages, cheapest first:
+
+1. Segment summaries (segments.py sidecars): skip whole segments, or seek to a
+   run's byte range via `run_ranges`.
+2. Raw-line prefilter: a line that does not contain the JSON encoding of a
+   required string value cannot match and is not parsed.
+3. Full predicate evaluation on the decoded packet dict.
+
+Lines that do not decode to a JSON object (such as a torn last line of a
+segment still being written) are skipped and counted in `QueryStats.bad_lines`.
+
+CLI:
+    python -m decision_schema.query TRACE_DIR_OR_FILE... --run-id R --action STOP \\
+        --min-step 10 --max-step 20 --external ops_state=RED
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from decision_schema.segments import SegmentSummary, list_segments, load_summary, packet_action
+
+
+def _value_needle(value: Any) -> bytes | None:
+    """Return bytes any JSON encoding of value must contain, or None if not safely known."""
+    if not isinstance(value, str):
+        return None
+    encoded = json.dumps(value)
+    # Only plain values: escapes ("\\u00e9", "\\/", ...) differ between encoders.
+    if encoded != f'"{value}"' or "/" in value:
+        return None
+    return encoded.encode("ascii")
+
+
+@dataclass(frozen=True)
+class PacketQuery:
+    """
+    Conjunction of simple packet predicates (None means "no constraint").
+
+    Args:
+        run_id: Exact run_id.
+        min_step / max_step: Inclusive step range.
+        actions: Allowed final_action["action"] values.
+        min_latency_ms / max_latency_ms: Inclusive latency range.
+        external: Exact-match constraints on PacketV2.external keys.
+    """
+
+    run_id: str | None = None
+    min_step: int | None = None
+    max_step: int | None = None
+    actions: frozenset[str] | None = None
+    min_latency_ms: float | None = None
+    max_latency_ms: float | None = None
+    external: Mapping[str, Any] = field(default_factory=dict)
+
+    def may_match_summary(self, summary: SegmentSummary) -> bool:
+        """False only if no packet summarized by `summary` can match."""
+        if self.run_id is not None and self.run_id not in summary.run_ranges:
+            return False
+        if summary.min_step is not None:
+            if self.max_step is not None and summary.min_step > self.max_step:
+                return False
+            if self.min_step is not None and summary.max_step < self.min_step:
+                return False
+        if summary.latency_min is not None:
+            if self.max_latency_ms is not None and summary.latency_min > self.max_latency_ms:
+                return False
+            if self.min_latency_ms is not None and summary.latency_max < self.min_latency_ms:
+                return False
+        if self.actions is not None and summary.count:
+            if not any(summary.action_counts.get(a) for a in self.actions):
+                return False
+        return True
+
+    def line_prefilter(self) -> tuple[tuple[bytes, ...], ...]:
+        """
+        Needle groups for raw lines: a line may match only if, for every group,
+        it contains at least one needle of that group.
+        """
+        groups: list[tuple[bytes, ...]] = []
+        needle = _value_needle(self.run_id)
+        if needle is not None:
+            groups.append((needle,))
+        if self.actions is not None:
+            needles = tuple(_value_needle(a) for a in self.actions)
+            if needles and all(n is not None for n in needles):
+                groups.append(needles)
+        for key, value in self.external.items():
+            key_needle = _value_needle(key)
+            if key_needle is not None:
+                groups.append((key_needle,))
+            value_needle = _value_needle(value)
+            if value_needle is not None:
+                groups.append((value_needle,))
+        return tuple(groups)
+
+    def matches(self, data: Mapping[str, Any]) -> bool:
+        """Evaluate all predicates on a decoded packet dict."""
+        if self.run_id is not None and data.get("run_id") != self.run_id:
+            return False
+        if self.min_step is not None or self.max_step is not None:
+            step = data.get("step")
+            if not isinstance(step, int):
+                return False
+            if self.min_step is not None and step < self.min_step:
+                return False
+            if self.max_step is not None and step > self.max_step:
+                return False
+        if self.min_latency_ms is not None or self.max_latency_ms is not None:
+            latency = data.get("latency_ms")
+            if not isinstance(latency, (int, float)):
+                return False
+            if self.min_latency_ms is not None and latency < self.min_latency_ms:
+                return False
+            if self.max_latency_ms is not None and latency > self.max_latency_ms:
+                return False
+        if self.actions is not None and packet_action(data) not in self.actions:
+            return False
+        if self.external:
+            external = data.get("external") or {}
+            for key, value in self.external.items():
+                if key not in external or external[key] != value:
+                    return False
+        return True
+
+
+@dataclass
+class QueryStats:
+    """Work counters for one query."""
+
+    files: int = 0
+    files_skipped: int = 0
+    lines_scanned: int = 0
+    lines_parsed: int = 0
+    bad_lines: int = 0
+    matched: int = 0
+
+
+def resolve_sources(sources: Iterable[str | Path], prefix: str = "trace") -> list[Path]:
+    """Expand segment directories (in segment order) and plain JSONL file paths."""
+    files: list[Path] = []
+    for src in sources:
+        path = Path(src)
+        if path.is_dir():
+            files.extend(list_segments(path, prefix))
+        else:
+            files.append(path)
+    return files
+
+
+def _iter_lines(path: Path, byte_range: list[int] | None) -> Iterator[bytes]:
+    with open(path, "rb") as f:
+        if byte_range is None:
+            yield from f
+            return
+        start, end = byte_range
+        f.seek(start)
+        pos = start
+        for line in f:
+            yield line
+            pos += len(line)
+            if pos >= end:
+                return
+
+
+def run_query(
+    sources: Iterable[str | Path],
+    query: PacketQuery,
+    *,
+    prefix: str = "trace",
+    stats: QueryStats | None = None,
+) -> Iterator[dict[str, Any]]:
+    """
+    Stream packet dicts matching `query`.
+
+    Args:
+        sources: Segment directories (written by SegmentedTraceWriter) and/or JSONL files.
+        query: Predicates to apply.
+        prefix: Segment prefix used for directories.
+        stats: Optional counters updated while the iterator is consumed.
+    """
+    stats = stats if stats is not None else QueryStats()
+    groups = query.line_prefilter()
+    for path in resolve_sources(sources, prefix):
+        stats.files += 1
+        summary = load_summary(path)
+        byte_range = None
+        if summary is not None:
+            if not query.may_match_summary(summary):
+                stats.files_skipped += 1
+                continue
+            if query.run_id is not None:
+                byte_range = summary.run_ranges[query.run_id]
+        for line in _iter_lines(path, byte_range):
+            stats.lines_scanned += 1
+            if not all(any(n in line for n in group) for group in groups):
+                continue
+            if not line.strip():
+                continue
+            stats.lines_parsed += 1
+            try:
+                data = json.loads(line)
+            except ValueError:
+                stats.bad_lines += 1
+                continue
+            if not isinstance(data, dict):
+                stats.bad_lines += 1
+            elif query.matches(data):
+                stats.matched += 1
+                yield data
+
+
+def _parse_external(items: list[str]) -> dict[str, Any]:
+    out: dict[str, Any] = {}
+    for item in items:
+        key, sep, raw = item.partition("=")
+        if not sep:
+            raise argparse.ArgumentTypeError(f"--external expects KEY=VALUE, got {item!r}")
+        try:
+            out[key] = json.loads(raw)
+        except json.JSONDecodeError:
+            out[key] = raw
+    return out
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m decision_schema.query", description="Query PacketV2 JSONL traces."
+    )
+    parser.add_argument("sources", nargs="+", help="Segment directories or JSONL files")
+    parser.add_argument("--prefix", default="trace", help="Segment prefix for directories")
+    parser.add_argument("--run-id")
+    parser.add_argument("--min-step", type=int)
+    parser.add_argument("--max-step", type=int)
+    parser.add_argument("--action", action="append", help="final_action action (repeatable)")
+    parser.add_argument("--min-latency-ms", type=float)
+    parser.add_argument("--max-latency-ms", type=float)
+    parser.add_argument(
+        "--external", action="append", default=[], help="KEY=VALUE (VALUE parsed as JSON if valid)"
+    )
+    parser.add_argument("--count", action="store_true", help="Print match count only")
+    parser.add_argument("--stats", action="store_true", help="Print QueryStats to stderr")
+    args = parser.parse_args(argv)
+
+    query = PacketQuery(
+        run_id=args.run_id,
+        min_step=args.min_step,
+        max_step=args.max_step,
+        actions=frozenset(args.action) if args.action else None,
+        min_latency_ms=args.min_latency_ms,
+        max_latency_ms=args.max_latency_ms,
+        external=_parse_external(args.external),
+    )
+    stats = QueryStats()
+    out = sys.stdout
+    for data in run_query(args.sources, query, prefix=args.prefix, stats=stats):
+        if not args.count:
+            out.write(json.dumps(data, separators=(",", ":"), ensure_ascii=False) + "\n")
+    if args.count:
+        out.write(f"{stats.matched}\n")
+    if args.stats:
+        print(stats, file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Size-bounded redaction/truncation of PacketV2 snapshot fields.
+
+PacketV2.to_dict() requires `input`/`external` to be pre-redacted. This module
+does it in one pass: every node is visited at most once, so cost is linear in
+the input and output size is bounded by the per-field budget.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import re
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field, replace
+from typing import Any
+
+from decision_schema.packet_v2 import PacketV2
+
+REDACTED = "[REDACTED]"
+TRUNCATED_KEY = "_truncated"
+
+DEFAULT_REDACT_KEY_PATTERNS = (
+    "*password*",
+    "*passwd*",
+    "*secret*",
+    "*token*",
+    "*api_key*",
+    "*apikey*",
+    "*authorization*",
+    "*credential*",
+    "*private_key*",
+)
+
+PACKET_DICT_FIELDS = ("input", "external", "mdm", "final_action")
+
+
+@dataclass(frozen=True)
+class RedactionBudget:
+    """
+    Per-field limits.
+
+    Args:
+        max_bytes: Approximate JSON byte budget for the whole field.
+        max_depth: Maximum container nesting depth (the field itself is depth 0).
+        max_items: Maximum entries kept per dict/list.
+        max_str_len: Maximum characters kept per string.
+    """
+
+    max_bytes: int = 16_384
+    max_depth: int = 8
+    max_items: int = 256
+    max_str_len: int = 1024
+
+
+@dataclass
+class RedactionStats:
+    """Counters accumulated by RedactionPolicy.apply()."""
+
+    redacted_keys: int = 0
+    truncated_nodes: int = 0
+    truncated_strings: int = 0
+
+
+def compile_key_patterns(patterns: Iterable[str]) -> re.Pattern[str] | None:
+    """Compile glob-style key patterns into one case-insensitive regex (None if empty)."""
+    parts = [fnmatch.translate(p) for p in patterns]
+    if not parts:
+        return None
+    return re.compile("|".join(parts), re.IGNORECASE)
+
+
+def _placeholder(reason: str, value: Any) -> dict[str, Any]:
+    size = len(value) if isinstance(value, (Mapping, list, tuple, str)) else 1
+    return {TRUNCATED_KEY: reason, "type": type(value).__name__, "size": size}
+
+
+class _Walker:
+    __slots__ = ("budget", "key_re", "remaining", "stats")
+
+    def __init__(
+        self, budget: RedactionBudget, key_re: re.Pattern[str] | None, stats: RedactionStats
+    ) -> None:
+        self.budget = budget
+        self.key_re = key_re
+        self.remaining = budget.max_bytes
+        self.stats = stats
+
+    def walk(self, value: Any, depth: int) -> Any:
+        if self.remaining <= 0:
+            self.stats.truncated_nodes += 1
+            return _placeholder("bytes", value)
+        if isinstance(value, Mapping):
+            return self._walk_mapping(value, depth)
+        if isinstance(value, (list, tuple)):
+            return self._walk_list(value, depth)
+        if isinstance(value, str):
+            limit = self.budget.max_str_len
+            if len(value) > limit:
+                self.stats.truncated_strings += 1
+                value = f"{value[:limit]}...[+{len(value) - limit} chars]"
+            self.remaining -= len(value) + 2
+            return value
+        self.remaining -= 8
+        return value
+
+    def _walk_mapping(self, value: Mapping[Any, Any], depth: int) -> Any:
+        budget = self.budget
+        if depth >= budget.max_depth:
+            self.stats.truncated_nodes += 1
+            return _placeholder("depth", value)
+        key_re = self.key_re
+        out: dict[Any, Any] = {}
+        self.remaining -= 2
+        for i, (k, v) in enumerate(value.items()):
+            if i >= budget.max_items:
+                self.stats.truncated_nodes += 1
+                out[TRUNCATED_KEY] = {"reason": "items", "omitted": len(value) - i}
+                break
+            if self.remaining <= 0:
+                self.stats.truncated_nodes += 1
+                out[TRUNCATED_KEY] = {"reason": "bytes", "omitted": len(value) - i}
+                break
+            self.remaining -= len(str(k)) + 4
+            if key_re is not None and isinstance(k, str) and key_re.match(k):
+                self.stats.redacted_keys += 1
+                out[k] = REDACTED
+                self.remaining -= len(REDACTED) + 2
+            else:
+                out[k] = self.walk(v, depth + 1)
+        return out
+
+    def _walk_list(self, value: list[Any] | tuple[Any, ...], depth: int) -> Any:
+        budget = self.budget
+        if depth >= budget.max_depth:
+            self.stats.truncated_nodes += 1
+            return _placeholder("depth", value)
+        out: list[Any] = []
+        self.remaining -= 2
+        for i, v in enumerate(value):
+            if i >= budget.max_items or self.remaining <= 0:
+                self.stats.truncated_nodes += 1
+                reason = "items" if i >= budget.max_items else "bytes"
+                out.append({TRUNCATED_KEY: reason, "omitted": len(value) - i})
+                break
+            out.append(self.walk(v, depth + 1))
+            self.remaining -= 1
+        return out
+
+
+@dataclass(frozen=True)
+class RedactionPolicy:
+    """
+    Budgets and key patterns applied to PacketV2 dict fields.
+
+    Oversize subtrees are replaced with placeholders such as
+    `{"_truncated": "depth", "type": "dict", "size": 12}`; dicts/lists cut short
+    record the omitted count under `_truncated`. Values under keys matching
+    `redact_key_patterns` (glob, case-insensitive, any depth) become `[REDACTED]`.
+
+    Args:
+        default_budget: Budget for fields not listed in `field_budgets`.
+        field_budgets: Per-field budgets keyed by PacketV2 field name.
+        redact_key_patterns: Glob patterns for keys whose values are redacted.
+        fields: PacketV2 dict fields to process.
+    """
+
+    default_budget: RedactionBudget = RedactionBudget()
+    field_budgets: Mapping[str, RedactionBudget] = field(default_factory=dict)
+    redact_key_patterns: tuple[str, ...] = DEFAULT_REDACT_KEY_PATTERNS
+    fields: tuple[str, ...] = PACKET_DICT_FIELDS
+
+    def __post_init__(self) -> None:
+        unknown = set(self.fields) - set(PACKET_DICT_FIELDS)
+        if unknown:
+            raise ValueError(f"fields must be PacketV2 dict fields, got {sorted(unknown)}")
+        object.__setattr__(self, "_key_re", compile_key_patterns(self.redact_key_patterns))
+
+    def redact_value(
+        self, value: Any, budget: RedactionBudget, stats: RedactionStats | None = None
+    ) -> Any:
+        """Return a redacted, size-bounded copy of value (input is not modified)."""
+        walker = _Walker(budget, self._key_re, stats if stats is not None else RedactionStats())
+        return walker.walk(value, 0)
+
+    def apply(self, packet: PacketV2, stats: RedactionStats | None = None) -> PacketV2:
+        """Return a copy of packet with every configured field redacted and bounded."""
+        stats = stats if stats is not None else RedactionStats()
+        changes: dict[str, Any] = {}
+        for name in self.fields:
+            value = getattr(packet, name)
+            budget = self.field_budgets.get(name, self.default_budget)
+            changes[name] = self.redact_value(value, budget, stats)
+        return replace(packet, **changes)
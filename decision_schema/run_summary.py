@@ -0,0 +1,351 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Per-run summaries maintained incrementally as packets are written.
+
+A `RunSummaryIndex` keeps one `RunSummary` per `run_id` (step range, action
+counts, `allowed` ratio, fail-closed and mismatch counts, latency min/max/sum,
+schema versions), so run-level questions are a dict lookup instead of a trace
+scan.
+
+Two ways to keep it current, usable together:
+
+- `enable_run_summaries(index)`: file writers (`trace_io.write_packets`,
+  `SegmentedTraceWriter`) fold each packet into the index as they write it.
+- `index.catch_up(path)` / `catch_up_sources(...)`: replay trace bytes past the
+  offset already summarized (packets written by other processes, or after a
+  restart).
+
+The index records, per trace file, the byte offset it has summarized; summaries
+and offsets are saved together in one atomically replaced JSON file. Recovering
+from a crash is `RunSummaryIndex.load(state)` followed by `catch_up`, which
+reads only the tail written since the last save. A partially written last line
+is left for the next catch-up.
+
+Summaries only grow: rewriting or truncating a summarized trace file needs a
+rebuild (`build_run_summaries`). `catch_up` raises ValueError on a file shorter
+than its recorded offset, and on a file a hooked writer reopened in truncating
+mode (the hook stops folding it until then).
+
+CLI:
+    python -m decision_schema.run_summary --state runs.json trace_dir/ [--run RUN_ID]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import threading
+from collections.abc import Iterable, Mapping
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from decision_schema import trace_io as _trace_io
+from decision_schema.capture_policy import FAIL_CLOSED_KEYS
+from decision_schema.query import resolve_sources
+from decision_schema.segments import packet_action
+
+STATE_FORMAT = 1
+
+
+@dataclass
+class RunSummary:
+    """Aggregates of one run's packets (in the order they were summarized)."""
+
+    run_id: str
+    count: int = 0
+    min_step: int | None = None
+    max_step: int | None = None
+    action_counts: dict[str, int] = field(default_factory=dict)
+    allowed: int = 0  # final_action["allowed"] is True
+    allowed_known: int = 0  # final_action["allowed"] is a bool
+    fail_closed: int = 0  # any of FAIL_CLOSED_KEYS truthy in external
+    mismatch_packets: int = 0
+    mismatch_flags: dict[str, int] = field(default_factory=dict)
+    latency_min: int | float | None = None
+    latency_max: int | float | None = None
+    latency_sum: int | float = 0
+    latency_count: int = 0
+    schema_versions: list[str] = field(default_factory=list)
+
+    @property
+    def allowed_ratio(self) -> float | None:
+        return self.allowed / self.allowed_known if self.allowed_known else None
+
+    @property
+    def latency_mean(self) -> float | None:
+        return self.latency_sum / self.latency_count if self.latency_count else None
+
+    def update(self, data: Mapping[str, Any]) -> None:
+        """Fold one packet (dict form) into the summary."""
+        self.count += 1
+        step = data.get("step")
+        if type(step) is int:
+            if self.min_step is None or step < self.min_step:
+                self.min_step = step
+            if self.max_step is None or step > self.max_step:
+                self.max_step = step
+        latency = data.get("latency_ms")
+        if type(latency) is int or type(latency) is float:
+            if self.latency_min is None or latency < self.latency_min:
+                self.latency_min = latency
+            if self.latency_max is None or latency > self.latency_max:
+                self.latency_max = latency
+            self.latency_sum += latency
+            self.latency_count += 1
+        action = packet_action(data)
+        if action is not None:
+            self.action_counts[action] = self.action_counts.get(action, 0) + 1
+        final_action = data.get("final_action")
+        if isinstance(final_action, dict):
+            allowed = final_action.get("allowed")
+            if type(allowed) is bool:
+                self.allowed_known += 1
+                self.allowed += allowed
+        external = data.get("external")
+        if isinstance(external, dict):
+            for key in FAIL_CLOSED_KEYS:
+                if external.get(key):
+                    self.fail_closed += 1
+                    break
+        mismatch = data.get("mismatch")
+        if isinstance(mismatch, dict):
+            flags = mismatch.get("flags")
+            # asdict(MismatchInfo()) has empty lists: not a mismatch.
+            if flags or mismatch.get("reason_codes"):
+                self.mismatch_packets += 1
+                if isinstance(flags, list):
+                    counts = self.mismatch_flags
+                    for flag in flags:
+                        if isinstance(flag, str):
+                            counts[flag] = counts.get(flag, 0) + 1
+        version = data.get("schema_version")
+        if isinstance(version, str) and version not in self.schema_versions:
+            self.schema_versions.append(version)
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> RunSummary:
+        return cls(**data)
+
+
+class RunSummaryIndex:
+    """
+    Thread-safe run_id -> RunSummary map plus the per-file offsets it covers.
+
+    Attributes:
+        runs: run_id -> RunSummary.
+        offsets: Resolved trace file path -> bytes summarized from its start.
+        bad_lines: Packets without a str run_id or with a non-dict external, and
+            complete lines that were not packet JSON (skipped).
+        stale: Summarized trace files since rewritten from the start; their
+            runs need a rebuild.
+    """
+
+    def __init__(self) -> None:
+        self.runs: dict[str, RunSummary] = {}
+        self.offsets: dict[str, int] = {}
+        self.bad_lines = 0
+        self.stale: set[str] = set()
+        self._lock = threading.Lock()
+        self._sources: dict[Path | str, str] = {}  # path as given -> resolved key
+
+    def _source(self, path: Path | str) -> str:
+        key = self._sources.get(path)
+        if key is None:
+            key = self._sources[path] = str(Path(path).resolve())
+        return key
+
+    def _fold(self, data: Mapping[str, Any]) -> bool:
+        run_id = data.get("run_id")
+        external = data.get("external")
+        if not isinstance(run_id, str) or not (external is None or isinstance(external, dict)):
+            self.bad_lines += 1
+            return False
+        summary = self.runs.get(run_id)
+        if summary is None:
+            summary = self.runs[run_id] = RunSummary(run_id)
+        summary.update(data)
+        return True
+
+    def add(self, packet: _trace_io.PacketLike) -> None:
+        """Fold a packet that is not tracked by file offset (e.g. from a stream)."""
+        with self._lock:
+            self._fold(_trace_io.packet_to_dict(packet))
+
+    def observe(self, data: dict[str, Any], path: Path, start: int, end: int) -> None:
+        """
+        Write hook: fold a packet written to path at [start, end).
+
+        Ignored unless start is exactly the offset already summarized for path
+        (and path is not stale); the next catch_up replays such packets from the
+        file instead.
+        """
+        with self._lock:
+            key = self._source(path)
+            if self.offsets.get(key, 0) != start or key in self.stale:
+                return
+            self._fold(data)
+            self.offsets[key] = end
+
+    def truncated(self, path: Path) -> None:
+        """Truncate hook: path is being rewritten from the start."""
+        with self._lock:
+            key = self._source(path)
+            if self.offsets.get(key):
+                self.stale.add(key)
+
+    def catch_up(self, path: str | Path) -> int:
+        """
+        Summarize complete lines of path past its recorded offset; return packets folded.
+
+        Raises:
+            ValueError: If the file is shorter than the recorded offset or was
+                reopened in truncating mode (rewritten).
+        """
+        n = 0
+        with self._lock:
+            key = self._source(path)
+            if key in self.stale:
+                raise ValueError(
+                    f"{path} was rewritten after it was summarized; rebuild the run summaries"
+                )
+            offset = self.offsets.get(key, 0)
+            with open(path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if size < offset:
+                    raise ValueError(
+                        f"{path} is shorter than its summarized offset ({size} < {offset}); "
+                        "rebuild the run summaries"
+                    )
+                f.seek(offset)
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break  # partially written; picked up by a later catch_up
+                    offset += len(line)
+                    if not line.strip():
+                        continue
+                    try:
+                        data = json.loads(line)
+                    except ValueError:
+                        self.bad_lines += 1
+                        continue
+                    if not isinstance(data, dict):
+                        self.bad_lines += 1
+                    elif self._fold(data):
+                        n += 1
+            self.offsets[key] = offset
+        return n
+
+    def catch_up_sources(self, sources: Iterable[str | Path], prefix: str = "trace") -> int:
+        """catch_up every JSONL file / segment of the given sources; return packets folded."""
+        return sum(self.catch_up(path) for path in resolve_sources(sources, prefix))
+
+    def get(self, run_id: str) -> RunSummary | None:
+        return self.runs.get(run_id)
+
+    def __contains__(self, run_id: object) -> bool:
+        return run_id in self.runs
+
+    def __len__(self) -> int:
+        return len(self.runs)
+
+    def to_dict(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "format": STATE_FORMAT,
+                "bad_lines": self.bad_lines,
+                "offsets": dict(self.offsets),
+                "stale": sorted(self.stale),
+                "runs": {run_id: s.to_dict() for run_id, s in self.runs.items()},
+            }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> RunSummaryIndex:
+        """
+        Restore state written by to_dict().
+
+        Raises:
+            ValueError: If the state format is unknown.
+        """
+        if data.get("format") != STATE_FORMAT:
+            raise ValueError(f"unsupported run summary state format {data.get('format')!r}")
+        index = cls()
+        index.bad_lines = data["bad_lines"]
+        index.offsets = dict(data["offsets"])
+        index.stale = set(data.get("stale", ()))
+        index.runs = {run_id: RunSummary.from_dict(s) for run_id, s in data["runs"].items()}
+        return index
+
+    def save(self, path: str | Path) -> None:
+        """
+        Write summaries and offsets atomically (temp file, fsync, rename).
+
+        Flush writers first: offsets reported by the write hook count buffered bytes.
+        """
+        path = Path(path)
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, separators=(",", ":"), ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str | Path) -> RunSummaryIndex:
+        return cls.from_dict(json.loads(Path(path).read_text(encoding="utf-8")))
+
+
+def build_run_summaries(sources: Iterable[str | Path], prefix: str = "trace") -> RunSummaryIndex:
+    """Summarize JSONL traces / segment directories from scratch."""
+    index = RunSummaryIndex()
+    index.catch_up_sources(sources, prefix)
+    return index
+
+
+def enable_run_summaries(index: RunSummaryIndex) -> None:
+    """Fold every packet written by trace_io / segment writers into index."""
+    _trace_io.write_hook = index.observe
+    _trace_io.truncate_hook = index.truncated
+
+
+def disable_run_summaries() -> None:
+    _trace_io.write_hook = None
+    _trace_io.truncate_hook = None
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m decision_schema.run_summary",
+        description="Bring a run summary state file up to date with traces; print a run.",
+    )
+    parser.add_argument("sources", nargs="+", help="JSONL traces or segment directories")
+    parser.add_argument("--state", required=True, help="Summary state file (created if missing)")
+    parser.add_argument("--prefix", default="trace", help="Segment file prefix")
+    parser.add_argument("--run", help="Print this run's summary")
+    args = parser.parse_args(argv)
+
+    state = Path(args.state)
+    index = RunSummaryIndex.load(state) if state.exists() else RunSummaryIndex()
+    folded = index.catch_up_sources(args.sources, args.prefix)
+    index.save(state)
+    print(f"runs={len(index)} folded={folded}", file=sys.stderr)
+    if args.run is not None:
+        summary = index.get(args.run)
+        if summary is None:
+            print(f"unknown run_id: {args.run}", file=sys.stderr)
+            return 1
+        out = summary.to_dict()
+        out["allowed_ratio"] = summary.allowed_ratio
+        out["latency_mean"] = summary.latency_mean
+        print(json.dumps(out, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
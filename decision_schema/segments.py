@@ -0,0 +1,283 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Rotating, segmented PacketV2 trace files with per-segment summary sidecars.
+
+Layout in the trace directory:
+
+    <prefix>-000000.jsonl           packets (plain JSONL, readable by trace_io)
+    <prefix>-000000.summary.json    SegmentSummary, written when the segment closes
+
+Readers can skip a segment using only its sidecar (step range, run_ids, action
+counts, schema versions, latency range).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import time
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from decision_schema import trace_io as _trace_io
+from decision_schema.trace_io import PacketLike, packet_to_dict
+
+SEGMENT_SUFFIX = ".jsonl"
+SUMMARY_SUFFIX = ".summary.json"
+
+
+def packet_action(data: Mapping[str, Any]) -> str | None:
+    """Return final_action["action"] as a plain string (None if absent)."""
+    final_action = data.get("final_action")
+    if not isinstance(final_action, dict):
+        return None
+    action = final_action.get("action")
+    if action is None:
+        return None
+    return str(getattr(action, "value", action))
+
+
+@dataclass
+class SegmentSummary:
+    """
+    Per-segment summary.
+
+    `run_ranges` maps run_id -> [first_line_offset, end_offset) in the segment file:
+    an offset index readers can seek to instead of scanning the whole segment.
+    The range covers every line of the run (it may also cover interleaved lines
+    of other runs).
+    """
+
+    segment: str
+    count: int = 0
+    bytes: int = 0
+    min_step: int | None = None
+    max_step: int | None = None
+    latency_min: int | None = None
+    latency_max: int | None = None
+    action_counts: dict[str, int] = field(default_factory=dict)
+    schema_versions: list[str] = field(default_factory=list)
+    run_ranges: dict[str, list[int]] = field(default_factory=dict)
+    opened_ms: int = 0
+    closed_ms: int | None = None
+
+    @property
+    def run_ids(self) -> list[str]:
+        return sorted(self.run_ranges)
+
+    def update(self, data: dict[str, Any], offset: int, length: int) -> None:
+        """Fold one packet (dict form) written at [offset, offset + length) into the summary."""
+        self.count += 1
+        self.bytes = offset + length
+        step = data.get("step")
+        if isinstance(step, int):
+            self.min_step = step if self.min_step is None else min(self.min_step, step)
+            self.max_step = step if self.max_step is None else max(self.max_step, step)
+        latency = data.get("latency_ms")
+        if isinstance(latency, (int, float)):
+            self.latency_min = (
+                latency if self.latency_min is None else min(self.latency_min, latency)
+            )
+            self.latency_max = (
+                latency if self.latency_max is None else max(self.latency_max, latency)
+            )
+        action = packet_action(data)
+        if action is not None:
+            self.action_counts[action] = self.action_counts.get(action, 0) + 1
+        version = data.get("schema_version")
+        if version is not None and version not in self.schema_versions:
+            self.schema_versions.append(version)
+        run_id = data.get("run_id")
+        rng = self.run_ranges.get(run_id)
+        if rng is None:
+            self.run_ranges[run_id] = [offset, offset + length]
+        else:
+            rng[1] = offset + length
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["run_ids"] = self.run_ids
+        data["schema_versions"] = sorted(self.schema_versions)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> SegmentSummary:
+        data = dict(data)
+        data.pop("run_ids", None)
+        return cls(**data)
+
+
+def segment_path(directory: str | Path, prefix: str, index: int) -> Path:
+    """Return the JSONL path of segment `index`."""
+    return Path(directory) / f"{prefix}-{index:06d}{SEGMENT_SUFFIX}"
+
+
+def summary_path(segment: str | Path) -> Path:
+    """Return the sidecar path for a segment file."""
+    segment = Path(segment)
+    name = segment.name
+    if name.endswith(SEGMENT_SUFFIX):
+        name = name[: -len(SEGMENT_SUFFIX)]
+    return segment.with_name(name + SUMMARY_SUFFIX)
+
+
+def load_summary(segment: str | Path) -> SegmentSummary | None:
+    """Load a segment's sidecar summary (None if the segment is still open or unsummarized)."""
+    path = summary_path(segment)
+    try:
+        with open(path, encoding="utf-8") as f:
+            return SegmentSummary.from_dict(json.load(f))
+    except FileNotFoundError:
+        return None
+
+
+def _indexed_segments(directory: str | Path, prefix: str) -> list[tuple[int, Path]]:
+    pattern = re.compile(rf"^{re.escape(prefix)}-(\d+){re.escape(SEGMENT_SUFFIX)}$")
+    found = []
+    for p in Path(directory).iterdir():
+        m = pattern.match(p.name)
+        if m:
+            found.append((int(m.group(1)), p))
+    return sorted(found)
+
+
+def list_segments(directory: str | Path, prefix: str = "trace") -> list[Path]:
+    """Return segment files for prefix, in index order."""
+    return [p for _, p in _indexed_segments(directory, prefix)]
+
+
+def iter_segment_summaries(
+    directory: str | Path, prefix: str = "trace"
+) -> Iterator[tuple[Path, SegmentSummary | None]]:
+    """Yield (segment path, summary or None) in index order."""
+    for path in list_segments(directory, prefix):
+        yield path, load_summary(path)
+
+
+def _write_json_atomic(path: Path, data: dict[str, Any]) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, separators=(",", ":"), sort_keys=True)
+    os.replace(tmp, path)
+
+
+class SegmentedTraceWriter:
+    """
+    PacketV2 JSONL writer that rotates segments and writes a summary sidecar per segment.
+
+    A segment is closed (and its sidecar written) before the packet that would
+    exceed any configured limit. At least one packet is always written per segment.
+
+    Args:
+        directory: Trace directory (created if missing).
+        prefix: Segment file name prefix.
+        max_bytes: Rotate when the segment would exceed this many bytes.
+        max_age_s: Rotate when the segment has been open this long.
+        max_runs: Rotate when a packet would add run_id number `max_runs + 1`.
+        clock: Time source in seconds (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        prefix: str = "trace",
+        *,
+        max_bytes: int | None = 64 * 1024 * 1024,
+        max_age_s: float | None = None,
+        max_runs: int | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.prefix = prefix
+        self.max_bytes = max_bytes
+        self.max_age_s = max_age_s
+        self.max_runs = max_runs
+        self._clock = clock
+        existing = _indexed_segments(self.directory, prefix)
+        self._next_index = existing[-1][0] + 1 if existing else 0
+        self._file: Any = None
+        self._path: Path | None = None
+        self._summary: SegmentSummary | None = None
+        self._opened_at = 0.0
+        self.closed_segments: list[Path] = []
+
+    def _open(self) -> None:
+        path = segment_path(self.directory, self.prefix, self._next_index)
+        opened_at = self._clock()
+        summary = SegmentSummary(segment=path.name, opened_ms=int(opened_at * 1000))
+        truncate = _trace_io.truncate_hook
+        if truncate is not None:
+            truncate(path)
+        # Long-lived handle: opened last so nothing can fail before it is stored,
+        # and rotate() (via close() / __exit__) is its only owner.
+        self._file = open(path, "wb")  # noqa: SIM115
+        self._next_index += 1
+        self._path = path
+        self._opened_at = opened_at
+        self._summary = summary
+
+    def _should_rotate(self, line_len: int, run_id: Any) -> bool:
+        s = self._summary
+        if s is None or s.count == 0:
+            return False
+        if self.max_bytes is not None and s.bytes + line_len > self.max_bytes:
+            return True
+        if self.max_age_s is not None and self._clock() - self._opened_at >= self.max_age_s:
+            return True
+        if (
+            self.max_runs is not None
+            and run_id not in s.run_ranges
+            and len(s.run_ranges) >= self.max_runs
+        ):
+            return True
+        return False
+
+    def rotate(self) -> Path | None:
+        """Close the current segment and write its sidecar; return the closed segment path."""
+        file, summary = self._file, self._summary
+        if file is None:
+            return None
+        # Detach first: if closing or the sidecar write fails, the handle is still
+        # released and the next write opens a fresh segment.
+        self._file = None
+        self._summary = None
+        file.close()
+        summary.closed_ms = int(self._clock() * 1000)
+        path = self.directory / summary.segment
+        _write_json_atomic(summary_path(path), summary.to_dict())
+        self.closed_segments.append(path)
+        return path
+
+    def write(self, packet: PacketLike) -> None:
+        """Append one packet, rotating first if a limit would be exceeded."""
+        data = packet_to_dict(packet)
+        line = (json.dumps(data, separators=(",", ":"), ensure_ascii=False) + "\n").encode("utf-8")
+        if self._should_rotate(len(line), data.get("run_id")):
+            self.rotate()
+        if self._file is None:
+            self._open()
+        offset = self._summary.bytes
+        self._file.write(line)
+        self._summary.update(data, offset, len(line))
+        hook = _trace_io.write_hook
+        if hook is not None:
+            hook(data, self._path, offset, offset + len(line))
+
+    def flush(self) -> None:
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self) -> None:
+        """Close the open segment (if any) and write its sidecar."""
+        self.rotate()
+
+    def __enter__(self) -> SegmentedTraceWriter:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
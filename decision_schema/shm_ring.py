@@ -0,0 +1,268 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Shared-memory single-producer / multi-consumer ring of encoded PacketV2 records.
+
+Cores on the same host hand packets to each other through one
+`multiprocessing.shared_memory` segment instead of pickling dicts over pipes.
+Records are opaque bytes (by default the trace_io JSON line of a packet).
+
+Layout (little-endian):
+
+    header   64 B   magic, layout version, capacity, slot_size, max_consumers, write_seq
+    cursors  16 B x max_consumers    active flag, next sequence to read
+    slots    (16 B + slot_size) x capacity    committed seq + 1, payload length, payload
+
+Each slot acts as a seqlock: the producer zeroes the slot's sequence word, writes
+the payload, then stores `seq + 1`. A consumer copies the payload and re-checks
+the sequence word; a mismatch means the slot was overwritten while reading.
+
+Modes:
+- "overwrite": the producer never waits; consumers that fall more than
+  `capacity` records behind skip ahead and count the lost records in `dropped`.
+- "block": the producer waits (up to `timeout_s`) until every active consumer
+  has read the slot about to be reused.
+
+Single producer only. Relies on the host's store ordering for the slot
+sequence word (true on x86-64 and under CPython's process model in practice).
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+import sys
+import time
+from multiprocessing import resource_tracker, shared_memory
+
+from decision_schema.packet_v2 import PacketV2
+from decision_schema.trace_io import PacketLike, dumps_packet, loads_packet
+
+MAGIC = 0x44535242  # "DSRB"
+LAYOUT_VERSION = 1
+
+# magic, layout version, capacity, slot_size, max_consumers, write_seq
+_HEADER = struct.Struct("<IIIII4xQ")
+_HEADER_SIZE = 64
+_WRITE_SEQ_OFFSET = 24
+_CURSOR = struct.Struct("<QQ")  # active, next_seq
+_SLOT_HEAD = struct.Struct("<QI4x")  # seq + 1 (0 = empty/being written), length
+_U64 = struct.Struct("<Q")
+
+
+class PacketRing:
+    """
+    Handle to a ring segment; create it once (owner) and attach from other processes.
+
+    Use `RingProducer` / `RingConsumer` on top of it.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool) -> None:
+        self._shm = shm
+        self.owner = owner
+        magic, version, capacity, slot_size, max_consumers, _ = _HEADER.unpack_from(shm.buf, 0)
+        if magic != MAGIC or version != LAYOUT_VERSION:
+            raise ValueError(f"shared memory {shm.name!r} is not a PacketRing (layout {version})")
+        self.capacity = capacity
+        self.slot_size = slot_size
+        self.max_consumers = max_consumers
+        self._cursors_offset = _HEADER_SIZE
+        self._slots_offset = _HEADER_SIZE + _CURSOR.size * max_consumers
+        self._stride = _SLOT_HEAD.size + slot_size
+
+    @classmethod
+    def create(
+        cls,
+        name: str | None = None,
+        *,
+        capacity: int = 1024,
+        slot_size: int = 4096,
+        max_consumers: int = 8,
+    ) -> PacketRing:
+        """Create and initialize a new ring segment."""
+        if capacity <= 0 or slot_size <= 0 or max_consumers <= 0:
+            raise ValueError("capacity, slot_size and max_consumers must be > 0")
+        size = (
+            _HEADER_SIZE + _CURSOR.size * max_consumers + (_SLOT_HEAD.size + slot_size) * capacity
+        )
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        shm.buf[:size] = bytes(size)
+        _HEADER.pack_into(shm.buf, 0, MAGIC, LAYOUT_VERSION, capacity, slot_size, max_consumers, 0)
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> PacketRing:
+        """Attach to an existing ring segment by name (does not take ownership)."""
+        # Non-owners must not unlink the segment when they exit: before 3.13 every
+        # attach registers the segment with this process's resource tracker.
+        if sys.version_info >= (3, 13):
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            shm = shared_memory.SharedMemory(name=name)
+            if os.name == "posix":
+                # Registered under the slash-prefixed POSIX name; `name` strips it.
+                resource_tracker.unregister("/" + shm.name, "shared_memory")
+        return cls(shm, owner=False)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def buf(self) -> memoryview:
+        return self._shm.buf
+
+    def write_seq(self) -> int:
+        """Sequence number the producer will assign to the next record."""
+        return _U64.unpack_from(self._shm.buf, _WRITE_SEQ_OFFSET)[0]
+
+    def slot_offset(self, seq: int) -> int:
+        return self._slots_offset + (seq % self.capacity) * self._stride
+
+    def cursor_offset(self, consumer_id: int) -> int:
+        if not 0 <= consumer_id < self.max_consumers:
+            raise ValueError(f"consumer_id must be in [0, {self.max_consumers}), got {consumer_id}")
+        return self._cursors_offset + consumer_id * _CURSOR.size
+
+    def active_cursors(self) -> list[int]:
+        """next_seq of every active consumer."""
+        buf = self._shm.buf
+        out = []
+        for i in range(self.max_consumers):
+            active, next_seq = _CURSOR.unpack_from(buf, self._cursors_offset + i * _CURSOR.size)
+            if active:
+                out.append(next_seq)
+        return out
+
+    def close(self) -> None:
+        """Detach from the segment (unlinks it as well if this handle created it)."""
+        self._shm.close()
+        if self.owner:
+            self._shm.unlink()
+
+    def __enter__(self) -> PacketRing:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+class RingProducer:
+    """
+    Single writer for a PacketRing.
+
+    Args:
+        ring: Ring handle.
+        mode: "overwrite" (never wait) or "block" (wait for active consumers).
+        timeout_s: Maximum wait in "block" mode before TimeoutError.
+    """
+
+    def __init__(self, ring: PacketRing, mode: str = "overwrite", timeout_s: float = 1.0) -> None:
+        if mode not in ("overwrite", "block"):
+            raise ValueError(f"mode must be 'overwrite' or 'block', got {mode!r}")
+        self.ring = ring
+        self.mode = mode
+        self.timeout_s = timeout_s
+
+    def _wait_for_space(self, seq: int) -> None:
+        ring = self.ring
+        deadline = time.monotonic() + self.timeout_s
+        delay = 0.00005
+        while True:
+            cursors = ring.active_cursors()
+            if not cursors or seq - min(cursors) < ring.capacity:
+                return
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"ring full: slowest consumer at {min(cursors)}, writing {seq}")
+            time.sleep(delay)
+            delay = min(delay * 2, 0.005)
+
+    def publish_bytes(self, payload: bytes) -> int:
+        """Append one encoded record; return its sequence number."""
+        ring = self.ring
+        n = len(payload)
+        if n > ring.slot_size:
+            raise ValueError(f"record of {n} bytes exceeds slot_size {ring.slot_size}")
+        seq = ring.write_seq()
+        if self.mode == "block":
+            self._wait_for_space(seq)
+        buf = ring.buf
+        off = ring.slot_offset(seq)
+        _SLOT_HEAD.pack_into(buf, off, 0, n)
+        start = off + _SLOT_HEAD.size
+        buf[start : start + n] = payload
+        _U64.pack_into(buf, off, seq + 1)
+        _U64.pack_into(buf, _WRITE_SEQ_OFFSET, seq + 1)
+        return seq
+
+    def publish(self, packet: PacketLike) -> int:
+        """Encode a packet (JSON line, UTF-8) and append it."""
+        return self.publish_bytes(dumps_packet(packet).encode("utf-8"))
+
+
+class RingConsumer:
+    """
+    Reader with its own cursor slot in the ring.
+
+    Args:
+        ring: Ring handle.
+        consumer_id: Cursor slot in [0, max_consumers); one live consumer per id.
+        start: "latest" (only new records) or "earliest" (oldest record still in the ring).
+    """
+
+    def __init__(self, ring: PacketRing, consumer_id: int, start: str = "latest") -> None:
+        if start not in ("latest", "earliest"):
+            raise ValueError(f"start must be 'latest' or 'earliest', got {start!r}")
+        self.ring = ring
+        self.consumer_id = consumer_id
+        self._cursor_off = ring.cursor_offset(consumer_id)
+        write_seq = ring.write_seq()
+        self.next_seq = write_seq if start == "latest" else max(0, write_seq - ring.capacity)
+        self.dropped = 0
+        _CURSOR.pack_into(ring.buf, self._cursor_off, 1, self.next_seq)
+
+    @property
+    def lag(self) -> int:
+        """Records published but not yet read by this consumer."""
+        return self.ring.write_seq() - self.next_seq
+
+    def _commit(self) -> None:
+        _U64.pack_into(self.ring.buf, self._cursor_off + 8, self.next_seq)
+
+    def poll_bytes(self, max_records: int = 1024) -> list[tuple[int, bytes]]:
+        """Return up to max_records (seq, payload) pairs without waiting."""
+        ring = self.ring
+        buf = ring.buf
+        out: list[tuple[int, bytes]] = []
+        write_seq = ring.write_seq()
+        while self.next_seq < write_seq and len(out) < max_records:
+            seq = self.next_seq
+            oldest = write_seq - ring.capacity
+            if seq < oldest:
+                self.dropped += oldest - seq
+                self.next_seq = oldest
+                continue
+            off = ring.slot_offset(seq)
+            committed, n = _SLOT_HEAD.unpack_from(buf, off)
+            if committed != seq + 1:
+                if committed == 0 or committed < seq + 1:
+                    break  # not yet committed
+                write_seq = ring.write_seq()  # overwritten: resync
+                continue
+            start = off + _SLOT_HEAD.size
+            payload = bytes(buf[start : start + n])
+            if _U64.unpack_from(buf, off)[0] != seq + 1:
+                write_seq = ring.write_seq()  # overwritten while copying
+                continue
+            out.append((seq, payload))
+            self.next_seq = seq + 1
+        self._commit()
+        return out
+
+    def poll(self, max_records: int = 1024) -> list[PacketV2]:
+        """Return up to max_records decoded packets without waiting."""
+        return [loads_packet(payload) for _, payload in self.poll_bytes(max_records)]
+
+    def close(self) -> None:
+        """Release the cursor slot (the producer stops waiting for this consumer)."""
+        _CURSOR.pack_into(self.ring.buf, self._cursor_off, 0, self.next_seq)
@@ -0,0 +1,270 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""SQLite-backed PacketV2 trace store for local analysis (stdlib sqlite3, no server).
+
+Fixed PacketV2 fields are columns; `input`, `external`, `mdm`, `final_action`
+and `mismatch` are JSON text columns (queryable with SQLite's json_extract).
+`final_action["action"]` is copied into an `action` column for indexing.
+
+Ingest uses WAL mode, `synchronous=NORMAL` and `executemany` in one
+transaction per `batch_size` packets. For large initial loads,
+`ingest(..., defer_indexes=True)` drops the secondary indexes and rebuilds them
+once at the end. See docs/TRACE_TOOLING.md for ingest rates
+(tools/bench_sqlite_store.py).
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections.abc import Iterable, Iterator, Mapping
+from pathlib import Path
+from typing import Any
+
+from decision_schema.packet_v2 import PacketV2
+from decision_schema.query import PacketQuery, resolve_sources
+from decision_schema.segments import packet_action
+from decision_schema.trace_io import PacketLike, iter_packet_dicts
+
+STORE_LAYOUT_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS store_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS packets (
+    id INTEGER PRIMARY KEY,
+    schema_version TEXT NOT NULL,
+    run_id TEXT NOT NULL,
+    step INTEGER NOT NULL,
+    action TEXT,
+    latency_ms INTEGER NOT NULL,
+    input TEXT NOT NULL,
+    external TEXT NOT NULL,
+    mdm TEXT NOT NULL,
+    final_action TEXT NOT NULL,
+    mismatch TEXT
+);
+"""
+
+INDEXES = {
+    "idx_packets_run_step": "packets (run_id, step)",
+    "idx_packets_step": "packets (step)",
+    "idx_packets_action": "packets (action)",
+    "idx_packets_latency": "packets (latency_ms)",
+}
+
+_INSERT = (
+    "INSERT INTO packets (schema_version, run_id, step, action, latency_ms,"
+    " input, external, mdm, final_action, mismatch) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+_COLUMNS = "schema_version, run_id, step, latency_ms, input, external, mdm, final_action, mismatch"
+
+
+# One shared encoder: json.dumps(..., separators=...) builds a new encoder per call.
+_json = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+
+def _json_path(key: str) -> str:
+    return "$." + json.dumps(key)  # quoted so dotted keys (exec.attempt_count) stay one step
+
+
+def _row(data: Mapping[str, Any]) -> tuple[Any, ...]:
+    mismatch = data.get("mismatch")
+    return (
+        data.get("schema_version", ""),
+        data["run_id"],
+        data["step"],
+        packet_action(data),
+        data.get("latency_ms", 0),
+        _json(data.get("input", {})),
+        _json(data.get("external", {})),
+        _json(data.get("mdm", {})),
+        _json(data.get("final_action", {})),
+        None if mismatch is None else _json(mismatch),
+    )
+
+
+def _packet_dict(row: tuple[Any, ...]) -> dict[str, Any]:
+    schema_version, run_id, step, latency_ms, input_, external, mdm, final_action, mismatch = row
+    return {
+        "run_id": run_id,
+        "step": step,
+        "input": json.loads(input_),
+        "external": json.loads(external),
+        "mdm": json.loads(mdm),
+        "final_action": json.loads(final_action),
+        "latency_ms": latency_ms,
+        "mismatch": None if mismatch is None else json.loads(mismatch),
+        "schema_version": schema_version,
+    }
+
+
+class TraceStore:
+    """
+    PacketV2 store in one SQLite file.
+
+    Args:
+        path: Database file (created if missing); ":memory:" for tests.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = str(path)
+        self.conn = sqlite3.connect(self.path, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-65536")  # 64 MiB
+        self.conn.executescript(_SCHEMA)
+        row = self.conn.execute("SELECT value FROM store_meta WHERE key = 'layout'").fetchone()
+        if row is None:
+            self.conn.execute(
+                "INSERT INTO store_meta VALUES ('layout', ?)", (str(STORE_LAYOUT_VERSION),)
+            )
+        elif int(row[0]) != STORE_LAYOUT_VERSION:
+            raise ValueError(f"{self.path}: unsupported store layout {row[0]}")
+        self.create_indexes()
+
+    def create_indexes(self) -> None:
+        for name, target in INDEXES.items():
+            self.conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {target}")
+
+    def drop_indexes(self) -> None:
+        for name in INDEXES:
+            self.conn.execute(f"DROP INDEX IF EXISTS {name}")
+
+    def ingest(
+        self,
+        packets: Iterable[PacketLike],
+        *,
+        batch_size: int = 50_000,
+        defer_indexes: bool = False,
+    ) -> int:
+        """
+        Insert packets; return the number inserted.
+
+        Args:
+            packets: PacketV2 instances or packet dicts.
+            batch_size: Packets per transaction (one executemany each).
+            defer_indexes: Drop secondary indexes during the load and rebuild them after.
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be > 0")
+        if defer_indexes:
+            self.drop_indexes()
+        total = 0
+        try:
+            batch: list[tuple[Any, ...]] = []
+            for packet in packets:
+                data = packet.to_dict() if isinstance(packet, PacketV2) else packet
+                batch.append(_row(data))
+                if len(batch) >= batch_size:
+                    total += self._insert(batch)
+                    batch = []
+            if batch:
+                total += self._insert(batch)
+        finally:
+            if defer_indexes:
+                self.create_indexes()
+        return total
+
+    def ingest_files(
+        self,
+        sources: Iterable[str | Path],
+        *,
+        prefix: str = "trace",
+        batch_size: int = 50_000,
+        defer_indexes: bool = False,
+    ) -> int:
+        """Ingest JSONL trace files and/or segment directories (see query.resolve_sources)."""
+
+        def dicts() -> Iterator[dict[str, Any]]:
+            for path in resolve_sources(sources, prefix):
+                yield from iter_packet_dicts(path)
+
+        return self.ingest(dicts(), batch_size=batch_size, defer_indexes=defer_indexes)
+
+    def _insert(self, rows: list[tuple[Any, ...]]) -> int:
+        conn = self.conn
+        conn.execute("BEGIN")
+        try:
+            conn.executemany(_INSERT, rows)
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        return len(rows)
+
+    def _where(self, query: PacketQuery) -> tuple[str, list[Any]]:
+        clauses: list[str] = []
+        params: list[Any] = []
+        if query.run_id is not None:
+            clauses.append("run_id = ?")
+            params.append(query.run_id)
+        if query.min_step is not None:
+            clauses.append("step >= ?")
+            params.append(query.min_step)
+        if query.max_step is not None:
+            clauses.append("step <= ?")
+            params.append(query.max_step)
+        if query.actions is not None:
+            clauses.append(f"action IN ({', '.join('?' * len(query.actions))})")
+            params.extend(sorted(query.actions))
+        if query.min_latency_ms is not None:
+            clauses.append("latency_ms >= ?")
+            params.append(query.min_latency_ms)
+        if query.max_latency_ms is not None:
+            clauses.append("latency_ms <= ?")
+            params.append(query.max_latency_ms)
+        for key, value in query.external.items():
+            # Only scalar values map 1:1 onto json_extract results; the rest is post-filtered.
+            if isinstance(value, (str, int, float)) and not isinstance(value, bool):
+                clauses.append("json_extract(external, ?) = ?")
+                params.extend([_json_path(key), value])
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def query(
+        self, query: PacketQuery | None = None, *, limit: int | None = None
+    ) -> Iterator[dict]:
+        """
+        Yield matching packet dicts ordered by (run_id, step).
+
+        Fixed-field predicates run in SQL (indexed); `external` constraints are
+        pushed down for scalar values and always re-checked with `query.matches`.
+        """
+        query = query or PacketQuery()
+        where, params = self._where(query)
+        sql = f"SELECT {_COLUMNS} FROM packets{where} ORDER BY run_id, step, id"
+        exact = bool(query.external)
+        emitted = 0
+        for row in self.conn.execute(sql, params):
+            data = _packet_dict(row)
+            if exact and not query.matches(data):
+                continue
+            yield data
+            emitted += 1
+            if limit is not None and emitted >= limit:
+                return
+
+    def count(self, query: PacketQuery | None = None) -> int:
+        """Number of matching packets."""
+        query = query or PacketQuery()
+        if query.external:
+            return sum(1 for _ in self.query(query))
+        where, params = self._where(query)
+        return self.conn.execute(f"SELECT COUNT(*) FROM packets{where}", params).fetchone()[0]
+
+    def run_ids(self) -> list[str]:
+        return [r[0] for r in self.conn.execute("SELECT DISTINCT run_id FROM packets ORDER BY 1")]
+
+    def execute(self, sql: str, params: Iterable[Any] = ()) -> sqlite3.Cursor:
+        """Run ad-hoc SQL (e.g. json_extract over external) against the store."""
+        return self.conn.execute(sql, tuple(params))
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> TraceStore:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
@@ -0,0 +1,483 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Local socket streaming of PacketV2 between decision workers and subscribers.
+
+Transport: Unix-domain socket (address is a filesystem path) or TCP (address is
+a `(host, port)` tuple). Every message is a frame:
+
+    u32 body length (big-endian) | u8 kind | body
+
+Kinds:
+- HELLO (JSON): first frame of every connection; `{"role": "publish"}` or
+  `{"role": "subscribe", "run_id_prefix": ..., "actions": [...], "resume_after": [run_id, step]}`
+- BATCH: packets as JSON lines (trace_io encoding), one or more per frame
+
+Publishers batch client-side by count (`max_batch`) or latency budget
+(`max_delay_ms`). The server keeps a bounded backlog; a subscriber that
+reconnects with `resume_after` receives everything published after that
+`(run_id, step)` (or the whole backlog if it has expired). Delivery is
+at-least-once: packets received but not acknowledged are delivered again.
+
+Lines that are not packet JSON with a str `run_id` and an int `step` are
+skipped and counted in `PacketStreamServer.bad_lines`; the publisher
+connection stays open.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import select
+import socket
+import socketserver
+import stat
+import struct
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from decision_schema.packet_v2 import PacketV2
+from decision_schema.segments import packet_action
+from decision_schema.trace_io import PacketLike, dumps_packet
+
+Address = str | tuple[str, int]
+
+FRAME_HELLO = 1
+FRAME_BATCH = 2
+MAX_FRAME_BYTES = 64 * 1024 * 1024
+
+_FRAME_HEAD = struct.Struct(">IB")
+
+
+def _recv_exact(sock: socket.socket, n: int) -> bytes:
+    chunks = []
+    while n:
+        chunk = sock.recv(min(n, 1 << 20))
+        if not chunk:
+            raise ConnectionError("connection closed")
+        chunks.append(chunk)
+        n -= len(chunk)
+    return b"".join(chunks)
+
+
+def send_frame(sock: socket.socket, kind: int, body: bytes) -> None:
+    """Write one frame."""
+    if len(body) > MAX_FRAME_BYTES:
+        raise ValueError(f"frame of {len(body)} bytes exceeds MAX_FRAME_BYTES")
+    sock.sendall(_FRAME_HEAD.pack(len(body), kind) + body)
+
+
+def recv_frame(sock: socket.socket) -> tuple[int, bytes]:
+    """Read one frame; raises ConnectionError on EOF."""
+    length, kind = _FRAME_HEAD.unpack(_recv_exact(sock, _FRAME_HEAD.size))
+    if length > MAX_FRAME_BYTES:
+        raise ValueError(f"frame of {length} bytes exceeds MAX_FRAME_BYTES")
+    return kind, _recv_exact(sock, length)
+
+
+def _connect(address: Address, timeout_s: float) -> socket.socket:
+    if isinstance(address, str):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    else:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.settimeout(timeout_s)
+    try:
+        sock.connect(address)
+    except OSError:
+        sock.close()
+        raise
+    sock.settimeout(None)
+    return sock
+
+
+class _Entry:
+    __slots__ = ("run_id", "step", "action", "line")
+
+    def __init__(self, run_id: str, step: int, action: str | None, line: bytes) -> None:
+        self.run_id = run_id
+        self.step = step
+        self.action = action
+        self.line = line
+
+
+class _Handler(socketserver.BaseRequestHandler):
+    server: Any
+
+    def handle(self) -> None:
+        broker: PacketStreamServer = self.server.broker
+        try:
+            kind, body = recv_frame(self.request)
+            if kind != FRAME_HELLO:
+                return
+            hello = json.loads(body)
+            if not isinstance(hello, dict):
+                return
+            if hello.get("role") == "publish":
+                broker._serve_publisher(self.request)
+            elif hello.get("role") == "subscribe":
+                broker._serve_subscriber(self.request, hello)
+        except (ConnectionError, OSError, ValueError):
+            return
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+    block_on_close = False
+
+
+class _TCPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    block_on_close = False
+    allow_reuse_address = True
+
+
+class PacketStreamServer:
+    """
+    Broker between publishers and subscribers on one host.
+
+    Args:
+        address: Unix socket path, or `(host, port)` for TCP (port 0 picks a free port).
+        backlog_size: Packets kept in memory for late or reconnecting subscribers.
+        max_batch: Maximum packets per BATCH frame sent to a subscriber.
+
+    Attributes:
+        bad_lines: Published lines skipped as malformed.
+    """
+
+    def __init__(self, address: Address, *, backlog_size: int = 100_000, max_batch: int = 512):
+        if isinstance(address, str):
+            try:
+                if stat.S_ISSOCK(os.stat(address).st_mode):
+                    os.unlink(address)
+            except FileNotFoundError:
+                pass
+            self._server: socketserver.BaseServer = _UnixServer(address, _Handler)
+        else:
+            self._server = _TCPServer(address, _Handler)
+        self._server.broker = self  # type: ignore[attr-defined]
+        self.backlog_size = backlog_size
+        self.max_batch = max_batch
+        self._entries: dict[int, _Entry] = {}
+        self._index: dict[tuple[str, int], int] = {}
+        self._first_seq = 0
+        self._next_seq = 0
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._thread: threading.Thread | None = None
+        self._conns: set[socket.socket] = set()
+        self.bad_lines = 0
+
+    @property
+    def address(self) -> Address:
+        """Bound address (with the assigned port for TCP)."""
+        return self._server.server_address  # type: ignore[return-value]
+
+    def start(self) -> PacketStreamServer:
+        """Serve in a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and drop all connections."""
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+            conns = list(self._conns)
+        for conn in conns:
+            try:
+                conn.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        self._server.shutdown()
+        self._server.server_close()
+        if isinstance(self.address, str):
+            try:
+                os.unlink(self.address)
+            except OSError:
+                pass
+
+    def __enter__(self) -> PacketStreamServer:
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+    def append_lines(self, lines: Iterable[bytes]) -> None:
+        """
+        Add encoded packet lines to the backlog and wake subscribers.
+
+        Lines that are not JSON objects with a str run_id and an int step are
+        skipped and counted in `bad_lines`.
+        """
+        with self._cond:
+            for line in lines:
+                try:
+                    data = json.loads(line)
+                except ValueError:
+                    self.bad_lines += 1
+                    continue
+                if not isinstance(data, dict):
+                    self.bad_lines += 1
+                    continue
+                run_id, step = data.get("run_id"), data.get("step")
+                if not isinstance(run_id, str) or type(step) is not int:
+                    self.bad_lines += 1
+                    continue
+                seq = self._next_seq
+                self._entries[seq] = _Entry(run_id, step, packet_action(data), line)
+                self._index[(run_id, step)] = seq
+                self._next_seq += 1
+                while self._next_seq - self._first_seq > self.backlog_size:
+                    old = self._entries.pop(self._first_seq)
+                    if self._index.get((old.run_id, old.step)) == self._first_seq:
+                        del self._index[(old.run_id, old.step)]
+                    self._first_seq += 1
+            self._cond.notify_all()
+
+    def _track(self, conn: socket.socket, add: bool) -> None:
+        with self._cond:
+            if add:
+                self._conns.add(conn)
+            else:
+                self._conns.discard(conn)
+
+    def _serve_publisher(self, conn: socket.socket) -> None:
+        self._track(conn, True)
+        try:
+            while not self._stopped:
+                kind, body = recv_frame(conn)
+                if kind == FRAME_BATCH:
+                    self.append_lines(line for line in body.split(b"\n") if line)
+        finally:
+            self._track(conn, False)
+
+    def _serve_subscriber(self, conn: socket.socket, hello: dict[str, Any]) -> None:
+        prefix = hello.get("run_id_prefix") or ""
+        actions = hello.get("actions")
+        resume = hello.get("resume_after")
+        if (
+            not isinstance(prefix, str)
+            or not (actions is None or isinstance(actions, list))
+            or not (resume is None or (isinstance(resume, list) and len(resume) == 2))
+        ):
+            return
+        actions = frozenset(a for a in actions if isinstance(a, str)) if actions else None
+        self._track(conn, True)
+        try:
+            with self._cond:
+                pos = self._first_seq
+                if resume is not None and isinstance(resume[0], str) and type(resume[1]) is int:
+                    seq = self._index.get((resume[0], resume[1]))
+                    if seq is not None:
+                        pos = seq + 1
+            while True:
+                with self._cond:
+                    while pos >= self._next_seq and not self._stopped:
+                        self._cond.wait(0.5)
+                    if self._stopped:
+                        return
+                    pos = max(pos, self._first_seq)
+                    end = min(self._next_seq, pos + self.max_batch)
+                    batch = [self._entries[s] for s in range(pos, end)]
+                    pos = end
+                lines = [
+                    e.line
+                    for e in batch
+                    if e.run_id.startswith(prefix) and (actions is None or e.action in actions)
+                ]
+                if lines:
+                    send_frame(conn, FRAME_BATCH, b"\n".join(lines))
+        finally:
+            self._track(conn, False)
+
+
+class PacketPublisher:
+    """
+    Client that streams packets to a PacketStreamServer with client-side batching.
+
+    A batch is sent when it reaches `max_batch` packets or when its oldest packet
+    has waited `max_delay_ms` (checked by a background flusher thread).
+    """
+
+    def __init__(
+        self,
+        address: Address,
+        *,
+        max_batch: int = 256,
+        max_delay_ms: float = 5.0,
+        connect_timeout_s: float = 5.0,
+    ) -> None:
+        self.max_batch = max_batch
+        self.max_delay_s = max_delay_ms / 1000.0
+        self._sock = _connect(address, connect_timeout_s)
+        send_frame(self._sock, FRAME_HELLO, json.dumps({"role": "publish"}).encode())
+        self._lines: list[bytes] = []
+        self._oldest = 0.0
+        self._lock = threading.Condition()
+        self._closed = False
+        self.sent_batches = 0
+        self._flusher = threading.Thread(target=self._flush_loop, daemon=True)
+        self._flusher.start()
+
+    def publish(self, packet: PacketLike) -> None:
+        """Queue one packet; sends immediately if the batch is full."""
+        line = dumps_packet(packet).encode("utf-8")
+        with self._lock:
+            if not self._lines:
+                self._oldest = time.monotonic()
+                self._lock.notify()
+            self._lines.append(line)
+            if len(self._lines) >= self.max_batch:
+                self._send_locked()
+
+    def flush(self) -> None:
+        """Send any queued packets now; on a send error they stay queued and it propagates."""
+        with self._lock:
+            self._send_locked()
+
+    def _send_locked(self) -> None:
+        if not self._lines:
+            return
+        send_frame(self._sock, FRAME_BATCH, b"\n".join(self._lines))
+        self._lines = []  # only once sent: a failed send keeps the batch queued
+        self.sent_batches += 1
+
+    def _flush_loop(self) -> None:
+        with self._lock:
+            while not self._closed:
+                if not self._lines:
+                    self._lock.wait()
+                    continue
+                remaining = self._oldest + self.max_delay_s - time.monotonic()
+                if remaining > 0:
+                    self._lock.wait(remaining)
+                    continue
+                try:
+                    self._send_locked()
+                except OSError:
+                    return
+
+    def close(self) -> None:
+        """Flush and disconnect."""
+        with self._lock:
+            try:
+                self._send_locked()
+            finally:
+                self._closed = True
+                self._lock.notify_all()
+        self._sock.close()
+
+    def __enter__(self) -> PacketPublisher:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+class PacketSubscriber:
+    """
+    Client receiving packets from a PacketStreamServer.
+
+    Filtering (`run_id_prefix`, `actions`) happens on the server. Call `ack(packet)`
+    after processing; on reconnect the subscription resumes after the last
+    acknowledged `(run_id, step)`.
+
+    Args:
+        address: Server address.
+        run_id_prefix: Only packets whose run_id starts with this prefix.
+        actions: Only packets whose final_action action is in this set.
+        resume_after: Initial resume point `(run_id, step)`.
+        reconnect: Reconnect (and resume) when the connection drops.
+        retry_delay_s: Delay between reconnect attempts.
+    """
+
+    def __init__(
+        self,
+        address: Address,
+        *,
+        run_id_prefix: str | None = None,
+        actions: Iterable[str] | None = None,
+        resume_after: tuple[str, int] | None = None,
+        reconnect: bool = True,
+        retry_delay_s: float = 0.1,
+        connect_timeout_s: float = 5.0,
+    ) -> None:
+        self.address = address
+        self.run_id_prefix = run_id_prefix
+        self.actions = sorted(actions) if actions is not None else None
+        self.last_acked = resume_after
+        self.reconnect = reconnect
+        self.retry_delay_s = retry_delay_s
+        self.connect_timeout_s = connect_timeout_s
+        self.reconnects = 0
+        self._sock: socket.socket | None = None
+
+    def _ensure_connected(self) -> socket.socket:
+        if self._sock is None:
+            sock = _connect(self.address, self.connect_timeout_s)
+            hello = {
+                "role": "subscribe",
+                "run_id_prefix": self.run_id_prefix,
+                "actions": self.actions,
+                "resume_after": list(self.last_acked) if self.last_acked else None,
+            }
+            send_frame(sock, FRAME_HELLO, json.dumps(hello).encode())
+            self._sock = sock
+        return self._sock
+
+    def _drop(self) -> None:
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def recv_batch(self, timeout_s: float | None = None) -> list[PacketV2]:
+        """
+        Return the next batch of packets (empty list on timeout).
+
+        Raises:
+            ConnectionError: If the connection drops and `reconnect` is False.
+        """
+        deadline = None if timeout_s is None else time.monotonic() + timeout_s
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                sock = self._ensure_connected()
+                if remaining is not None and not select.select([sock], [], [], remaining)[0]:
+                    return []
+                kind, body = recv_frame(sock)
+            except OSError as e:
+                self._drop()
+                if not self.reconnect:
+                    raise ConnectionError(str(e)) from e
+                if deadline is not None and time.monotonic() >= deadline:
+                    return []
+                self.reconnects += 1
+                time.sleep(self.retry_delay_s)
+                continue
+            if kind != FRAME_BATCH:
+                continue
+            return [PacketV2.from_dict(json.loads(line)) for line in body.split(b"\n") if line]
+
+    def ack(self, packet: PacketV2) -> None:
+        """Mark packet (and everything delivered before it) as processed."""
+        self.last_acked = (packet.run_id, packet.step)
+
+    def __iter__(self) -> Iterator[PacketV2]:
+        """Yield packets forever, acknowledging each one when the next is requested."""
+        while True:
+            for packet in self.recv_batch():
+                yield packet
+                self.ack(packet)
+
+    def close(self) -> None:
+        self._drop()
+
+    def __enter__(self) -> PacketSubscriber:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
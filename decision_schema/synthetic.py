@@ -0,0 +1,329 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Deterministic synthetic Proposal / FinalDecision / MismatchInfo / PacketV2 data.
+
+For load and scale tests without real traces. Everything derives from
+`SyntheticConfig.seed`: the same config always yields the same packets.
+
+Payloads (`input`, `mdm`, `final_action`, `mismatch`, trace keys in
+`external`) are drawn from pools built once per generator, sized by
+`pool_size`; per packet only run_id, step, `now_ms`, latency and pool choices
+are drawn. `write_jsonl` assembles lines from pre-encoded pool fragments, so
+writing costs roughly one string join per packet.
+
+Usage:
+    gen = SyntheticGenerator(SyntheticConfig(runs=100, steps_per_run=10_000, seed=7))
+    gen.write_jsonl("fixture.jsonl")          # 1M packets
+    for packet in gen.packets(): ...
+"""
+
+from __future__ import annotations
+
+import json
+import random
+from collections.abc import Callable, Iterator
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from decision_schema.context import CONTEXT_KEYS
+from decision_schema.packet_v2 import PacketV2
+from decision_schema.trace_registry import EXTERNAL_KEY_REGISTRY, registry_snapshot
+from decision_schema.types import Action, FinalDecision, MismatchInfo, Proposal
+from decision_schema.version import __version__
+
+DEFAULT_CONTEXT_KEYS = ("now_ms", "ops_state", "ops_deny_actions", "errors_in_window")
+DEFAULT_TRACE_KEYS = tuple(
+    sorted(k for k in EXTERNAL_KEY_REGISTRY if k.startswith(("exec.", "harness.")))
+)
+DEFAULT_ACTION_WEIGHTS = {
+    Action.HOLD: 0.6,
+    Action.ACT: 0.3,
+    Action.EXIT: 0.05,
+    Action.CANCEL: 0.03,
+    Action.STOP: 0.02,
+}
+
+_FLAGS = tuple(f"guard_{i}" for i in range(16))
+_REASONS = tuple(f"reason_{i}" for i in range(32))
+_OPS_STATES = ("GREEN", "GREEN", "GREEN", "YELLOW", "RED")
+
+_json = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+_T0_MS = 1_700_000_000_000
+# Context key -> value for (run_id, step); deterministic so runs are comparable.
+_CONTEXT_VALUES: dict[str, Callable[[str, int], Any]] = {
+    "now_ms": lambda run_id, step: _T0_MS + step * 100,
+    "last_event_ts_ms": lambda run_id, step: _T0_MS + step * 100 - 5,
+    "run_id": lambda run_id, step: run_id,
+    "fail_closed": lambda run_id, step: False,
+    "ops_deny_actions": lambda run_id, step: False,
+    "ops_state": lambda run_id, step: _OPS_STATES[step % len(_OPS_STATES)],
+    "ops_cooldown_until_ms": lambda run_id, step: 0,
+    "errors_in_window": lambda run_id, step: 1 if step % 7 == 0 else 0,
+    "steps_in_window": lambda run_id, step: min(step, 100),
+    "rate_limit_events": lambda run_id, step: 0,
+    "recent_failures": lambda run_id, step: 0,
+    "cooldown_until_ms": lambda run_id, step: 0,
+}
+
+
+@dataclass(frozen=True)
+class SyntheticConfig:
+    """
+    Generator settings.
+
+    Args:
+        runs: Number of run_ids.
+        steps_per_run: Steps per run (0..steps_per_run-1).
+        seed: Seed for all randomness.
+        run_id_prefix: run_id is f"{prefix}-{index:06d}".
+        interleave: Emit steps round-robin across runs (like concurrent workers)
+            instead of run by run.
+        context_keys: Context keys (PARAMETER_INDEX) included in external.
+        trace_keys: Registered trace keys to draw from for external.
+        trace_key_rate: Probability that each trace key is present in a pooled external mix.
+        payload_items: (min, max) number of input/params items (uniform).
+        payload_value_bytes: (min, max) length of string payload values (uniform).
+        mismatch_rate: Fraction of steps that are denied with a MismatchInfo.
+        action_weights: Relative frequency of proposed actions.
+        latency_ms: (mean, max) of the exponential-ish step latency distribution.
+        pool_size: Distinct payload variants per pool.
+    """
+
+    runs: int = 10
+    steps_per_run: int = 1000
+    seed: int = 0
+    run_id_prefix: str = "run"
+    interleave: bool = False
+    context_keys: tuple[str, ...] = DEFAULT_CONTEXT_KEYS
+    trace_keys: tuple[str, ...] = DEFAULT_TRACE_KEYS
+    trace_key_rate: float = 0.5
+    payload_items: tuple[int, int] = (2, 8)
+    payload_value_bytes: tuple[int, int] = (4, 32)
+    mismatch_rate: float = 0.05
+    action_weights: dict[Action, float] = field(
+        default_factory=lambda: dict(DEFAULT_ACTION_WEIGHTS)
+    )
+    latency_ms: tuple[float, int] = (8.0, 500)
+    pool_size: int = 256
+
+    def __post_init__(self) -> None:
+        unknown = set(self.context_keys) - set(CONTEXT_KEYS)  # same set as _CONTEXT_VALUES
+        if unknown:
+            raise ValueError(f"context_keys not in PARAMETER_INDEX: {sorted(unknown)}")
+        unregistered = set(self.trace_keys) - registry_snapshot().keys
+        if unregistered:
+            raise ValueError(f"trace_keys not registered: {sorted(unregistered)}")
+        if not 0.0 <= self.mismatch_rate <= 1.0 or not 0.0 <= self.trace_key_rate <= 1.0:
+            raise ValueError("mismatch_rate and trace_key_rate must be in [0.0, 1.0]")
+        if self.runs < 0 or self.steps_per_run < 0 or self.pool_size <= 0:
+            raise ValueError("runs and steps_per_run must be >= 0 and pool_size > 0")
+
+
+def _proposal_dict(p: Proposal) -> dict[str, Any]:
+    return {
+        "action": p.action.value,
+        "confidence": p.confidence,
+        "reasons": p.reasons,
+        "params": p.params,
+    }
+
+
+def _decision_dict(d: FinalDecision) -> dict[str, Any]:
+    return {"action": d.action.value, "allowed": d.allowed, "reasons": d.reasons}
+
+
+class SyntheticGenerator:
+    """Seeded generator of contract objects, packets and JSONL traces."""
+
+    def __init__(self, config: SyntheticConfig | None = None) -> None:
+        self.config = config or SyntheticConfig()
+        self.rng = random.Random(self.config.seed)
+        self._actions = list(self.config.action_weights)
+        self._weights = list(self.config.action_weights.values())
+        self._build_pools()
+
+    # -- contract objects -------------------------------------------------
+
+    def _text(self) -> str:
+        lo, hi = self.config.payload_value_bytes
+        n = self.rng.randint(lo, hi)
+        return "".join(self.rng.choices("abcdefghijklmnopqrstuvwxyz0123456789", k=n))
+
+    def _items(self, prefix: str) -> dict[str, Any]:
+        lo, hi = self.config.payload_items
+        out: dict[str, Any] = {}
+        for i in range(self.rng.randint(lo, hi)):
+            kind = self.rng.random()
+            if kind < 0.4:
+                value: Any = self._text()
+            elif kind < 0.7:
+                value = self.rng.randint(0, 1_000_000)
+            elif kind < 0.9:
+                value = round(self.rng.random(), 6)
+            else:
+                value = self.rng.random() < 0.5
+            out[f"{prefix}{i}"] = value
+        return out
+
+    def proposal(self) -> Proposal:
+        action = self.rng.choices(self._actions, self._weights)[0]
+        return Proposal(
+            action=action,
+            confidence=round(self.rng.random(), 4),
+            reasons=self.rng.sample(_REASONS, self.rng.randint(1, 3)),
+            params={f"synthetic:{k}": v for k, v in self._items("param_").items()},
+        )
+
+    def mismatch_info(self) -> MismatchInfo:
+        return MismatchInfo(
+            flags=sorted(self.rng.sample(_FLAGS, self.rng.randint(1, 3))),
+            reason_codes=self.rng.sample(_REASONS, self.rng.randint(1, 2)),
+            throttle_refresh_ms=self.rng.choice((None, 1000, 5000)),
+        )
+
+    def final_decision(self, proposal: Proposal, denied: bool = False) -> FinalDecision:
+        if not denied:
+            return FinalDecision(
+                action=proposal.action, allowed=True, reasons=list(proposal.reasons)
+            )
+        mismatch = self.mismatch_info()
+        return FinalDecision(
+            action=Action.HOLD,
+            allowed=False,
+            reasons=list(mismatch.reason_codes),
+            mismatch=mismatch,
+            cooldown_ms=self.rng.choice((None, 1000)),
+        )
+
+    # -- pools ------------------------------------------------------------
+
+    def _build_pools(self) -> None:
+        cfg = self.config
+        n = cfg.pool_size
+        self._inputs = [self._items("field_") for _ in range(n)]
+        self._trace_mixes = [
+            {
+                k: self.rng.randint(0, 50)
+                if k.endswith("_count")
+                else (self.rng.random() < 0.01 if k.endswith("fail_closed") else self._latency())
+                for k in cfg.trace_keys
+                if self.rng.random() < cfg.trace_key_rate
+            }
+            for _ in range(n)
+        ]
+        self._outcomes = []  # (mdm, final_action, mismatch) for allowed steps
+        self._denied = []  # same for denied steps
+        for _ in range(n):
+            p = self.proposal()
+            self._outcomes.append((_proposal_dict(p), _decision_dict(self.final_decision(p)), None))
+            d = self.final_decision(p, denied=True)
+            mismatch = asdict(d.mismatch) if d.mismatch is not None else None
+            self._denied.append((_proposal_dict(p), _decision_dict(d), mismatch))
+        # Pre-encoded fragments for write_jsonl.
+        self._inputs_json = [_json(x) for x in self._inputs]
+        self._trace_json = [_json(x)[1:-1] for x in self._trace_mixes]
+        self._outcomes_json = [self._encode_outcome(o) for o in self._outcomes]
+        self._denied_json = [self._encode_outcome(o) for o in self._denied]
+        # Per-packet draws use their own stream so every iteration method yields the same data.
+        self._packet_seed = self.rng.getrandbits(64)
+        self._context_fns = [(k, _CONTEXT_VALUES[k]) for k in cfg.context_keys]
+
+    @staticmethod
+    def _encode_outcome(outcome: tuple[Any, Any, Any]) -> tuple[str, str, str]:
+        mdm, final_action, mismatch = outcome
+        return _json(mdm), _json(final_action), _json(mismatch)
+
+    def _latency(self, rng: random.Random | None = None) -> float:
+        mean, cap = self.config.latency_ms
+        rng = rng or self.rng
+        return min(cap, round(rng.expovariate(1.0 / mean), 3)) if mean > 0 else 0.0
+
+    # -- packets ----------------------------------------------------------
+
+    def _schedule(self) -> Iterator[tuple[str, int]]:
+        cfg = self.config
+        run_ids = [f"{cfg.run_id_prefix}-{i:06d}" for i in range(cfg.runs)]
+        if cfg.interleave:
+            for step in range(cfg.steps_per_run):
+                for run_id in run_ids:
+                    yield run_id, step
+        else:
+            for run_id in run_ids:
+                for step in range(cfg.steps_per_run):
+                    yield run_id, step
+
+    def _draws(self) -> Iterator[tuple[str, int, dict[str, Any], int, int, bool, int]]:
+        # (run_id, step, context, outcome/input index, trace mix index, denied, latency)
+        rng = random.Random(self._packet_seed)
+        n = self.config.pool_size
+        rate = self.config.mismatch_rate
+        fns = self._context_fns
+        for run_id, step in self._schedule():
+            context = {k: fn(run_id, step) for k, fn in fns}
+            i, t = rng.randrange(n), rng.randrange(n)
+            yield run_id, step, context, i, t, rng.random() < rate, round(self._latency(rng))
+
+    def packet_dicts(self) -> Iterator[dict[str, Any]]:
+        """Yield packet dicts in PacketV2.to_dict() layout (pooled payloads are shared)."""
+        for run_id, step, context, i, t, denied, latency in self._draws():
+            external = {**context, **self._trace_mixes[t]}
+            mdm, final_action, mismatch = (self._denied if denied else self._outcomes)[i]
+            yield {
+                "run_id": run_id,
+                "step": step,
+                "input": self._inputs[i],
+                "external": external,
+                "mdm": mdm,
+                "final_action": final_action,
+                "latency_ms": latency,
+                "mismatch": mismatch,
+                "schema_version": __version__,
+            }
+
+    def packets(self) -> Iterator[PacketV2]:
+        """Yield PacketV2 objects (independent copies of pooled payloads)."""
+        for data in self.packet_dicts():
+            yield PacketV2.from_dict(json.loads(_json(data)))
+
+    def jsonl_lines(self) -> Iterator[str]:
+        """Yield encoded JSON lines (with newline); same data as packet_dicts()."""
+        version = _json(__version__)
+        for run_id, step, context, i, t, denied, latency in self._draws():
+            ext = _json(context)[1:-1]
+            trace = self._trace_json[t]
+            if ext and trace:
+                ext += ","
+            mdm, final_action, mismatch = (self._denied_json if denied else self._outcomes_json)[i]
+            yield (
+                f'{{"run_id":{_json(run_id)},"step":{step},"input":{self._inputs_json[i]},'
+                f'"external":{{{ext}{trace}}},"mdm":{mdm},"final_action":{final_action},'
+                f'"latency_ms":{latency},"mismatch":{mismatch},"schema_version":{version}}}\n'
+            )
+
+    def write_jsonl(self, path: str | Path) -> int:
+        """Write the trace to path; return the number of packets."""
+        n = 0
+        with open(path, "w", encoding="utf-8") as f:
+            buf: list[str] = []
+            for line in self.jsonl_lines():
+                buf.append(line)
+                if len(buf) >= 4096:
+                    f.write("".join(buf))
+                    n += len(buf)
+                    buf = []
+            f.write("".join(buf))
+            n += len(buf)
+        return n
+
+
+def generate_packets(config: SyntheticConfig | None = None) -> Iterator[PacketV2]:
+    """Shortcut for SyntheticGenerator(config).packets()."""
+    return SyntheticGenerator(config).packets()
+
+
+def write_synthetic_trace(path: str | Path, config: SyntheticConfig | None = None) -> int:
+    """Shortcut for SyntheticGenerator(config).write_jsonl(path)."""
+    return SyntheticGenerator(config).write_jsonl(path)
@@ -0,0 +1,237 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Multi-term scanning with word-boundary semantics (INVARIANT 0 at runtime).
+
+`TermScanner` compiles a term list into an Aho-Corasick automaton (trie plus
+failure links, flattened into one transition dict per state), so a text is
+scanned once regardless of how many terms there are. A match counts only at
+word boundaries, with the same meaning as regex `\\b` (word characters are
+alphanumerics and `_`), and matching is case-insensitive by default.
+
+`scan_packets` streams packets and reports every emitted string that contains
+a term: `reasons`, `mismatch` flags / reason codes, `params` keys and
+`external` keys, as `(run_id, step, field, term, text)`. Those strings repeat
+across steps, so verdicts are cached per distinct string (bounded) and a warmed
+scan costs about one dict lookup per string.
+
+The package ships no term list: its own sources must stay free of domain terms
+(tests/test_invariant_0_domain_agnosticism.py owns the CI list). Pass terms
+explicitly or from a file.
+
+CLI:
+    python -m decision_schema.term_scan --terms-file terms.txt trace_dir/   # exit 1 on hits
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from decision_schema.query import resolve_sources
+from decision_schema.trace_io import iter_packet_dicts
+
+_NO_TERMS: tuple[str, ...] = ()
+
+
+def _is_word(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+def _boundary(text: str, pos: int) -> bool:
+    # regex \b: a word character on exactly one side of pos.
+    before = pos > 0 and _is_word(text[pos - 1])
+    after = pos < len(text) and _is_word(text[pos])
+    return before != after
+
+
+class TermScanner:
+    """
+    Aho-Corasick scanner for a fixed term set.
+
+    Args:
+        terms: Terms to find (empty strings are ignored).
+        case_sensitive: Match case exactly (default: terms and text are lowercased).
+        cache_size: Distinct strings whose verdict `terms_in` caches.
+    """
+
+    def __init__(
+        self, terms: Iterable[str], *, case_sensitive: bool = False, cache_size: int = 65_536
+    ) -> None:
+        self.case_sensitive = case_sensitive
+        self.terms = frozenset(t if case_sensitive else t.lower() for t in terms if t)
+        self.cache_size = cache_size
+        self._cache: dict[str, tuple[str, ...]] = {}
+        self._build()
+
+    def _build(self) -> None:
+        goto: list[dict[str, int]] = [{}]
+        out: list[tuple[str, ...]] = [()]
+        for term in sorted(self.terms):
+            state = 0
+            for ch in term:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    out.append(())
+                state = nxt
+            out[state] += (term,)
+        # Breadth-first: failure links, inherited outputs and the full transition table
+        # (delta[s] = delta[fail[s]] overridden by s's own edges; missing char -> root).
+        fail = [0] * len(goto)
+        delta: list[dict[str, int]] = [dict(goto[0])] + [{} for _ in goto[1:]]
+        queue = list(goto[0].values())
+        for state in queue:
+            delta[state] = {**delta[fail[state]], **goto[state]}
+            for ch, child in goto[state].items():
+                fail[child] = delta[fail[state]].get(ch, 0)
+                out[child] += out[fail[child]]
+                queue.append(child)
+        self._delta = delta
+        self._out = out
+
+    def find(self, text: str) -> list[tuple[int, int, str]]:
+        """All (start, end, term) occurrences at word boundaries, overlaps included."""
+        if not self.case_sensitive:
+            text = text.lower()
+        delta, out = self._delta, self._out
+        hits = []
+        state = 0
+        for i, ch in enumerate(text):
+            state = delta[state].get(ch, 0)
+            if out[state]:
+                end = i + 1
+                for term in out[state]:
+                    start = end - len(term)
+                    if _boundary(text, start) and _boundary(text, end):
+                        hits.append((start, end, term))
+        return hits
+
+    def terms_in(self, text: str) -> tuple[str, ...]:
+        """Distinct terms found in text (sorted); cached per text."""
+        found = self._cache.get(text)
+        if found is None:
+            hits = self.find(text)
+            found = tuple(sorted({term for _, _, term in hits})) if hits else _NO_TERMS
+            if len(self._cache) < self.cache_size:
+                self._cache[text] = found
+        return found
+
+    def scan_lines(self, lines: Iterable[str]) -> Iterator[tuple[int, str, str]]:
+        """(line_number, term, line) per term found, line numbers from 1."""
+        for line_num, line in enumerate(lines, start=1):
+            for term in sorted({term for _, _, term in self.find(line)}):
+                yield line_num, term, line
+
+
+@dataclass(frozen=True, slots=True)
+class TermHit:
+    """One emitted string containing a scanned term."""
+
+    run_id: Any
+    step: Any
+    field: str  # e.g. "mdm.reasons", "final_action.params", "external"
+    term: str
+    text: str
+
+
+# (section, sub-field, what) scanned per packet: "items" = list entries, "keys" = dict keys.
+_SCANNED = (
+    ("mdm", "reasons", "items"),
+    ("mdm", "params", "keys"),
+    ("final_action", "reasons", "items"),
+    ("final_action", "params", "keys"),
+    ("mismatch", "flags", "items"),
+    ("mismatch", "reason_codes", "items"),
+    ("external", None, "keys"),
+)
+
+
+def _strings(packet: Mapping[str, Any] | Any) -> Iterator[tuple[str, str]]:
+    get = packet.get if isinstance(packet, Mapping) else lambda k: getattr(packet, k, None)
+    for section, sub, what in _SCANNED:
+        value = get(section)
+        if sub is not None:
+            value = value.get(sub) if isinstance(value, Mapping) else None
+        if value is None:
+            continue
+        name = section if sub is None else f"{section}.{sub}"
+        if what == "keys":
+            if isinstance(value, Mapping):
+                for key in value:
+                    if isinstance(key, str):
+                        yield name, key
+        elif isinstance(value, (list, tuple)):
+            for item in value:
+                if isinstance(item, str):
+                    yield name, item
+
+
+def scan_packets(packets: Iterable[Any], scanner: TermScanner) -> Iterator[TermHit]:
+    """Stream hits over PacketV2 objects or packet dicts."""
+    terms_in = scanner.terms_in
+    for packet in packets:
+        hits = [(name, text, terms_in(text)) for name, text in _strings(packet)]
+        if not any(found for _, _, found in hits):
+            continue
+        if isinstance(packet, Mapping):
+            run_id, step = packet.get("run_id"), packet.get("step")
+        else:
+            run_id, step = getattr(packet, "run_id", None), getattr(packet, "step", None)
+        for name, text, found in hits:
+            for term in found:
+                yield TermHit(run_id, step, name, term, text)
+
+
+def load_terms(path: str | Path) -> list[str]:
+    """One term per line; blank lines and `#` comments are skipped."""
+    terms = []
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if line and not line.startswith("#"):
+            terms.append(line)
+    return terms
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m decision_schema.term_scan",
+        description="Report reasons, params keys and trace keys containing listed terms.",
+    )
+    parser.add_argument("sources", nargs="+", help="JSONL traces or segment directories")
+    parser.add_argument("--terms-file", help="One term per line")
+    parser.add_argument("--term", action="append", default=[], help="Term (repeatable)")
+    parser.add_argument("--prefix", default="trace", help="Segment file prefix")
+    args = parser.parse_args(argv)
+
+    terms = list(args.term) + (load_terms(args.terms_file) if args.terms_file else [])
+    if not terms:
+        parser.error("no terms given (--term or --terms-file)")
+    scanner = TermScanner(terms)
+    found = 0
+    for path in resolve_sources(args.sources, args.prefix):
+        for hit in scan_packets(iter_packet_dicts(path), scanner):
+            found += 1
+            print(json.dumps({"file": str(path), **_hit_dict(hit)}, ensure_ascii=False))
+    return 1 if found else 0
+
+
+def _hit_dict(hit: TermHit) -> dict[str, Any]:
+    return {
+        "run_id": hit.run_id,
+        "step": hit.step,
+        "field": hit.field,
+        "term": hit.term,
+        "text": hit.text,
+    }
+
+
+if __name__ == "__main__":
+    sys.exit(main())
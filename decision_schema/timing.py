@@ -0,0 +1,193 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Low-overhead per-stage timing that fills PacketV2.latency_ms and registered trace keys.
+
+Usage:
+    timer = new_stage_timer()
+    with timer.stage("proposal"):
+        ...
+    t0 = timer.start()
+    ...
+    timer.stop("exec", t0)
+    timer.apply(packet)   # latency_ms + harness.*_latency_ms + exec.total_latency_ms
+
+The timer records how often each stage ran (`stage_counts()`) but does not
+write counter keys such as `exec.attempt_count`: those count execution
+attempts and are owned by the execution layer.
+
+Timing is disabled process-wide with DECISION_SCHEMA_TIMING=0 (or
+`set_timing_enabled(False)`): `new_stage_timer()` then returns a shared no-op
+timer whose methods do nothing and allocate nothing.
+"""
+
+from __future__ import annotations
+
+import os
+from time import perf_counter_ns
+from typing import Any
+
+from decision_schema.packet_v2 import PacketV2
+
+STAGES = ("proposal", "modulation", "ops", "exec")
+
+# Stage -> registered trace key receiving the stage latency (ms, float).
+STAGE_LATENCY_KEYS: dict[str, str] = {
+    "proposal": "harness.proposal_latency_ms",
+    "modulation": "harness.modulation_latency_ms",
+    "ops": "harness.ops_latency_ms",
+    "exec": "exec.total_latency_ms",
+}
+
+_enabled = os.environ.get("DECISION_SCHEMA_TIMING", "1") not in ("0", "false", "no")
+
+
+def set_timing_enabled(enabled: bool) -> None:
+    """Enable or disable timing for timers created afterwards."""
+    global _enabled
+    _enabled = enabled
+
+
+def timing_enabled() -> bool:
+    return _enabled
+
+
+class _Span:
+    __slots__ = ("_timer", "_name", "_t0")
+
+    def __init__(self, timer: StageTimer, name: str) -> None:
+        self._timer = timer
+        self._name = name
+        self._t0 = 0
+
+    def __enter__(self) -> _Span:
+        self._t0 = perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self._timer.record(self._name, perf_counter_ns() - self._t0)
+
+
+class StageTimer:
+    """
+    Accumulates nanoseconds and call counts per stage for one decision step.
+
+    Stages may run more than once (e.g. retried exec); durations accumulate.
+    """
+
+    __slots__ = ("_start_ns", "_end_ns", "_ns", "_counts", "_spans")
+
+    def __init__(self) -> None:
+        self._start_ns = perf_counter_ns()
+        self._end_ns: int | None = None
+        self._ns: dict[str, int] = {}
+        self._counts: dict[str, int] = {}
+        self._spans: dict[str, _Span] = {}
+
+    def stage(self, name: str) -> _Span:
+        """Context manager timing one run of stage `name` (do not nest a stage in itself)."""
+        span = self._spans.get(name)
+        if span is None:
+            span = self._spans[name] = _Span(self, name)
+        return span
+
+    def start(self) -> int:
+        """Return a start mark for stop()."""
+        return perf_counter_ns()
+
+    def stop(self, name: str, start_mark: int) -> None:
+        """Record stage `name` as having run from start_mark until now."""
+        self.record(name, perf_counter_ns() - start_mark)
+
+    def record(self, name: str, elapsed_ns: int) -> None:
+        """Add an externally measured duration to stage `name`."""
+        self._ns[name] = self._ns.get(name, 0) + elapsed_ns
+        self._counts[name] = self._counts.get(name, 0) + 1
+
+    def finish(self) -> None:
+        """Freeze the total step time (apply() calls this if needed)."""
+        if self._end_ns is None:
+            self._end_ns = perf_counter_ns()
+
+    def total_ns(self) -> int:
+        end = self._end_ns if self._end_ns is not None else perf_counter_ns()
+        return end - self._start_ns
+
+    def stage_ns(self) -> dict[str, int]:
+        return dict(self._ns)
+
+    def stage_counts(self) -> dict[str, int]:
+        return dict(self._counts)
+
+    def trace_values(self) -> dict[str, Any]:
+        """Registered trace key -> value for all recorded stages with a mapped key."""
+        out: dict[str, Any] = {}
+        for name, ns in self._ns.items():
+            key = STAGE_LATENCY_KEYS.get(name)
+            if key is not None:
+                out[key] = round(ns / 1e6, 3)
+        return out
+
+    def apply(self, packet: PacketV2) -> PacketV2:
+        """Set packet.latency_ms (total, int ms) and add stage trace keys to packet.external."""
+        self.finish()
+        packet.latency_ms = round(self.total_ns() / 1e6)
+        packet.external.update(self.trace_values())
+        return packet
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> _NullSpan:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class NullStageTimer:
+    """No-op StageTimer used when timing is disabled; apply() leaves packets unchanged."""
+
+    __slots__ = ()
+
+    def stage(self, name: str) -> _NullSpan:
+        return _NULL_SPAN
+
+    def start(self) -> int:
+        return 0
+
+    def stop(self, name: str, start_mark: int) -> None:
+        return None
+
+    def record(self, name: str, elapsed_ns: int) -> None:
+        return None
+
+    def finish(self) -> None:
+        return None
+
+    def total_ns(self) -> int:
+        return 0
+
+    def stage_ns(self) -> dict[str, int]:
+        return {}
+
+    def stage_counts(self) -> dict[str, int]:
+        return {}
+
+    def trace_values(self) -> dict[str, Any]:
+        return {}
+
+    def apply(self, packet: PacketV2) -> PacketV2:
+        return packet
+
+
+NULL_STAGE_TIMER = NullStageTimer()
+
+
+def new_stage_timer() -> StageTimer | NullStageTimer:
+    """Return a new StageTimer, or the shared no-op timer when timing is disabled."""
+    return StageTimer() if _enabled else NULL_STAGE_TIMER
@@ -0,0 +1,342 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Streaming merge-join diff of two (run_id, step)-ordered packet streams.
+
+Typical use: replay recorded runs under a new policy and compare the candidate
+stream with the baseline. Both inputs must be ordered by `(run_id, step)` with
+no duplicate keys (see trace_sort.py). Per step the diff reports:
+
+- action change (`final_action["action"]`)
+- `allowed` flip (`final_action["allowed"]`)
+- mismatch flag delta (flags added / removed)
+- latency delta (candidate - baseline; marks a step as differing only above
+  `latency_threshold_ms`)
+- steps present in only one stream
+
+Memory is constant in the number of steps: one packet per side is held, and
+per-run summaries are emitted (`on_run`) as soon as both streams leave a run
+(pass `keep_runs=True` to also collect them in the report, one per run).
+
+CLI:
+    python -m decision_schema.trace_diff baseline.jsonl candidate.jsonl -o diff.jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from contextlib import ExitStack
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from decision_schema.packet_v2 import PacketV2
+from decision_schema.segments import packet_action
+from decision_schema.trace_io import iter_packet_dicts
+
+ONLY_BASELINE = "only_baseline"
+ONLY_CANDIDATE = "only_candidate"
+CHANGED = "changed"
+
+
+@dataclass
+class _Step:
+    run_id: str
+    step: int
+    action: str | None
+    allowed: Any
+    flags: frozenset[str]
+    latency_ms: Any
+
+
+def _step(packet: PacketV2 | Mapping[str, Any]) -> _Step:
+    if isinstance(packet, PacketV2):
+        packet = {
+            "run_id": packet.run_id,
+            "step": packet.step,
+            "final_action": packet.final_action,
+            "mismatch": packet.mismatch,
+            "latency_ms": packet.latency_ms,
+        }
+    final_action = packet.get("final_action")
+    allowed = final_action.get("allowed") if isinstance(final_action, dict) else None
+    mismatch = packet.get("mismatch")
+    flags = mismatch.get("flags") if isinstance(mismatch, dict) else None
+    return _Step(
+        packet["run_id"],
+        packet["step"],
+        packet_action(packet),
+        allowed,
+        frozenset(flags or ()),
+        packet.get("latency_ms"),
+    )
+
+
+@dataclass
+class StepDiff:
+    """One differing step (only set fields differ)."""
+
+    run_id: str
+    step: int
+    kind: str  # CHANGED, ONLY_BASELINE or ONLY_CANDIDATE
+    action: tuple[str | None, str | None] | None = None
+    allowed: tuple[Any, Any] | None = None
+    flags_added: list[str] = field(default_factory=list)
+    flags_removed: list[str] = field(default_factory=list)
+    latency_delta_ms: float | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        out = {k: v for k, v in asdict(self).items() if v not in (None, [])}
+        for k in ("action", "allowed"):
+            if k in out:
+                out[k] = list(out[k])
+        return out
+
+
+@dataclass
+class RunDiffSummary:
+    """Divergence summary for one run_id."""
+
+    run_id: str
+    steps_compared: int = 0
+    steps_differing: int = 0
+    only_baseline: int = 0
+    only_candidate: int = 0
+    action_changes: dict[str, int] = field(default_factory=dict)  # "OLD->NEW" -> count
+    allowed_flips: int = 0
+    flags_added: dict[str, int] = field(default_factory=dict)
+    flags_removed: dict[str, int] = field(default_factory=dict)
+    latency_compared: int = 0  # compared steps with a numeric latency on both sides
+    latency_delta_sum_ms: float = 0.0
+    latency_delta_min_ms: float | None = None
+    latency_delta_max_ms: float | None = None
+    first_differing_step: int | None = None
+
+    @property
+    def latency_delta_mean_ms(self) -> float:
+        if not self.latency_compared:
+            return 0.0
+        return self.latency_delta_sum_ms / self.latency_compared
+
+    def to_dict(self) -> dict[str, Any]:
+        out = asdict(self)
+        out["latency_delta_mean_ms"] = self.latency_delta_mean_ms
+        return out
+
+
+@dataclass
+class DiffReport:
+    """Totals over all runs plus per-run summaries (only with keep_runs=True)."""
+
+    runs: dict[str, RunDiffSummary] = field(default_factory=dict)
+    steps_compared: int = 0
+    steps_differing: int = 0
+    runs_differing: int = 0
+
+    @property
+    def identical(self) -> bool:
+        return self.steps_differing == 0
+
+
+def _ordered(packets: Iterable[PacketV2 | Mapping[str, Any]], side: str) -> Iterator[_Step]:
+    prev: tuple[str, int] | None = None
+    for packet in packets:
+        s = _step(packet)
+        key = (s.run_id, s.step)
+        if prev is not None and key <= prev:
+            raise ValueError(
+                f"{side} stream not ordered by (run_id, step): {key} after {prev} "
+                "(sort it with decision_schema.trace_sort)"
+            )
+        prev = key
+        yield s
+
+
+def _compare(
+    base: _Step, cand: _Step, summary: RunDiffSummary, latency_threshold_ms: float | None
+) -> StepDiff | None:
+    diff = StepDiff(base.run_id, base.step, CHANGED)
+    differs = False
+    summary.steps_compared += 1
+    if base.action != cand.action:
+        diff.action = (base.action, cand.action)
+        change = f"{base.action}->{cand.action}"
+        summary.action_changes[change] = summary.action_changes.get(change, 0) + 1
+        differs = True
+    if base.allowed != cand.allowed:
+        diff.allowed = (base.allowed, cand.allowed)
+        summary.allowed_flips += 1
+        differs = True
+    if base.flags != cand.flags:
+        diff.flags_added = sorted(cand.flags - base.flags)
+        diff.flags_removed = sorted(base.flags - cand.flags)
+        for flag in diff.flags_added:
+            summary.flags_added[flag] = summary.flags_added.get(flag, 0) + 1
+        for flag in diff.flags_removed:
+            summary.flags_removed[flag] = summary.flags_removed.get(flag, 0) + 1
+        differs = True
+    if isinstance(base.latency_ms, (int, float)) and isinstance(cand.latency_ms, (int, float)):
+        delta = cand.latency_ms - base.latency_ms
+        summary.latency_compared += 1
+        summary.latency_delta_sum_ms += delta
+        if summary.latency_delta_min_ms is None or delta < summary.latency_delta_min_ms:
+            summary.latency_delta_min_ms = delta
+        if summary.latency_delta_max_ms is None or delta > summary.latency_delta_max_ms:
+            summary.latency_delta_max_ms = delta
+        if latency_threshold_ms is not None and abs(delta) > latency_threshold_ms:
+            differs = True
+        if differs:
+            diff.latency_delta_ms = delta
+    return diff if differs else None
+
+
+def diff_streams(
+    baseline: Iterable[PacketV2 | Mapping[str, Any]],
+    candidate: Iterable[PacketV2 | Mapping[str, Any]],
+    *,
+    latency_threshold_ms: float | None = None,
+    on_diff: Callable[[StepDiff], None] | None = None,
+    on_run: Callable[[RunDiffSummary], None] | None = None,
+    keep_runs: bool = False,
+) -> DiffReport:
+    """
+    Merge-join two (run_id, step)-ordered streams.
+
+    Args:
+        baseline: Baseline packets (PacketV2 or packet dicts).
+        candidate: Candidate (replayed) packets.
+        latency_threshold_ms: Mark steps whose |latency delta| exceeds this as differing
+            (None: latency is summarized but never makes a step differ on its own).
+        on_diff: Called with each differing step, in order.
+        on_run: Called with each run's summary once both streams have moved past it.
+        keep_runs: Also keep run summaries in the returned report (memory grows
+            with the number of runs).
+
+    Raises:
+        ValueError: If a stream is not strictly ordered by (run_id, step).
+    """
+    report = DiffReport()
+    base_it = _ordered(baseline, "baseline")
+    cand_it = _ordered(candidate, "candidate")
+    b = next(base_it, None)
+    c = next(cand_it, None)
+    current: RunDiffSummary | None = None
+
+    def close_run() -> None:
+        if current is None:
+            return
+        if current.steps_differing:
+            report.runs_differing += 1
+        if keep_runs:
+            report.runs[current.run_id] = current
+        if on_run is not None:
+            on_run(current)
+
+    def record(diff: StepDiff, summary: RunDiffSummary) -> None:
+        summary.steps_differing += 1
+        report.steps_differing += 1
+        if summary.first_differing_step is None:
+            summary.first_differing_step = diff.step
+        if on_diff is not None:
+            on_diff(diff)
+
+    def run_summary(run_id: str) -> RunDiffSummary:
+        nonlocal current
+        if current is None or current.run_id != run_id:
+            close_run()
+            current = RunDiffSummary(run_id)
+        return current
+
+    while b is not None or c is not None:
+        if b is not None and (c is None or (b.run_id, b.step) < (c.run_id, c.step)):
+            summary = run_summary(b.run_id)
+            summary.only_baseline += 1
+            record(StepDiff(b.run_id, b.step, ONLY_BASELINE), summary)
+            b = next(base_it, None)
+        elif c is not None and (b is None or (c.run_id, c.step) < (b.run_id, b.step)):
+            summary = run_summary(c.run_id)
+            summary.only_candidate += 1
+            record(StepDiff(c.run_id, c.step, ONLY_CANDIDATE), summary)
+            c = next(cand_it, None)
+        else:  # same (run_id, step) on both sides
+            summary = run_summary(b.run_id)
+            report.steps_compared += 1
+            diff = _compare(b, c, summary, latency_threshold_ms)
+            if diff is not None:
+                record(diff, summary)
+            b = next(base_it, None)
+            c = next(cand_it, None)
+    close_run()
+    return report
+
+
+def diff_traces(
+    baseline: str | Path,
+    candidate: str | Path,
+    output: str | Path | None = None,
+    *,
+    summary_output: str | Path | None = None,
+    latency_threshold_ms: float | None = None,
+    keep_runs: bool = False,
+) -> DiffReport:
+    """
+    Diff two ordered JSONL traces; write differing steps (and run summaries) as JSONL.
+
+    Args:
+        baseline / candidate: JSONL trace files ordered by (run_id, step).
+        output: JSONL file receiving one StepDiff per differing step.
+        summary_output: JSONL file receiving one RunDiffSummary per run.
+        latency_threshold_ms / keep_runs: See diff_streams.
+    """
+    with ExitStack() as stack:
+        out = summaries = None
+        if output is not None:
+            out = stack.enter_context(open(output, "w", encoding="utf-8"))
+        if summary_output is not None:
+            summaries = stack.enter_context(open(summary_output, "w", encoding="utf-8"))
+        return diff_streams(
+            iter_packet_dicts(baseline),
+            iter_packet_dicts(candidate),
+            latency_threshold_ms=latency_threshold_ms,
+            on_diff=(lambda d: out.write(_line(d.to_dict()))) if out else None,
+            on_run=(lambda s: summaries.write(_line(s.to_dict()))) if summaries else None,
+            keep_runs=keep_runs,
+        )
+
+
+def _line(data: dict[str, Any]) -> str:
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False) + "\n"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m decision_schema.trace_diff",
+        description="Diff two (run_id, step)-ordered PacketV2 JSONL traces.",
+    )
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("-o", "--output", help="JSONL of differing steps")
+    parser.add_argument("--summary-output", help="JSONL of per-run summaries")
+    parser.add_argument("--latency-threshold-ms", type=float)
+    args = parser.parse_args(argv)
+
+    report = diff_traces(
+        args.baseline,
+        args.candidate,
+        args.output,
+        summary_output=args.summary_output,
+        latency_threshold_ms=args.latency_threshold_ms,
+    )
+    print(
+        f"steps_compared={report.steps_compared} steps_differing={report.steps_differing} "
+        f"runs_differing={report.runs_differing}",
+        file=sys.stderr,
+    )
+    return 0 if report.identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
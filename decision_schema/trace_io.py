@@ -0,0 +1,98 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""JSONL trace reading and writing for PacketV2.
+
+One packet per line, UTF-8, compact separators. Blank lines are skipped on read.
+
+File writers (`write_packets`, `SegmentedTraceWriter`) report every written
+packet to `write_hook` as `(data, path, start_offset, end_offset)` when one is
+set (see run_summary.enable_run_summaries); otherwise they pay a single
+`is None` branch. Opening a file in truncating mode is reported to
+`truncate_hook` as `(path)` first.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from pathlib import Path
+from typing import Any
+
+from decision_schema.packet_v2 import PacketV2
+
+PacketLike = PacketV2 | Mapping[str, Any]
+WriteHook = Callable[[dict[str, Any], Path, int, int], None]
+TruncateHook = Callable[[Path], None]
+
+# Active write observers; read directly by file writers (None = disabled).
+write_hook: WriteHook | None = None
+truncate_hook: TruncateHook | None = None
+
+
+def packet_to_dict(packet: PacketLike) -> dict[str, Any]:
+    """Return the dict form of a PacketV2 or an already-decoded packet mapping."""
+    if isinstance(packet, PacketV2):
+        return packet.to_dict()
+    return dict(packet)
+
+
+def dumps_packet(packet: PacketLike) -> str:
+    """Encode one packet as a single JSON line (without trailing newline)."""
+    return json.dumps(packet_to_dict(packet), separators=(",", ":"), ensure_ascii=False)
+
+
+def loads_packet(line: str | bytes) -> PacketV2:
+    """Decode one JSON line into a PacketV2."""
+    return PacketV2.from_dict(json.loads(line))
+
+
+def iter_packet_dicts(path: str | Path) -> Iterator[dict[str, Any]]:
+    """Stream decoded packet dicts from a JSONL trace file."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def read_packets(path: str | Path) -> Iterator[PacketV2]:
+    """Stream PacketV2 instances from a JSONL trace file."""
+    for data in iter_packet_dicts(path):
+        yield PacketV2.from_dict(data)
+
+
+def write_packets(path: str | Path, packets: Iterable[PacketLike], *, append: bool = False) -> int:
+    """
+    Write packets to a JSONL trace file.
+
+    Args:
+        path: Destination file.
+        packets: PacketV2 instances or packet dicts.
+        append: Append to an existing file instead of truncating it.
+
+    Returns:
+        Number of packets written.
+    """
+    count = 0
+    hook = write_hook
+    if not append and truncate_hook is not None:
+        truncate_hook(Path(path))
+    with open(path, "a" if append else "w", encoding="utf-8") as f:
+        if hook is None:
+            for packet in packets:
+                f.write(dumps_packet(packet))
+                f.write("\n")
+                count += 1
+            return count
+        target = Path(path)
+        offset = os.fstat(f.fileno()).st_size
+        for packet in packets:
+            data = packet_to_dict(packet)
+            line = json.dumps(data, separators=(",", ":"), ensure_ascii=False) + "\n"
+            f.write(line)
+            end = offset + len(line.encode("utf-8"))
+            hook(data, target, offset, end)
+            offset = end
+            count += 1
+    return count
@@ -4,12 +4,23 @@
 """Trace external key registry and validation (INV-T1).
 
 SSOT for PacketV2.external key naming and registration rules.
+
+`EXTERNAL_KEY_REGISTRY` holds the built-in (documented) keys. Plugins add keys
+at runtime with `register_external_key` (or, as before, by writing to
+`EXTERNAL_KEY_REGISTRY`); either publishes a new immutable `RegistrySnapshot`
+and readers take `registry_snapshot()` without locking.
 """
 
 from __future__ import annotations
 
 import re
-from typing import Any, Mapping, Iterable
+import threading
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any
+
+from decision_schema import profiling as _profiling
 
 # Trace-extension keys MUST be namespaced, lowercase, dot-separated.
 # Example: "harness.fail_closed"
@@ -34,13 +45,30 @@ RESERVED_NAMESPACES = frozenset(
 )
 
 # SSOT registry for external trace keys.
-# Only keys here are considered "registered". Use strict validation to enforce registration.
+# Registered keys are these plus runtime registrations (register_external_key).
+# Use strict validation to enforce registration.
 EXTERNAL_KEY_REGISTRY: dict[str, dict[str, str]] = {
     "harness.fail_closed": {
         "owner": "integration-harness",
         "introduced_in": "0.2.0",
         "description": "Harness-level fail-closed marker set when run_one_step catches an exception.",
     },
+    # Per-stage step latencies (decision_schema.timing)
+    "harness.proposal_latency_ms": {
+        "owner": "integration-harness",
+        "introduced_in": "0.2.2",
+        "description": "Proposal stage latency in milliseconds for the step.",
+    },
+    "harness.modulation_latency_ms": {
+        "owner": "integration-harness",
+        "introduced_in": "0.2.2",
+        "description": "Modulation/guard stage latency in milliseconds for the step.",
+    },
+    "harness.ops_latency_ms": {
+        "owner": "integration-harness",
+        "introduced_in": "0.2.2",
+        "description": "Ops-health stage latency in milliseconds for the step.",
+    },
     # Execution-orchestration-core trace keys (exec.* namespace)
     "exec.total_latency_ms": {
         "owner": "execution-orchestration-core",
@@ -80,6 +108,159 @@ EXTERNAL_KEY_REGISTRY: dict[str, dict[str, str]] = {
 }
 
 
+class _RegistryDict(dict):
+    """Built-in registry dict; every write republishes the registry snapshot."""
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        _republish()
+
+    def __delitem__(self, key: Any) -> None:
+        super().__delitem__(key)
+        _republish()
+
+    def __ior__(self, other: Any) -> _RegistryDict:
+        super().__ior__(other)
+        _republish()
+        return self
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        _republish()
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        value = super().setdefault(key, default)
+        _republish()
+        return value
+
+    def pop(self, *args: Any) -> Any:
+        value = super().pop(*args)
+        _republish()
+        return value
+
+    def popitem(self) -> tuple[Any, Any]:
+        item = super().popitem()
+        _republish()
+        return item
+
+    def clear(self) -> None:
+        super().clear()
+        _republish()
+
+
+# Writes to the built-in dict (how plugins registered keys before runtime
+# registration existed) keep strict validation in sync.
+EXTERNAL_KEY_REGISTRY = _RegistryDict(EXTERNAL_KEY_REGISTRY)
+
+
+@dataclass(frozen=True, slots=True)
+class RegistrySnapshot:
+    """
+    Immutable view of all registered external keys (built-in plus runtime).
+
+    Attributes:
+        entries: key -> read-only metadata (owner, introduced_in, description).
+        keys: Precomputed frozenset of registered keys.
+        by_namespace: namespace (text before the first dot) -> frozenset of keys.
+        version: Incremented by every registration that changes the registry.
+    """
+
+    entries: Mapping[str, Mapping[str, str]]
+    keys: frozenset[str]
+    by_namespace: Mapping[str, frozenset[str]]
+    version: int = 0
+
+    @classmethod
+    def build(cls, entries: Mapping[str, Mapping[str, str]], version: int = 0) -> RegistrySnapshot:
+        frozen = {k: MappingProxyType(dict(meta)) for k, meta in entries.items()}
+        namespaces: dict[str, set[str]] = {}
+        for key in frozen:
+            namespaces.setdefault(key.split(".", 1)[0], set()).add(key)
+        return cls(
+            MappingProxyType(frozen),
+            frozenset(frozen),
+            MappingProxyType({ns: frozenset(ks) for ns, ks in namespaces.items()}),
+            version,
+        )
+
+    def namespace_keys(self, namespace: str) -> frozenset[str]:
+        """Registered keys under namespace (empty if none)."""
+        return self.by_namespace.get(namespace, frozenset())
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.keys
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+
+# Keys added by register_external_key (kept out of the documented built-in dict).
+_runtime_entries: dict[str, dict[str, str]] = {}
+
+# Current snapshot. Rebinding a module global is atomic (also on free-threaded
+# builds), so readers see either the old or the new snapshot, never a mix.
+_snapshot = RegistrySnapshot.build(EXTERNAL_KEY_REGISTRY)
+_register_lock = threading.Lock()
+
+
+def _republish() -> None:
+    """Rebuild the snapshot from EXTERNAL_KEY_REGISTRY plus runtime registrations."""
+    global _snapshot
+    with _register_lock:
+        entries = {**EXTERNAL_KEY_REGISTRY, **_runtime_entries}
+        _snapshot = RegistrySnapshot.build(entries, _snapshot.version + 1)
+
+
+def registry_snapshot() -> RegistrySnapshot:
+    """Current registry snapshot (lock-free; hold on to it for a consistent view)."""
+    return _snapshot
+
+
+def register_external_key(
+    key: str,
+    *,
+    owner: str,
+    introduced_in: str,
+    description: str,
+    replace: bool = False,
+) -> RegistrySnapshot:
+    """
+    Register a trace key at runtime and publish a new snapshot.
+
+    Re-registering a key with identical metadata is a no-op, so plugins may
+    register on every startup. `EXTERNAL_KEY_REGISTRY` itself is not modified
+    (it stays the documented built-in set).
+
+    Args:
+        key: Trace key (INV-T1.1 format, e.g. "myplugin.queue_depth").
+        owner / introduced_in / description: Registry metadata.
+        replace: Allow overwriting different metadata of an existing key.
+
+    Returns:
+        The snapshot that contains the key.
+
+    Raises:
+        ValueError: If the key format is invalid or the key is already registered
+            with different metadata (and replace is False).
+    """
+    global _snapshot
+    if not isinstance(key, str) or not is_valid_trace_key(key):
+        raise ValueError(f"INV-T1:invalid_trace_key_format:{key}")
+    meta = {"owner": owner, "introduced_in": introduced_in, "description": description}
+    with _register_lock:
+        current = _snapshot
+        existing = current.entries.get(key)
+        if existing is not None:
+            if dict(existing) == meta:
+                return current
+            if not replace:
+                raise ValueError(f"INV-T1:key_already_registered:{key} (owner {existing['owner']})")
+        _runtime_entries[key] = meta
+        entries = {**EXTERNAL_KEY_REGISTRY, **_runtime_entries}
+        _snapshot = RegistrySnapshot.build(entries, current.version + 1)
+        return _snapshot
+
+
 def is_valid_trace_key(key: str) -> bool:
     """True if key matches trace-extension format (dot-separated, INV-T1.1)."""
     return bool(TRACE_KEY_RE.match(key))
@@ -132,6 +313,26 @@ def validate_external_dict(
     - Optionally enforces INV-T1.2: trace keys under selected namespaces must be registered.
       (Default is non-strict to avoid breaking integrators.)
     """
+    active = _profiling.hook
+    if active is not None:
+        size = len(external) if isinstance(external, Mapping) else 0
+        return _profiling.timed(
+            active,
+            "validate_external_dict",
+            size,
+            _validate_external_dict,
+            external,
+            require_registry_for_prefixes,
+            mode,
+        )
+    return _validate_external_dict(external, require_registry_for_prefixes, mode)
+
+
+def _validate_external_dict(
+    external: Mapping[str, Any] | None,
+    require_registry_for_prefixes: Iterable[str] | None,
+    mode: str,
+) -> list[str]:
     if external is None:
         return []
 
@@ -139,6 +340,7 @@ def validate_external_dict(
         return ["INV-T1:external_not_mapping"]
 
     strict_prefixes = set(require_registry_for_prefixes or [])
+    registered = _snapshot.keys
 
     errors: list[str] = []
     for k in external.keys():
@@ -157,7 +359,7 @@ def validate_external_dict(
                 continue
             # Registry check only for trace keys
             prefix = k.split(".", 1)[0]
-            if prefix in strict_prefixes and k not in EXTERNAL_KEY_REGISTRY:
+            if prefix in strict_prefixes and k not in registered:
                 errors.append(f"INV-T1:unregistered_key:{k}")
         else:  # both
             if not is_valid_external_key(k, mode="both"):
@@ -166,12 +368,12 @@ def validate_external_dict(
             # Registry check only for trace keys (dot-separated)
             if "." in k:
                 prefix = k.split(".", 1)[0]
-                if prefix in strict_prefixes and k not in EXTERNAL_KEY_REGISTRY:
+                if prefix in strict_prefixes and k not in registered:
                     errors.append(f"INV-T1:unregistered_key:{k}")
 
     return errors
 
 
 def registry_keys() -> set[str]:
-    """Return set of all registered external keys."""
-    return set(EXTERNAL_KEY_REGISTRY.keys())
+    """Return a (mutable) copy of all registered keys; use registry_snapshot().keys on hot paths."""
+    return set(_snapshot.keys)
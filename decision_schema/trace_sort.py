@@ -0,0 +1,250 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Bounded-memory external sort/merge of PacketV2 JSONL traces by (run_id, step).
+
+Input lines are buffered up to `max_records` / `max_bytes`, sorted and spilled
+to temporary run files; runs are then heap-merged (at most `fan_in` open at a
+time, in several passes if needed) into one ordered output. Original JSON lines
+are copied through unchanged.
+
+Duplicate `(run_id, step)` records are detected during the final merge:
+
+- "first" / "last": keep the first / last record in input order
+- "error": raise ValueError if duplicates differ in content (identical copies are dropped)
+- "keep": write every record (still ordered, input order within a step)
+
+The output is written to `<output>.tmp` and renamed into place only when the
+sort succeeds, so a failed sort (malformed line, "error" conflict) leaves any
+existing output untouched.
+
+CLI:
+    python -m decision_schema.trace_sort TRACE_DIR_OR_FILE... -o sorted.jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+import json
+import os
+import sys
+import tempfile
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from decision_schema.dedup import packet_digest
+from decision_schema.query import resolve_sources
+
+DUPLICATE_POLICIES = ("first", "last", "error", "keep")
+
+# (run_id, step, input ordinal)
+SortKey = tuple[str, int, int]
+
+
+@dataclass
+class SortStats:
+    """Counters for one sort."""
+
+    records: int = 0
+    written: int = 0
+    runs: int = 0
+    merge_passes: int = 0
+    duplicates: int = 0  # records sharing (run_id, step) with an earlier record
+    conflicts: int = 0  # duplicates whose content differs from the first record
+
+
+def _record_key(line: bytes, ordinal: int, where: str) -> SortKey:
+    try:
+        data = json.loads(line)
+        run_id, step = data["run_id"], data["step"]
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError(f"{where}: not a packet line ({e})") from e
+    if not isinstance(run_id, str) or not isinstance(step, int) or isinstance(step, bool):
+        raise ValueError(f"{where}: run_id must be str and step int")
+    return (run_id, step, ordinal)
+
+
+def _iter_input(paths: list[Path]) -> Iterator[tuple[SortKey, bytes]]:
+    ordinal = 0
+    for path in paths:
+        with open(path, "rb") as f:
+            for lineno, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                if not line.endswith(b"\n"):
+                    line += b"\n"
+                yield _record_key(line, ordinal, f"{path}:{lineno}"), line
+                ordinal += 1
+
+
+def _write_run(records: Iterable[tuple[SortKey, bytes]], tmp_dir: str) -> str:
+    # Run format: JSON key, TAB, original line (JSON escapes tabs inside strings).
+    fd, path = tempfile.mkstemp(prefix="ds-sort-", suffix=".run", dir=tmp_dir)
+    with os.fdopen(fd, "wb") as f:
+        for key, line in records:
+            f.write(json.dumps(key, ensure_ascii=False).encode("utf-8") + b"\t" + line)
+    return path
+
+
+def _read_run(path: str) -> Iterator[tuple[SortKey, bytes]]:
+    with open(path, "rb") as f:
+        for raw in f:
+            head, _, line = raw.partition(b"\t")
+            run_id, step, ordinal = json.loads(head)
+            yield (run_id, step, ordinal), line
+
+
+def _merge(runs: list[Iterator[tuple[SortKey, bytes]]]) -> Iterator[tuple[SortKey, bytes]]:
+    return heapq.merge(*runs, key=lambda r: r[0])
+
+
+def _resolve_group(
+    group: list[tuple[SortKey, bytes]], policy: str, stats: SortStats
+) -> list[bytes]:
+    lines = [line for _, line in group]
+    if len(lines) == 1:
+        return lines
+    first = packet_digest(json.loads(lines[0]))
+    conflicts = sum(1 for line in lines[1:] if packet_digest(json.loads(line)) != first)
+    stats.duplicates += len(lines) - 1
+    stats.conflicts += conflicts
+    if policy == "keep":
+        return lines
+    if policy == "error" and conflicts:
+        run_id, step, _ = group[0][0]
+        raise ValueError(f"conflicting records for run_id={run_id!r} step={step}")
+    return [lines[-1]] if policy == "last" else [lines[0]]
+
+
+def _resolve_duplicates(
+    records: Iterator[tuple[SortKey, bytes]], policy: str, stats: SortStats
+) -> Iterator[bytes]:
+    group: list[tuple[SortKey, bytes]] = []
+    for record in records:
+        if group and group[0][0][:2] != record[0][:2]:
+            yield from _resolve_group(group, policy, stats)
+            group = []
+        group.append(record)
+    if group:
+        yield from _resolve_group(group, policy, stats)
+
+
+def sort_traces(
+    sources: Iterable[str | Path],
+    output: str | Path,
+    *,
+    prefix: str = "trace",
+    on_duplicate: str = "first",
+    max_records: int = 100_000,
+    max_bytes: int = 64 * 1024 * 1024,
+    fan_in: int = 64,
+    tmp_dir: str | Path | None = None,
+) -> SortStats:
+    """
+    Sort JSONL traces by (run_id, step) into `output`.
+
+    Args:
+        sources: Segment directories (see segments.py) and/or JSONL files.
+        output: Output JSONL path (replaced atomically on success).
+        prefix: Segment prefix used for directories.
+        on_duplicate: One of DUPLICATE_POLICIES.
+        max_records: Records buffered in memory before spilling a sorted run.
+        max_bytes: Line bytes buffered in memory before spilling a sorted run.
+        fan_in: Maximum runs merged (files open) at once.
+        tmp_dir: Directory for run files (default: next to output).
+
+    Returns:
+        SortStats.
+
+    Raises:
+        ValueError: On an invalid option, a malformed line, or a conflict with "error".
+    """
+    if on_duplicate not in DUPLICATE_POLICIES:
+        raise ValueError(f"on_duplicate must be one of {DUPLICATE_POLICIES}, got {on_duplicate!r}")
+    if max_records <= 0 or max_bytes <= 0 or fan_in < 2:
+        raise ValueError("max_records and max_bytes must be > 0 and fan_in >= 2")
+    output = Path(output)
+    work_dir = tempfile.mkdtemp(prefix="ds-sort-", dir=tmp_dir or output.parent)
+    stats = SortStats()
+    run_files: list[str] = []
+    try:
+        buffer: list[tuple[SortKey, bytes]] = []
+        buffered = 0
+        for record in _iter_input(resolve_sources(sources, prefix)):
+            stats.records += 1
+            buffer.append(record)
+            buffered += len(record[1])
+            if len(buffer) >= max_records or buffered >= max_bytes:
+                buffer.sort(key=lambda r: r[0])
+                run_files.append(_write_run(buffer, work_dir))
+                buffer, buffered = [], 0
+        buffer.sort(key=lambda r: r[0])
+        stats.runs = len(run_files) + (1 if buffer or not run_files else 0)
+
+        # Reduce to fewer than fan_in runs (the in-memory buffer takes one merge slot).
+        while len(run_files) >= fan_in:
+            stats.merge_passes += 1
+            merged: list[str] = []
+            for i in range(0, len(run_files), fan_in):
+                group = run_files[i : i + fan_in]
+                merged.append(_write_run(_merge([_read_run(p) for p in group]), work_dir))
+                for p in group:
+                    os.unlink(p)
+            run_files = merged
+
+        stats.merge_passes += 1
+        final = _merge([iter(buffer), *(_read_run(p) for p in run_files)])
+        tmp = output.with_name(output.name + ".tmp")
+        try:
+            with open(tmp, "wb") as out:
+                for line in _resolve_duplicates(final, on_duplicate, stats):
+                    out.write(line)
+                    stats.written += 1
+            os.replace(tmp, output)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+    finally:
+        for name in os.listdir(work_dir):
+            os.unlink(os.path.join(work_dir, name))
+        os.rmdir(work_dir)
+    return stats
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m decision_schema.trace_sort",
+        description="Sort PacketV2 JSONL traces by (run_id, step) with bounded memory.",
+    )
+    parser.add_argument("sources", nargs="+", help="Segment directories or JSONL files")
+    parser.add_argument("-o", "--output", required=True, help="Output JSONL file")
+    parser.add_argument("--prefix", default="trace", help="Segment prefix for directories")
+    parser.add_argument("--on-duplicate", choices=DUPLICATE_POLICIES, default="first")
+    parser.add_argument("--max-records", type=int, default=100_000)
+    parser.add_argument("--fan-in", type=int, default=64)
+    parser.add_argument("--tmp-dir", help="Directory for spilled runs")
+    parser.add_argument("--stats", action="store_true", help="Print SortStats to stderr")
+    args = parser.parse_args(argv)
+
+    opts: dict[str, Any] = {}
+    if args.tmp_dir:
+        opts["tmp_dir"] = args.tmp_dir
+    stats = sort_traces(
+        args.sources,
+        args.output,
+        prefix=args.prefix,
+        on_duplicate=args.on_duplicate,
+        max_records=args.max_records,
+        fan_in=args.fan_in,
+        **opts,
+    )
+    if args.stats:
+        print(stats, file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
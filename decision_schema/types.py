@@ -11,6 +11,10 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
+from decision_schema import codes as _codes
+from decision_schema import params_keys as _params_keys
+from decision_schema.codes import CODES, CodeRegistry, MismatchBits
+
 
 class Action(str, Enum):
     """
@@ -47,6 +51,10 @@ class Proposal:
             raise ValueError(f"confidence must be in [0.0, 1.0], got {self.confidence}")
         if not self.reasons:
             self.reasons = []
+        elif _codes.reason_interner is not None:
+            self.reasons = _codes.reason_interner(self.reasons)
+        if self.params and _params_keys.active is not None:
+            _params_keys.active(self.params)
 
     def to_params(self) -> dict[str, Any]:
         """Return params dict (empty if None)."""
@@ -70,6 +78,32 @@ class MismatchInfo:
         if not self.reason_codes:
             self.reason_codes = []
 
+    def to_bits(self, registry: CodeRegistry = CODES, *, register: bool = False) -> MismatchBits:
+        """
+        Compact bitset form of flags / reason_codes (see decision_schema.codes).
+
+        Codes unknown to registry are kept in the extra_* sidecars; the registry
+        only grows with register=True (and only up to its max_codes).
+        """
+        return MismatchBits.from_lists(self.flags, self.reason_codes, registry, register=register)
+
+    @classmethod
+    def from_bits(
+        cls,
+        bits: MismatchBits,
+        registry: CodeRegistry = CODES,
+        *,
+        throttle_refresh_ms: int | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> "MismatchInfo":
+        """Rebuild MismatchInfo from to_bits() output (lists restored exactly)."""
+        return cls(
+            flags=bits.flag_list(registry),
+            reason_codes=bits.reason_code_list(registry),
+            throttle_refresh_ms=throttle_refresh_ms,
+            metadata=metadata,
+        )
+
 
 @dataclass
 class FinalDecision:
@@ -89,6 +123,10 @@ class FinalDecision:
     def __post_init__(self) -> None:
         if not self.reasons:
             self.reasons = []
+        elif _codes.reason_interner is not None:
+            self.reasons = _codes.reason_interner(self.reasons)
+        if self.params and _params_keys.active is not None:
+            _params_keys.active(self.params)
 
     def to_params(self) -> dict[str, Any]:
         """Return params dict (empty if None)."""
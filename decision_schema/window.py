@@ -0,0 +1,178 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Sliding-window counters producing the PARAMETER_INDEX window context keys.
+
+Produces `errors_in_window`, `steps_in_window`, `rate_limit_events`,
+`recent_failures` and `cooldown_until_ms` (docs/PARAMETER_INDEX.md) from a
+bucketed time wheel: O(1) amortized per event and per context build,
+independent of how many events the window holds.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from decision_schema.trace_registry import is_valid_context_key
+
+WINDOW_CONTEXT_KEYS = (
+    "errors_in_window",
+    "steps_in_window",
+    "rate_limit_events",
+    "recent_failures",
+    "cooldown_until_ms",
+)
+
+# Fail closed at import: produced keys must be valid context keys (CONTEXT_KEY_RE).
+for _key in WINDOW_CONTEXT_KEYS:
+    if not is_valid_context_key(_key):
+        raise ValueError(f"INV-T1:invalid_context_key_format:{_key}")
+
+
+class WindowedCounter:
+    """
+    Event count over the last `window_ms`, at `bucket_ms` resolution.
+
+    The window covers the current bucket plus the preceding buckets, i.e. events
+    with `now_ms - window_ms < t <= now_ms` rounded to bucket boundaries. Events
+    older than the window are ignored. `reset()` is O(1) (slot generations).
+    """
+
+    __slots__ = (
+        "bucket_ms",
+        "num_buckets",
+        "_counts",
+        "_epochs",
+        "_gens",
+        "_gen",
+        "_head",
+        "_total",
+    )
+
+    def __init__(self, window_ms: int, bucket_ms: int = 1000) -> None:
+        if bucket_ms <= 0:
+            raise ValueError(f"bucket_ms must be > 0, got {bucket_ms}")
+        if window_ms < bucket_ms:
+            raise ValueError(f"window_ms must be >= bucket_ms, got {window_ms} < {bucket_ms}")
+        self.bucket_ms = bucket_ms
+        self.num_buckets = -(-window_ms // bucket_ms)
+        self._counts = [0] * self.num_buckets
+        self._epochs = [-1] * self.num_buckets
+        self._gens = [0] * self.num_buckets
+        self._gen = 0
+        self._head: int | None = None
+        self._total = 0
+
+    def _advance(self, bucket: int) -> None:
+        head = self._head
+        if head is None:
+            self._head = bucket
+            return
+        if bucket <= head:
+            return
+        n = self.num_buckets
+        counts, epochs, gens, gen = self._counts, self._epochs, self._gens, self._gen
+        if bucket - head >= n:
+            self._total = 0
+            self._gen += 1
+        else:
+            for b in range(head + 1, bucket + 1):
+                slot = b % n
+                if gens[slot] == gen and epochs[slot] >= 0:
+                    self._total -= counts[slot]
+                counts[slot] = 0
+                epochs[slot] = b
+                gens[slot] = gen
+        self._head = bucket
+
+    def add(self, now_ms: int, n: int = 1) -> None:
+        """Record n events at now_ms."""
+        bucket = now_ms // self.bucket_ms
+        self._advance(bucket)
+        if bucket <= self._head - self.num_buckets:
+            return
+        slot = bucket % self.num_buckets
+        if self._epochs[slot] != bucket or self._gens[slot] != self._gen:
+            self._counts[slot] = 0
+            self._epochs[slot] = bucket
+            self._gens[slot] = self._gen
+        self._counts[slot] += n
+        self._total += n
+
+    def total(self, now_ms: int) -> int:
+        """Events in the window ending at now_ms."""
+        self._advance(now_ms // self.bucket_ms)
+        return self._total
+
+    def reset(self) -> None:
+        """Forget all events."""
+        self._gen += 1
+        self._total = 0
+
+
+class WindowContextCounters:
+    """
+    Per-caller state behind the window context keys.
+
+    Args:
+        window_ms: Window for errors_in_window, steps_in_window, rate_limit_events.
+        bucket_ms: Time-wheel resolution.
+        failure_window_ms: Window for recent_failures (defaults to window_ms).
+        reset_failures_on_success: Success clears recent_failures (circuit-breaker semantics).
+
+    Example:
+        >>> c = WindowContextCounters(window_ms=60_000)
+        >>> c.record_step(1_000); c.record_error(1_000)
+        >>> c.context(1_000)["errors_in_window"]
+        1
+    """
+
+    def __init__(
+        self,
+        window_ms: int = 60_000,
+        bucket_ms: int = 1000,
+        *,
+        failure_window_ms: int | None = None,
+        reset_failures_on_success: bool = True,
+    ) -> None:
+        self.steps = WindowedCounter(window_ms, bucket_ms)
+        self.errors = WindowedCounter(window_ms, bucket_ms)
+        self.rate_limits = WindowedCounter(window_ms, bucket_ms)
+        self.failures = WindowedCounter(failure_window_ms or window_ms, bucket_ms)
+        self.reset_failures_on_success = reset_failures_on_success
+        self.cooldown_until_ms: int | None = None
+
+    def record_step(self, now_ms: int) -> None:
+        self.steps.add(now_ms)
+
+    def record_error(self, now_ms: int) -> None:
+        self.errors.add(now_ms)
+
+    def record_rate_limit(self, now_ms: int) -> None:
+        self.rate_limits.add(now_ms)
+
+    def record_failure(self, now_ms: int) -> None:
+        self.failures.add(now_ms)
+
+    def record_success(self, now_ms: int) -> None:
+        if self.reset_failures_on_success:
+            self.failures.reset()
+
+    def start_cooldown(self, now_ms: int, duration_ms: int) -> None:
+        """Set cooldown end to now_ms + duration_ms (never shortens an active cooldown)."""
+        until = now_ms + duration_ms
+        if self.cooldown_until_ms is None or until > self.cooldown_until_ms:
+            self.cooldown_until_ms = until
+
+    def context(self, now_ms: int) -> dict[str, Any]:
+        """Return exactly WINDOW_CONTEXT_KEYS as of now_ms (cooldown is None once expired)."""
+        cooldown = self.cooldown_until_ms
+        if cooldown is not None and cooldown <= now_ms:
+            cooldown = None
+        return {
+            "errors_in_window": self.errors.total(now_ms),
+            "steps_in_window": self.steps.total(now_ms),
+            "rate_limit_events": self.rate_limits.total(now_ms),
+            "recent_failures": self.failures.total(now_ms),
+            "cooldown_until_ms": cooldown,
+        }
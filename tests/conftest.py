@@ -0,0 +1,47 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Shared test fixtures."""
+
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from decision_schema.packet_v2 import PacketV2
+from decision_schema.version import __version__
+
+
+def _make_packet(
+    run_id: str = "r",
+    step: int = 0,
+    action: str | None = None,
+    *,
+    as_dict: bool = False,
+    **fields: Any,
+) -> PacketV2 | dict[str, Any]:
+    data: dict[str, Any] = {
+        "run_id": run_id,
+        "step": step,
+        "input": {},
+        "external": {},
+        "mdm": {},
+        "final_action": {} if action is None else {"action": action},
+        "latency_ms": 0,
+        "mismatch": None,
+        "schema_version": __version__,
+    }
+    data.update(fields)
+    return data if as_dict else PacketV2(**data)
+
+
+@pytest.fixture
+def make_packet() -> Callable[..., Any]:
+    """
+    Packet factory: make_packet(run_id="r", step=0, action=None, *, as_dict=False, **fields).
+
+    Sections default to empty dicts and latency_ms to 0; `action` sets
+    final_action={"action": action}; keyword fields replace any packet field.
+    Returns a PacketV2, or the packet dict (not validated) with as_dict=True.
+    """
+    return _make_packet
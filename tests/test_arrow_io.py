@@ -0,0 +1,85 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for optional Arrow / Parquet trace export and import."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from decision_schema import arrow_io
+from decision_schema.trace_io import write_packets
+
+
+@pytest.fixture
+def packet(make_packet):
+    """Factory for packets with every section populated from the step."""
+
+    def make(run_id: str, step: int, **fields):
+        populated = {
+            "input": {"signal": step},
+            "external": {"now_ms": step, "exec.attempt_count": 1},
+            "mdm": {"action": "ACT", "confidence": 0.5},
+            "final_action": {"action": "ACT", "allowed": step % 2 == 0},
+            "latency_ms": step,
+        }
+        return make_packet(run_id, step, **{**populated, **fields})
+
+    return make
+
+
+def test_import_without_pyarrow_degrades_cleanly(tmp_path) -> None:
+    """Without pyarrow the module imports and its writers raise ImportError."""
+    code = (
+        "import sys; sys.modules['pyarrow'] = None; sys.modules['pyarrow.parquet'] = None\n"
+        "from decision_schema import arrow_io\n"
+        "assert not arrow_io.HAVE_PYARROW\n"
+        "try:\n"
+        "    arrow_io.write_parquet([], 'x.parquet')\n"
+        "except ImportError as exc:\n"
+        "    assert 'decision-schema[arrow]' in str(exc)\n"
+        "else:\n"
+        "    raise SystemExit('expected ImportError')\n"
+        "assert arrow_io.main(['import', 'x.parquet', 'y.jsonl']) == 2\n"
+    )
+    env = {**os.environ, "PYTHONPATH": str(Path(__file__).resolve().parent.parent)}
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=tmp_path, env=env)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_round_trip_and_row_group_pruning(tmp_path, packet) -> None:
+    """Parquet round-trips packets, and run/step filters skip row groups."""
+    pytest.importorskip("pyarrow")
+    packets = [packet(r, s) for r in ("a", "b", "c") for s in range(10)]
+    packets.append(packet("c", 10, latency_ms=2.5, mismatch={"flags": ["f"], "reason_codes": []}))
+    path = tmp_path / "trace.parquet"
+    assert arrow_io.write_parquet(packets, path, batch_size=10) == 31
+
+    restored = list(arrow_io.read_parquet(path))
+    assert [p.to_dict() for p in restored] == [p.to_dict() for p in packets]
+
+    import pyarrow.parquet as pq
+
+    pf = pq.ParquetFile(path)
+    assert pf.metadata.num_row_groups == 4
+    assert arrow_io._row_groups(pf, frozenset({"b"}), None) == [1]
+    assert arrow_io._row_groups(pf, None, (10, 20)) == [3]
+    only_b = list(arrow_io.iter_parquet_dicts(path, run_ids=["b"], step_range=(2, 4)))
+    assert [(d["run_id"], d["step"]) for d in only_b] == [("b", 2), ("b", 3), ("b", 4)]
+    table = pq.read_table(path, columns=["action", "allowed"])
+    assert table.column("allowed").to_pylist()[:2] == [True, False]
+
+
+def test_cli_export_import(tmp_path, packet) -> None:
+    """The export and import subcommands round-trip a JSONL trace."""
+    pytest.importorskip("pyarrow")
+    trace = tmp_path / "trace.jsonl"
+    packets = [packet("r", s) for s in range(5)]
+    write_packets(trace, packets)
+    out, back = tmp_path / "trace.parquet", tmp_path / "back.jsonl"
+    assert arrow_io.main(["export", str(trace), str(out)]) == 0
+    assert arrow_io.main(["import", str(out), str(back)]) == 0
+    assert back.read_text() == trace.read_text()
@@ -0,0 +1,78 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for tiered trace capture policy."""
+
+import pytest
+
+from decision_schema.capture_policy import CapturePolicy, CaptureTier, run_sample_point
+from decision_schema.types import Action
+
+
+def test_fail_closed_and_mismatch_always_full(make_packet) -> None:
+    """Never lose fail-closed or mismatch packets, even at zero sample rate."""
+    policy = CapturePolicy(full_rate=0.0, reduced_rate=0.0, drop_actions=frozenset({"HOLD"}))
+    assert policy.decide(make_packet(action="HOLD")) is CaptureTier.DROP
+    assert (
+        policy.decide(make_packet(action="HOLD", mismatch={"flags": ["stale"]})) is CaptureTier.FULL
+    )
+    assert (
+        policy.decide(make_packet(action="HOLD", mismatch={"reason_codes": ["r"]}))
+        is CaptureTier.FULL
+    )
+    for key in ("harness.fail_closed", "exec.fail_closed", "fail_closed"):
+        assert policy.decide(make_packet(action="HOLD", external={key: True})) is CaptureTier.FULL
+
+
+def test_full_actions_accept_enum_values(make_packet) -> None:
+    """final_action may carry Action enums or plain strings."""
+    policy = CapturePolicy(full_rate=0.0, reduced_rate=0.0)
+    assert policy.decide(make_packet(action=Action.STOP)) is CaptureTier.FULL
+    assert policy.decide(make_packet(action="STOP")) is CaptureTier.FULL
+
+
+def test_empty_mismatch_does_not_force_full(make_packet) -> None:
+    """A serialized default MismatchInfo (empty lists) is sampled like any packet."""
+    policy = CapturePolicy(full_rate=0.0, reduced_rate=0.0)
+    empty = {"flags": [], "reason_codes": [], "throttle_refresh_ms": None, "metadata": None}
+    assert policy.decide(make_packet(action="HOLD", mismatch=empty)) is CaptureTier.DROP
+
+
+def test_long_salt_is_accepted(make_packet) -> None:
+    """Salts longer than the 64-byte BLAKE2b key limit still give distinct, stable points."""
+    long_a, long_b = "a" * 65, "a" * 64 + "b"
+    assert run_sample_point("run-7", long_a) == run_sample_point("run-7", long_a)
+    assert run_sample_point("run-7", long_a) != run_sample_point("run-7", long_b)
+    assert CapturePolicy(salt="s" * 200).decide(make_packet()) in CaptureTier
+
+
+def test_run_sampling_is_deterministic_per_run(make_packet) -> None:
+    """All packets of a run share one decision; the rate is roughly honored."""
+    assert run_sample_point("run-7") == run_sample_point("run-7")
+    assert run_sample_point("run-7") != run_sample_point("run-7", salt="other")
+    policy = CapturePolicy(full_rate=0.25)
+    tiers = [policy.decide(make_packet(f"run-{i}", action="HOLD")) for i in range(2000)]
+    full = sum(t is CaptureTier.FULL for t in tiers)
+    assert 400 < full < 600
+    assert all(t is not CaptureTier.DROP for t in tiers)
+
+
+def test_apply_reduces_snapshots(make_packet) -> None:
+    """Reduced packets drop input and unlisted context keys but keep trace keys."""
+    policy = CapturePolicy(full_rate=0.0)
+    packet = make_packet(
+        action="HOLD",
+        input={"snapshot": list(range(10))},
+        external={"now_ms": 1, "extra_ctx": 2, "exec.attempt_count": 3},
+    )
+    tier, out = policy.apply(packet)
+    assert tier is CaptureTier.REDUCED
+    assert out.input == {}
+    assert out.external == {"now_ms": 1, "exec.attempt_count": 3}
+    assert packet.input  # original untouched
+
+
+def test_invalid_rates_rejected() -> None:
+    """reduced_rate must not be below full_rate."""
+    with pytest.raises(ValueError):
+        CapturePolicy(full_rate=0.5, reduced_rate=0.1)
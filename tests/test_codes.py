@@ -0,0 +1,133 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for the reason/flag code registry and MismatchInfo bitsets."""
+
+import pytest
+
+from decision_schema.codes import (
+    CODES,
+    CodeRegistry,
+    MismatchBits,
+    bit_histogram,
+    disable_reason_interning,
+    enable_reason_interning,
+)
+from decision_schema.types import Action, FinalDecision, MismatchInfo, Proposal
+
+
+def test_ids_are_stable_and_strings_interned() -> None:
+    """Ids follow registration order; intern returns the registry's string instance."""
+    reg = CodeRegistry(["guard_a", "guard_b"])
+    assert reg.id_of("guard_a") == 0
+    assert reg.id_of("guard_c") == 2
+    assert reg.lookup("missing") is None
+    dynamic = "".join(["guard", "_b"])
+    assert reg.intern(dynamic) is reg.code_of(1)
+    assert reg.intern_list(["guard_c", "guard_a"]) == ["guard_c", "guard_a"]
+    assert CodeRegistry(reg.codes()).codes() == reg.codes()
+
+
+def test_mask_ops() -> None:
+    """Masks support membership, union and per-code histograms."""
+    reg = CodeRegistry(["a", "b", "c"])
+    m = reg.mask(["c", "a"])
+    assert m & reg.bit("a") and not m & reg.bit("b")
+    assert reg.codes_of(m | reg.bit("b")) == ["a", "b", "c"]
+    assert bit_histogram([m, reg.mask(["a"]), 0], reg) == {"a": 2, "c": 1}
+
+
+def test_registry_bound() -> None:
+    """Explicit registration beyond max_codes raises ValueError."""
+    reg = CodeRegistry(max_codes=2)
+    reg.id_of("a")
+    reg.id_of("b")
+    with pytest.raises(ValueError, match="full"):
+        reg.id_of("c")
+
+
+@pytest.mark.parametrize(
+    "flags, reason_codes",
+    [
+        ([], []),
+        (["f1", "f2"], ["r1"]),
+        (["f2", "f1"], ["r1", "r1"]),  # out of id order, duplicates
+    ],
+)
+def test_mismatch_bits_roundtrip_is_lossless(flags, reason_codes) -> None:
+    """to_bits/from_bits restores lists exactly, including order and duplicates."""
+    reg = CodeRegistry(["f1", "f2", "r1"])
+    info = MismatchInfo(flags=flags, reason_codes=reason_codes, throttle_refresh_ms=5)
+    bits = info.to_bits(reg)
+    back = MismatchInfo.from_bits(bits, reg, throttle_refresh_ms=5)
+    assert back == info
+
+
+def test_mismatch_bits_compact_and_union() -> None:
+    """Known codes become plain masks; union merges them."""
+    reg = CodeRegistry(["f1", "f2", "f3"])
+    a = MismatchInfo(flags=["f1", "f3"]).to_bits(reg)
+    assert a == MismatchBits(flags=0b101)
+    assert a.has_flag(reg.bit("f3"))
+    assert not a.has_flag(reg.bit("f2"))
+    b = MismatchInfo(flags=["f2"], reason_codes=["f1"]).to_bits(reg)
+    u = a.union(b)
+    assert u.flag_list(reg) == ["f1", "f2", "f3"]
+    assert u.has_reason_code(reg.bit("f1"))
+
+
+@pytest.mark.parametrize(
+    "flags",
+    [["f1", "new"], ["new", "f1"], ["new", "new", "f2"], ["x", "y"]],
+)
+def test_unknown_codes_roundtrip_without_growing_registry(flags) -> None:
+    """Unknown codes go to the sidecar; the registry is not changed."""
+    reg = CodeRegistry(["f1", "f2"])
+    info = MismatchInfo(flags=flags, reason_codes=["r_unknown"])
+    bits = info.to_bits(reg)
+    assert len(reg) == 2
+    assert MismatchInfo.from_bits(bits, reg) == info
+    assert "new" not in reg and "r_unknown" in bits.extra_reason_codes
+
+
+def test_default_registry_never_fills_up() -> None:
+    """Free-form flags through the global CODES registry never make to_bits raise."""
+    before = len(CODES)
+    for i in range(CODES.max_codes + 10):
+        info = MismatchInfo(flags=[f"free_form_{i}"])
+        assert MismatchInfo.from_bits(info.to_bits()) == info
+    assert len(CODES) == before
+
+
+def test_register_opt_in_falls_back_to_sidecar_when_full() -> None:
+    """register=True grows the registry up to max_codes, then uses the sidecar."""
+    reg = CodeRegistry(max_codes=1)
+    bits = MismatchInfo(flags=["a", "b"]).to_bits(reg, register=True)
+    assert reg.codes() == ("a",)
+    assert bits == MismatchBits(flags=0b1, extra_flags=("b",))
+    assert bits.flag_list(reg) == ["a", "b"]
+
+
+def test_union_keeps_extras() -> None:
+    """Union merges sidecar codes without duplicates."""
+    reg = CodeRegistry(["f1"])
+    a = MismatchInfo(flags=["x", "f1"]).to_bits(reg)
+    b = MismatchInfo(flags=["y", "x"]).to_bits(reg)
+    assert a.union(b).flag_list(reg) == ["f1", "x", "y"]
+
+
+def test_reason_interning_is_opt_in() -> None:
+    """Proposal / FinalDecision intern registered reasons only while interning is enabled."""
+    reg = CodeRegistry(["guard_ok"])
+    dynamic = "".join(["guard", "_ok"])
+    assert Proposal(Action.ACT, 0.5, reasons=[dynamic]).reasons[0] is not reg.code_of(0)
+    enable_reason_interning(reg)
+    try:
+        other = "".join(["step_", "42"])
+        p = Proposal(Action.ACT, 0.5, reasons=[dynamic, other])
+        assert p.reasons[0] is reg.code_of(0)
+        assert p.reasons[1] is other  # unregistered: left as-is, not sys.intern'd
+        assert FinalDecision(Action.STOP, reasons=[other]).reasons[0] is other
+        assert len(reg) == 1
+    finally:
+        disable_reason_interning()
@@ -0,0 +1,84 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for DecisionContext."""
+
+import copy
+import pickle
+from collections.abc import Mapping
+
+import pytest
+
+from decision_schema import DecisionContext
+from decision_schema.packet_v2 import PacketV2
+from decision_schema.trace_registry import validate_external_dict
+
+
+def test_attributes_and_mapping_view() -> None:
+    """Provided keys are attributes and Mapping entries; unset keys are None / absent."""
+    ctx = DecisionContext(now_ms=1000, ops_state="GREEN", ops_cooldown_until_ms=None)
+    assert isinstance(ctx, Mapping)
+    assert ctx.now_ms == 1000
+    assert ctx["ops_state"] == "GREEN"
+    assert "ops_cooldown_until_ms" in ctx
+    assert ctx.run_id is None
+    assert "run_id" not in ctx
+    assert ctx.get("run_id", "missing") == "missing"
+    assert dict(ctx) == {"now_ms": 1000, "ops_state": "GREEN", "ops_cooldown_until_ms": None}
+    assert ctx == {"now_ms": 1000, "ops_state": "GREEN", "ops_cooldown_until_ms": None}
+
+
+def test_from_mapping_validates_extra_keys_once() -> None:
+    """Undocumented keys become extras and must be valid context keys."""
+    ctx = DecisionContext.from_mapping({"now_ms": 5, "state": "idle"})
+    assert ctx["state"] == "idle"
+    assert DecisionContext.from_mapping(ctx) is ctx
+    with pytest.raises(ValueError, match="INV-T1:invalid_context_key_format"):
+        DecisionContext.from_mapping({"now_ms": 5, "Bad-Key": 1})
+    with pytest.raises(TypeError):
+        DecisionContext(not_a_key=1)
+    with pytest.raises(TypeError, match="INV-T1:key_not_str"):
+        DecisionContext(extra={1: "x"})
+
+
+def test_immutable_and_replace() -> None:
+    """Contexts are immutable; replace() returns an updated copy."""
+    ctx = DecisionContext(now_ms=1, ops_deny_actions=False)
+    with pytest.raises(AttributeError):
+        ctx.now_ms = 2
+    newer = ctx.replace(now_ms=2, state="busy")
+    assert (ctx.now_ms, newer.now_ms) == (1, 2)
+    assert newer["state"] == "busy"
+    assert newer.ops_deny_actions is False
+
+
+def test_copy_and_pickle_round_trip() -> None:
+    """Copies and pickles rebuild an equal context instead of writing slots."""
+    ctx = DecisionContext(now_ms=1, ops_state=None, extra={"state": ["idle"]})
+    assert copy.copy(ctx) is ctx
+    deep = copy.deepcopy(ctx)
+    assert deep == ctx and deep.now_ms == 1 and "ops_state" in deep
+    assert deep["state"] is not ctx["state"]
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        restored = pickle.loads(pickle.dumps(ctx, protocol))
+        assert isinstance(restored, DecisionContext)
+        assert restored == ctx and list(restored) == list(ctx)
+        assert restored.run_id is None and "run_id" not in restored
+
+
+def test_snapshot_into_packet_external() -> None:
+    """to_external() is a plain dict accepted by validate_external_dict(mode='context')."""
+    ctx = DecisionContext(now_ms=7, run_id="r1", extra={"state": "ok"})
+    external = ctx.to_external()
+    assert type(external) is dict
+    assert validate_external_dict(external, mode="context") == []
+    packet = PacketV2(
+        run_id="r1",
+        step=0,
+        input={},
+        external=external,
+        mdm={},
+        final_action={},
+        latency_ms=0,
+    )
+    assert packet.to_dict()["external"] == {"now_ms": 7, "run_id": "r1", "state": "ok"}
@@ -0,0 +1,88 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for canonical packet hashing and streaming deduplication."""
+
+import pytest
+
+from decision_schema.dedup import PacketDeduplicator, canonical_packet_bytes, packet_hash
+from decision_schema.trace_io import read_packets, write_packets
+
+
+def test_hash_is_stable_across_key_order_and_float_form(make_packet) -> None:
+    """Key order and 2.0 vs 2 do not change the hash; content and version do."""
+    a = make_packet(action="ACT", input={"b": 1, "a": 2.0})
+    b = make_packet(action="ACT", input={"a": 2, "b": 1})
+    assert packet_hash(a) == packet_hash(b)
+    assert packet_hash(a) == packet_hash(a.to_dict())
+    assert packet_hash(a) != packet_hash(make_packet(step=2, action="ACT", input=a.input))
+    assert packet_hash(a) != packet_hash(
+        make_packet(action="ACT", input=a.input, schema_version="0.1.0")
+    )
+    assert canonical_packet_bytes(make_packet(input={"x": -0.0})) == canonical_packet_bytes(
+        make_packet(input={"x": 0})
+    )
+
+
+def test_hash_rejects_non_finite_floats(make_packet) -> None:
+    """NaN has no canonical form."""
+    with pytest.raises(ValueError):
+        packet_hash(make_packet(input={"x": float("nan")}))
+
+
+def test_lru_dedup_drops_exact_duplicates_and_reports_ratio(make_packet) -> None:
+    """Duplicates are dropped; ratio is duplicates / total."""
+    dedup = PacketDeduplicator(max_entries=10)
+    packets = [
+        make_packet(step=1),
+        make_packet(step=2),
+        make_packet(step=1),
+        make_packet(step=2),
+        make_packet(step=3),
+    ]
+    kept = list(dedup.filter(packets))
+    assert [p.step for p in kept] == [1, 2, 3]
+    assert dedup.stats.total == 5
+    assert dedup.stats.duplicates == 2
+    assert dedup.stats.dedup_ratio == pytest.approx(0.4)
+
+
+def test_lru_dedup_memory_is_bounded(make_packet) -> None:
+    """A duplicate outside the LRU window is no longer detected."""
+    dedup = PacketDeduplicator(max_entries=2)
+    kept = list(
+        dedup.filter(
+            [make_packet(step=1), make_packet(step=2), make_packet(step=3), make_packet(step=1)]
+        )
+    )
+    assert len(kept) == 4
+
+
+def test_bloom_dedup_mode(make_packet) -> None:
+    """Bloom mode drops duplicates with fixed memory."""
+    dedup = PacketDeduplicator(max_entries=1000, mode="bloom")
+    packets = [make_packet(step=i) for i in range(200)] * 2
+    kept = list(dedup.filter(packets))
+    assert len(kept) <= 200
+    assert len(kept) >= 195
+    assert dedup.stats.duplicates >= 200
+
+
+def test_dedup_on_trace_round_trip(tmp_path, make_packet) -> None:
+    """Dedup composes with JSONL read/write."""
+    path = tmp_path / "trace.jsonl"
+    dedup = PacketDeduplicator()
+    assert (
+        write_packets(
+            path, dedup.filter([make_packet(step=1), make_packet(step=1), make_packet(step=2)])
+        )
+        == 2
+    )
+    steps = [p.step for p in PacketDeduplicator().filter(read_packets(path))]
+    assert steps == [1, 2]
+
+
+def test_invalid_mode_rejected() -> None:
+    """Unknown dedup mode raises ValueError."""
+    with pytest.raises(ValueError):
+        PacketDeduplicator(mode="exact")
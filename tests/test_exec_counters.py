@@ -0,0 +1,162 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for mergeable exec.* counter aggregation."""
+
+import json
+import threading
+
+import pytest
+
+from decision_schema.exec_counters import (
+    EXEC_COUNT_KEYS,
+    ExecCounters,
+    count_traces,
+    main,
+    merge_checkpoints,
+)
+from decision_schema.trace_io import write_packets
+
+
+def _exec(**counts) -> dict:
+    return {f"exec.{k}": v for k, v in counts.items()}
+
+
+def test_sums_per_run_and_total(make_packet) -> None:
+    """Counter values are summed per run and over all runs."""
+    c = ExecCounters(worker_id="w1")
+    c.add(make_packet("a", 0, external=_exec(attempt_count=2, success_count=1, failed_count=1)))
+    c.add_all(
+        [
+            make_packet("a", 1, external=_exec(attempt_count=1, denied_count=1)),
+            make_packet("b", 0, external=_exec(skipped_count=3)),
+        ]
+    )
+    assert c.run_totals("a") == {
+        "packets": 2,
+        "exec.attempt_count": 3,
+        "exec.success_count": 1,
+        "exec.failed_count": 1,
+        "exec.skipped_count": 0,
+        "exec.denied_count": 1,
+    }
+    assert c.by_run()["b"]["exec.skipped_count"] == 3
+    assert c.totals()["packets"] == 3 and c.totals()["exec.attempt_count"] == 3
+    assert c.run_totals("unseen")["packets"] == 0
+
+
+def test_rejects_bad_values_and_run_ids(make_packet) -> None:
+    """Negative, bool and float values and missing run_ids are counted as rejected."""
+    c = ExecCounters()
+    c.add(
+        make_packet("a", 0, external=_exec(attempt_count=-1, success_count=True, failed_count=1.5))
+    )
+    c.add({"run_id": None, "external": {"exec.attempt_count": 1}})
+    assert c.rejected == 4
+    assert c.totals()["exec.attempt_count"] == 0 and c.totals()["packets"] == 1
+    assert c.add_all([{"run_id": "a", "external": [1]}, make_packet("a", 1)]) == 2
+    assert c.rejected == 5 and c.totals()["packets"] == 2
+
+
+def test_unregistered_key_raises() -> None:
+    """Tracking an unregistered key raises INV-T1:unregistered_key."""
+    with pytest.raises(ValueError, match="INV-T1:unregistered_key:exec.made_up"):
+        ExecCounters(("exec.made_up",))
+
+
+def test_increment() -> None:
+    """increment adds to tracked keys only, and only non-negative amounts."""
+    c = ExecCounters()
+    c.increment("a", "exec.success_count", 5)
+    assert c.run_totals("a")["exec.success_count"] == 5
+    with pytest.raises(ValueError):
+        c.increment("a", "exec.total_latency_ms")
+    with pytest.raises(ValueError):
+        c.increment("a", "exec.success_count", -1)
+
+
+def test_merge_is_idempotent_and_order_free(make_packet) -> None:
+    """Repeated merges in any order give exact fleet totals."""
+    w1, w2 = ExecCounters(worker_id="w1"), ExecCounters(worker_id="w2")
+    w1.add(make_packet("a", 0, external=_exec(attempt_count=2)))
+    w2.add(make_packet("a", 0, external=_exec(attempt_count=5)))
+    w2.add(make_packet("b", 0, external=_exec(attempt_count=1)))
+
+    fleet = ExecCounters(worker_id="agg")
+    fleet.merge(w1.snapshot())
+    fleet.merge(w2)
+    fleet.merge(w1.snapshot())  # repeated merges do not double count
+    assert fleet.totals()["exec.attempt_count"] == 8
+    assert fleet.workers == ["w1", "w2"]
+
+    # Periodic swap: w1 advances, merges w2 back in; totals stay exact.
+    w1.add(make_packet("a", 1, external=_exec(attempt_count=10)))
+    w1.merge(w2)
+    w2.merge(w1)
+    fleet.merge(w2)
+    assert w1.totals() == w2.totals() == fleet.totals()
+    assert fleet.run_totals("a")["exec.attempt_count"] == 17
+
+
+def test_merge_rejects_mismatched_state() -> None:
+    """Merging an unknown format or a different key list raises ValueError."""
+    c = ExecCounters()
+    with pytest.raises(ValueError, match="format"):
+        c.merge({"format": 99, "keys": list(EXEC_COUNT_KEYS), "workers": {}})
+    with pytest.raises(ValueError, match="key mismatch"):
+        c.merge(ExecCounters(("exec.attempt_count",)))
+
+
+def test_checkpoint_resume(tmp_path, make_packet) -> None:
+    """A worker resumed from its checkpoint keeps counting in the same slot."""
+    path = tmp_path / "w1.json"
+    c = ExecCounters(worker_id="w1")
+    c.add(make_packet("a", 0, external=_exec(attempt_count=2)))
+    c.save_checkpoint(path)
+    assert not (tmp_path / "w1.json.tmp").exists()
+
+    resumed = ExecCounters.load_checkpoint(path, worker_id="w1")
+    resumed.add(make_packet("a", 1, external=_exec(attempt_count=3)))
+    assert resumed.workers == ["w1"]
+    assert resumed.totals()["exec.attempt_count"] == 5
+
+
+def test_merge_checkpoints_and_cli(tmp_path, capsys, make_packet) -> None:
+    """Checkpoint files merge into fleet totals, both in the API and the CLI."""
+    for i in range(3):
+        c = ExecCounters(worker_id=f"w{i}")
+        c.add(make_packet(f"r{i}", 0, external=_exec(success_count=i + 1)))
+        c.save_checkpoint(tmp_path / f"w{i}.json")
+    paths = sorted(tmp_path.glob("*.json"))
+    assert merge_checkpoints(paths).totals()["exec.success_count"] == 6
+    assert main([str(p) for p in paths] + ["--by-run"]) == 0
+    out = json.loads(capsys.readouterr().out)
+    assert out["workers"] == 3 and out["runs"]["r2"]["exec.success_count"] == 3
+
+
+def test_count_traces_matches_live_counting(tmp_path, make_packet) -> None:
+    """Backfilling from a trace gives the same totals as counting live."""
+    packets = [
+        make_packet(f"r{i % 3}", i, external=_exec(attempt_count=1, success_count=i % 2))
+        for i in range(30)
+    ]
+    write_packets(tmp_path / "t.jsonl", packets)
+    live = ExecCounters()
+    live.add_all(packets)
+    assert count_traces([tmp_path / "t.jsonl"]).by_run() == live.by_run()
+
+
+def test_threads(make_packet) -> None:
+    """Concurrent add calls lose no increments."""
+    c = ExecCounters()
+
+    def work() -> None:
+        for i in range(1000):
+            c.add(make_packet("a", i, external=_exec(attempt_count=1)))
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert c.totals()["exec.attempt_count"] == 4000
@@ -10,6 +10,8 @@ domain-specific terminology (trading, market, order, bid, ask, exchange, etc.).
 import re
 from pathlib import Path
 
+from decision_schema.term_scan import TermScanner
+
 # Hard terms: domain-specific (fail if found in public surface)
 # Soft terms (execution, position, order) not included to allow generic use
 FORBIDDEN_TERMS = {
@@ -36,6 +38,9 @@ FORBIDDEN_TERMS = {
     "stop_loss",
 }
 
+# One Aho-Corasick pass per line for all terms (word-boundary, case-insensitive).
+SCANNER = TermScanner(FORBIDDEN_TERMS)
+
 # Files/directories to check
 PUBLIC_SURFACE_PATHS = [
     "README.md",
@@ -94,15 +99,8 @@ def check_file_for_domain_terms(file_path: Path) -> list[tuple[int, str, str]]:
         # Skip binary files
         return violations
 
-    lines = content.split("\n")
-
-    for line_num, line in enumerate(lines, start=1):
-        line_lower = line.lower()
-        for term in FORBIDDEN_TERMS:
-            # Use word boundaries to avoid false positives
-            pattern = r"\b" + re.escape(term) + r"\b"
-            if re.search(pattern, line_lower):
-                violations.append((line_num, term, line.strip()))
+    for line_num, term, line in SCANNER.scan_lines(content.split("\n")):
+        violations.append((line_num, term, line.strip()))
 
     return violations
 
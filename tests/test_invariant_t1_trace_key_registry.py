@@ -70,6 +70,10 @@ def test_inv_t1_registry_is_well_formed_and_namespaced() -> None:
     assert "exec.denied_count" in EXTERNAL_KEY_REGISTRY
     assert "exec.fail_closed" in EXTERNAL_KEY_REGISTRY
     assert "exec.attempt_count" in EXTERNAL_KEY_REGISTRY
+    # Stage timing keys written by decision_schema.timing.
+    assert "harness.proposal_latency_ms" in EXTERNAL_KEY_REGISTRY
+    assert "harness.modulation_latency_ms" in EXTERNAL_KEY_REGISTRY
+    assert "harness.ops_latency_ms" in EXTERNAL_KEY_REGISTRY
 
     for k, meta in EXTERNAL_KEY_REGISTRY.items():
         assert TRACE_KEY_RE.match(k), f"registry key must match TRACE_KEY_RE: {k}"
@@ -0,0 +1,116 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for the external key usage / cardinality profiler."""
+
+import pytest
+
+from decision_schema.key_profile import (
+    ExternalKeyProfiler,
+    main,
+    profile_traces,
+)
+from decision_schema.trace_io import write_packets
+
+
+def _rows(profiler: ExternalKeyProfiler, **kwargs) -> dict:
+    return {row.key: row for row in profiler.report(**kwargs)}
+
+
+def test_hyperloglog_estimates_within_error(make_packet) -> None:
+    """Distinct estimates stay within 5% for small (linear counting) and large cardinalities."""
+    for n in (50, 20_000):
+        profiler = ExternalKeyProfiler()
+        for i in range(n):
+            profiler.add(make_packet(step=i, external={"k": str(i)}))
+        distinct = _rows(profiler)["k"].distinct_estimate
+        assert abs(distinct - n) / n < 0.05
+
+
+def test_usage_counts_types_and_top_values(make_packet) -> None:
+    profiler = ExternalKeyProfiler()
+    for i in range(1000):
+        profiler.add(
+            make_packet(
+                step=i, external={"ops_state": "RED" if i % 4 == 0 else "GREEN", "now_ms": i}
+            )
+        )
+    profiler.add(make_packet(step=1000, external={"ops_state": None}))
+    rows = _rows(profiler)
+    state = rows["ops_state"]
+    assert state.occurrences == 1001 and state.presence == 1.0
+    assert state.types == {"str": 1000, "null": 1}
+    assert state.distinct_estimate == 3
+    assert state.top_values[0] == ('"GREEN"', 750)
+    assert profiler.value_count("ops_state", "RED") >= 250
+    assert profiler.value_count("missing", "RED") == 0
+    assert 950 <= rows["now_ms"].distinct_estimate <= 1050
+    assert rows["now_ms"].presence == pytest.approx(1000 / 1001)
+
+
+def test_flags(make_packet) -> None:
+    profiler = ExternalKeyProfiler()
+    for i in range(300):
+        profiler.add(
+            make_packet(
+                step=i,
+                external={
+                    "exec.attempt_count": 1,
+                    "exec.made_up": 1,
+                    "plugin.depth": 1,
+                    "my_context": 1,
+                    "request_token": f"tok-{i}",
+                    "now_ms": i,
+                    "123": 1,
+                    "ops-state": 1,
+                    "a b": 1,
+                },
+            )
+        )
+    rows = _rows(profiler, cardinality_limit=100)
+    assert rows["exec.attempt_count"].flags == [] and rows["exec.attempt_count"].registered
+    assert rows["exec.made_up"].flags == ["unregistered_reserved"]
+    assert rows["plugin.depth"].flags == []  # not a reserved namespace
+    assert rows["my_context"].flags == ["undocumented_context"]
+    assert rows["request_token"].flags == ["undocumented_context", "exploding_cardinality"]
+    assert rows["now_ms"].flags == []  # expected to be unbounded
+    # Classification follows CONTEXT_KEY_RE, as validation does.
+    assert rows["123"].kind == "context" and rows["123"].flags == ["undocumented_context"]
+    assert rows["ops-state"].kind == rows["a b"].kind == "invalid"
+
+
+def test_merge_equals_single_pass_and_state_round_trip(tmp_path, make_packet) -> None:
+    packets = [
+        make_packet(step=i, external={"ops_state": ("GREEN", "RED")[i % 2], "now_ms": i})
+        for i in range(400)
+    ]
+    whole = ExternalKeyProfiler()
+    whole.add_all(packets)
+    a, b = ExternalKeyProfiler(), ExternalKeyProfiler()
+    a.add_all(packets[:150])
+    b.add_all(packets[150:])
+    b.save(tmp_path / "b.json")
+    a.merge(ExternalKeyProfiler.load(tmp_path / "b.json"))
+    merged, single = a.to_dict(), whole.to_dict()
+    assert merged["packets"] == single["packets"] == 400
+    for key in ("ops_state", "now_ms"):
+        for part in ("occurrences", "types", "hll", "cms"):
+            assert merged["keys"][key][part] == single["keys"][key][part]
+    assert merged["keys"]["ops_state"]["top"] == {'"GREEN"': 200, '"RED"': 200}
+    with pytest.raises(ValueError, match="cannot merge"):
+        a.merge(ExternalKeyProfiler(precision=10))
+
+
+def test_max_keys_and_cli(tmp_path, make_packet) -> None:
+    profiler = ExternalKeyProfiler(max_keys=1)
+    profiler.add(make_packet(step=0, external={"now_ms": 1, "run_id": "r"}))
+    assert list(profiler.keys) == ["now_ms"] and profiler.dropped_keys == 1
+
+    trace = tmp_path / "trace.jsonl"
+    write_packets(trace, [make_packet(step=i, external={"now_ms": i}) for i in range(3)])
+    assert profile_traces([trace]).packets == 3
+    state = tmp_path / "state.json"
+    assert main([str(trace), "--save-state", str(state), "--max-keys", "5"]) == 0
+    assert ExternalKeyProfiler.load(state).max_keys == 5
+    write_packets(trace, [make_packet(step=0, external={"exec.made_up": 1})])
+    assert main([str(trace), "--load-state", str(state)]) == 1
@@ -0,0 +1,111 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for whole-packet validation (INV-P1)."""
+
+from functools import partial
+
+import pytest
+
+from decision_schema import trace_registry
+from decision_schema.packet_v2 import PacketV2
+from decision_schema.packet_validation import (
+    PacketValidator,
+    validate_packet,
+    validate_packets,
+)
+from decision_schema.trace_registry import register_external_key
+
+
+@pytest.fixture
+def packet(make_packet):
+    """Valid packet dict factory; keyword fields override."""
+    return partial(make_packet, run_id="r1", action="ACT", as_dict=True)
+
+
+def test_valid_packet_and_object_pass(packet) -> None:
+    full = packet(
+        external={"now_ms": 1, "exec.attempt_count": 2},
+        mdm={"action": "ACT", "confidence": 0.5},
+        final_action={"action": "ACT", "allowed": True},
+        latency_ms=3,
+    )
+    assert validate_packet(full) == []
+    assert validate_packet(PacketV2.from_dict(full)) == []
+    assert validate_packet(packet(latency_ms=1.5, mdm={})) == []
+
+
+def test_collect_all_reports_every_error(packet) -> None:
+    bad = packet(
+        step=-1,
+        latency_ms="3",
+        mdm={"confidence": 1.5},
+        final_action={"action": "JUMP"},
+        schema_version="1.0.0",
+        external={"BadKey": 1},
+    )
+    del bad["input"]
+    assert validate_packet(bad) == [
+        "INV-P1:step_negative",
+        "INV-P1:missing_field:input",
+        "INV-T1:invalid_key_format:BadKey",
+        "INV-P1:confidence_out_of_range",
+        "INV-P1:unknown_action:JUMP",
+        "INV-P1:latency_not_number",
+        "INV-P1:schema_version_incompatible:1.0.0",
+    ]
+    assert validate_packet(bad, fail_fast=True) == ["INV-P1:step_negative"]
+
+
+def test_type_checks(packet) -> None:
+    assert validate_packet(packet(step=True)) == ["INV-P1:step_not_int"]
+    assert validate_packet(packet(run_id="")) == ["INV-P1:run_id_empty"]
+    assert validate_packet(packet(final_action={})) == ["INV-P1:action_missing"]
+    assert validate_packet(packet(mismatch={"flags": "x"})) == ["INV-P1:mismatch_flags_not_list"]
+    assert validate_packet([1, 2]) == ["INV-P1:packet_not_mapping"]
+    assert validate_packet(packet(latency_ms=-0.5)) == ["INV-P1:latency_negative"]
+    for value in (float("nan"), float("inf"), float("-inf")):
+        assert validate_packet(packet(latency_ms=value)) == ["INV-P1:latency_not_finite"]
+
+
+def test_unhashable_values_are_reported_not_raised(packet) -> None:
+    assert validate_packet(packet(final_action={"action": ["ACT"]})) == [
+        "INV-P1:unknown_action:['ACT']"
+    ]
+    assert validate_packet(packet(schema_version=["0.2.2"])) == [
+        "INV-P1:schema_version_incompatible:['0.2.2']"
+    ]
+    assert validate_packet(packet(schema_version={"v": 1}), fail_fast=True) == [
+        "INV-P1:schema_version_incompatible:{'v': 1}"
+    ]
+
+
+def test_schema_range_and_strict_registry(packet) -> None:
+    validator = PacketValidator(min_minor=3, require_registry_for_prefixes={"exec"})
+    assert validator(packet(schema_version="0.3.0")) == []
+    assert validator(packet()) == ["INV-P1:schema_version_incompatible:0.2.2"]
+    unregistered = packet(schema_version="0.3.0", external={"exec.queue_depth": 1})
+    assert validator(unregistered) == ["INV-T1:unregistered_key:exec.queue_depth"]
+    saved = trace_registry._snapshot
+    try:
+        register_external_key(
+            "exec.queue_depth", owner="test", introduced_in="0.2.2", description="Test key."
+        )
+        assert validator(unregistered) == []  # cached key results follow the new snapshot
+    finally:
+        trace_registry._runtime_entries.pop("exec.queue_depth", None)
+        trace_registry._snapshot = saved
+
+
+def test_validate_packets_modes(packet) -> None:
+    packets = [packet(step=i) for i in range(5)]
+    packets[1]["step"] = -1
+    packets[3]["latency_ms"] = None
+    report = validate_packets(packets)
+    assert (report.checked, report.invalid, report.ok) == (5, 2, False)
+    assert [(i, step) for i, _, step, _ in report.errors] == [(1, -1), (3, 3)]
+    assert report.code_counts == {"INV-P1:step_negative": 1, "INV-P1:latency_not_number": 1}
+
+    gate = validate_packets(packets, fail_fast=True)
+    assert (gate.checked, gate.invalid, gate.stopped_early) == (2, 1, True)
+    assert validate_packets(packets[:1]).ok
@@ -0,0 +1,90 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for the lazy PacketV2 view."""
+
+import json
+
+import pytest
+
+from decision_schema.packet_view import FRAME_MAGIC, PacketV2View, encode_frame
+from decision_schema.trace_io import dumps_packet
+
+
+@pytest.fixture
+def packet(make_packet):
+    """A packet with escaped strings and nesting in its sections."""
+    return make_packet(
+        'run "q"\\1',
+        3,
+        input={"nested": {"list": [1, {"s": '}]{[\\"'}], "deep": [[[[]]]]}},
+        external={"ops_state": "GREEN", "exec.attempt_count": 2},
+        mdm={"score": -0.5},
+        final_action={"action": "STOP", "allowed": False},
+        latency_ms=12,
+        mismatch={"flags": ["a"]},
+    )
+
+
+@pytest.mark.parametrize(
+    "encode",
+    [encode_frame, lambda p: memoryview(encode_frame(p)), lambda p: bytearray(encode_frame(p))],
+    ids=["bytes", "memoryview", "bytearray"],
+)
+def test_view_matches_packet(encode, packet) -> None:
+    """Scalars are decoded eagerly, dict fields on first access; to_packet round-trips."""
+    view = PacketV2View(encode(packet))
+    assert (view.run_id, view.step, view.latency_ms) == (packet.run_id, 3, 12)
+    assert view.schema_version == packet.schema_version
+    assert view.decoded_fields() == frozenset()
+    assert view.final_action["action"] == "STOP"
+    assert view.decoded_fields() == {"final_action"}
+    assert view.final_action is view.final_action  # cached
+    assert dict(view.input) == packet.input
+    assert view.to_packet() == packet
+
+
+def test_view_is_read_only(packet) -> None:
+    """Attributes cannot be assigned and top-level dict fields are read-only mappings."""
+    view = PacketV2View(encode_frame(packet))
+    with pytest.raises(AttributeError):
+        view.step = 4
+    with pytest.raises(TypeError):
+        view.external["ops_state"] = "RED"
+
+
+def test_missing_optional_field_and_raw() -> None:
+    """Absent fields read as None; raw() returns the field's undecoded JSON."""
+    data = {"run_id": "r", "step": 1, "external": {}}
+    view = PacketV2View(encode_frame(data))
+    assert view.mismatch is None
+    assert view.latency_ms is None
+    assert view.raw("external") == b"{}"
+    assert view.raw("mdm") is None
+    assert PacketV2View(encode_frame(data)).to_dict() == data
+
+
+def test_json_records_and_malformed_frames_are_rejected(packet) -> None:
+    """Only binary frames are accepted; truncated or incomplete frames raise ValueError."""
+    frame = encode_frame(packet)
+    bad = [
+        dumps_packet(packet).encode(),
+        frame[:40],
+        FRAME_MAGIC + frame[4:-10],
+        encode_frame({"run_id": "r"}),
+    ]
+    for buf in bad:
+        with pytest.raises(ValueError):
+            PacketV2View(buf)
+
+
+def test_nested_values() -> None:
+    """Deeply nested dict fields decode like json.loads."""
+    deep: dict = {}
+    cur = deep
+    for _ in range(40):
+        cur["n"] = {}
+        cur = cur["n"]
+    view = PacketV2View(encode_frame({"run_id": "r", "step": 0, "input": deep, "latency_ms": 1}))
+    assert view.latency_ms == 1
+    assert dict(view.input) == json.loads(json.dumps(deep))
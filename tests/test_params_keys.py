@@ -0,0 +1,85 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for params key validation (PARAMETER_INDEX namespacing rules)."""
+
+import pytest
+
+from decision_schema.packet_v2 import PacketV2
+from decision_schema.params_keys import (
+    ParamsKeyValidator,
+    audit_packet_params,
+    disable_params_key_checks,
+    enable_params_key_checks,
+    validate_params,
+)
+from decision_schema.types import Action, FinalDecision, Proposal
+
+
+@pytest.fixture
+def checks():
+    yield enable_params_key_checks
+    disable_params_key_checks()
+
+
+def test_validate_params_rules() -> None:
+    """Keys must be namespaced and must not use reserved prefixes."""
+    assert validate_params(None) == []
+    assert validate_params({"robotics:state": 1, "value": 2, "a_b:c.d-e": 3}) == []
+    assert validate_params({"state": 1, "Robotics:state": 2, "robotics:": 3, 4: 4}) == [
+        "INV-PARAM-KEY:not_namespaced:state",
+        "INV-PARAM-KEY:not_namespaced:Robotics:state",
+        "INV-PARAM-KEY:not_namespaced:robotics:",
+        "INV-PARAM-KEY:key_not_str",
+    ]
+    assert validate_params({"x_lab:k": 1, "example_domain:k": 2, "_private_k": 3}) == [
+        "INV-PARAM-KEY:reserved_prefix:x_lab:k",
+        "INV-PARAM-KEY:reserved_prefix:example_domain:k",
+        "INV-PARAM-KEY:reserved_prefix:_private_k",
+    ]
+
+
+def test_allow_reserved_and_bounded_cache() -> None:
+    """allow_reserved lifts chosen prefixes, and the verdict cache stays bounded."""
+    validator = ParamsKeyValidator(allow_reserved=("example_",), cache_size=2)
+    assert validator.validate({"example_domain:k": 1}) == []
+    assert validator.validate({"x_lab:k": 1}) == ["INV-PARAM-KEY:reserved_prefix:x_lab:k"]
+    assert validator.validate({"bare": 1}) == ["INV-PARAM-KEY:not_namespaced:bare"]
+    assert len(validator._verdicts) == 2  # third verdict computed but not cached
+
+
+def test_constructor_checks_are_opt_in(checks) -> None:
+    """Contract constructors check params only when enabled, by raising or warning."""
+    Proposal(action=Action.ACT, confidence=0.5, params={"bare": 1})  # disabled: accepted
+    checks()
+    with pytest.raises(ValueError, match="not_namespaced:bare"):
+        Proposal(action=Action.ACT, confidence=0.5, params={"bare": 1})
+    with pytest.raises(ValueError, match="reserved_prefix"):
+        FinalDecision(action=Action.HOLD, params={"x_lab:k": 1})
+    Proposal(action=Action.ACT, confidence=0.5, params={"robotics:k": 1})
+    checks(on_error="warn")
+    with pytest.warns(UserWarning, match="not_namespaced:bare"):
+        FinalDecision(action=Action.HOLD, params={"bare": 1})
+    with pytest.raises(ValueError, match="on_error"):
+        checks(on_error="ignore")
+
+
+def test_audit_packet_params() -> None:
+    """The audit counts invalid mdm and final_action params across packets."""
+
+    def packet(step: int, params: dict) -> PacketV2:
+        return PacketV2(
+            run_id="r",
+            step=step,
+            input={},
+            external={},
+            mdm={"action": "ACT", "params": params},
+            final_action={"action": "ACT", "params": params},
+            latency_ms=1,
+        )
+
+    packets = [packet(0, {"robotics:k": 1}), packet(1, {"bare": 1}).to_dict(), packet(2, {})]
+    audit = audit_packet_params(packets)
+    assert (audit.packets, audit.params_dicts, audit.invalid, audit.ok) == (3, 6, 2, False)
+    assert audit.code_counts == {"INV-PARAM-KEY:not_namespaced:bare": 2}
+    assert audit.examples[0] == ("r", 1, "mdm", ["INV-PARAM-KEY:not_namespaced:bare"])
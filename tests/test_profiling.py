@@ -0,0 +1,72 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for opt-in contract operation profiling hooks."""
+
+import io
+
+from decision_schema import profiling
+from decision_schema.packet_v2 import PacketV2
+from decision_schema.profiling import (
+    disable_profiling,
+    enable_profiling,
+    print_profile_report,
+    set_profile_hook,
+)
+from decision_schema.trace_registry import validate_external_dict
+from decision_schema.types import Action, MismatchInfo, Proposal
+
+
+def test_collector_records_operations(make_packet) -> None:
+    """Enabled profiling counts calls, ns and payload sizes per operation."""
+    collector = enable_profiling()
+    try:
+        packet = make_packet(action="HOLD", input={"a": 1, "b": 2}, external={"now_ms": 1})
+        data = packet.to_dict()
+        PacketV2.from_dict(data)
+        validate_external_dict({"now_ms": 1, "run_id": "r"})
+        Proposal(action=Action.ACT, confidence=0.5, reasons=["x"], params={"a": 1})
+        MismatchInfo(flags=["f"])
+    finally:
+        disable_profiling()
+    ops = collector.ops
+    assert ops["PacketV2.to_dict"].calls == 1
+    assert ops["PacketV2.to_dict"].total_size == 4
+    assert ops["PacketV2.from_dict"].calls == 1
+    assert ops["validate_external_dict"].total_size == 2
+    assert ops["Proposal"].total_size == 2
+    assert ops["MismatchInfo"].calls == 1
+    assert ops["PacketV2"].calls == 2
+    assert all(s.total_ns >= 0 for s in ops.values())
+
+
+def test_disabled_restores_constructors_and_reports_nothing(make_packet) -> None:
+    """After disable, hook is None and constructors are the originals."""
+    original = Proposal.__init__
+    collector = enable_profiling()
+    assert Proposal.__init__ is not original
+    disable_profiling()
+    assert profiling.hook is None
+    assert Proposal.__init__ is original
+    make_packet().to_dict()
+    assert collector.ops == {}
+
+
+def test_custom_callback_and_report(make_packet) -> None:
+    """Any callable can be the hook; the report lists each operation."""
+    events = []
+    set_profile_hook(lambda op, ns, size: events.append((op, size)), types=False)
+    try:
+        validate_external_dict({"now_ms": 1})
+    finally:
+        disable_profiling()
+    assert events == [("validate_external_dict", 1)]
+
+    collector = enable_profiling(types=False)
+    try:
+        make_packet().to_dict()
+    finally:
+        disable_profiling()
+    out = io.StringIO()
+    print_profile_report(collector, file=out)
+    assert "PacketV2.to_dict" in out.getvalue()
@@ -0,0 +1,84 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for trace query engine with predicate pushdown."""
+
+import json
+
+from decision_schema.query import PacketQuery, QueryStats, main, run_query
+from decision_schema.segments import SegmentedTraceWriter
+from decision_schema.trace_io import write_packets
+
+
+def _write_segments(tmp_path, make_packet) -> None:
+    with SegmentedTraceWriter(tmp_path, max_runs=1, max_bytes=None) as w:
+        for run in ("r1", "r2", "r3"):
+            for step in range(10):
+                action = "STOP" if run == "r2" and step in (4, 5, 8) else "HOLD"
+                state = "RED" if step >= 5 else "GREEN"
+                external = {"ops_state": state, "now_ms": step}
+                w.write(make_packet(run, step, action, external=external, latency_ms=step))
+
+
+def test_query_uses_segment_summaries(tmp_path, make_packet) -> None:
+    """Only the segment holding the run is opened; result matches all predicates."""
+    _write_segments(tmp_path, make_packet)
+    query = PacketQuery(
+        run_id="r2",
+        min_step=3,
+        max_step=9,
+        actions=frozenset({"STOP"}),
+        external={"ops_state": "RED"},
+    )
+    stats = QueryStats()
+    steps = [d["step"] for d in run_query([tmp_path], query, stats=stats)]
+    assert steps == [5, 8]
+    assert stats.files == 3
+    assert stats.files_skipped == 2
+    assert stats.lines_scanned == 10
+    assert stats.lines_parsed < stats.lines_scanned
+
+
+def test_query_plain_jsonl_without_summaries(tmp_path, make_packet) -> None:
+    """Plain JSONL files are scanned with the raw-line prefilter."""
+    path = tmp_path / "plain.jsonl"
+    write_packets(
+        path, [make_packet("a", 1), make_packet("b", 2, "STOP"), make_packet("a", 3, "STOP")]
+    )
+    stats = QueryStats()
+    got = list(run_query([path], PacketQuery(actions=frozenset({"STOP"})), stats=stats))
+    assert [(d["run_id"], d["step"]) for d in got] == [("b", 2), ("a", 3)]
+    assert stats.lines_parsed == 2
+
+
+def test_query_skips_torn_and_non_object_lines(tmp_path, make_packet) -> None:
+    """A partially written last line does not abort the query; bad lines are counted."""
+    path = tmp_path / "live.jsonl"
+    write_packets(path, [make_packet("a", 0, "STOP"), make_packet("a", 1, "STOP")])
+    with open(path, "ab") as f:
+        f.write(b'[1]\n{"run_id":"a","step":2,"final_action":{"action":"STOP"')
+    stats = QueryStats()
+    got = list(run_query([path], PacketQuery(actions=frozenset({"STOP"})), stats=stats))
+    assert [d["step"] for d in got] == [0, 1]
+    assert stats.bad_lines == 1
+    stats = QueryStats()
+    assert len(list(run_query([path], PacketQuery(), stats=stats))) == 2
+    assert stats.bad_lines == 2  # no prefilter: the "[1]" line is parsed too
+
+
+def test_query_latency_range(tmp_path, make_packet) -> None:
+    """Latency predicates are applied after decode."""
+    path = tmp_path / "plain.jsonl"
+    write_packets(path, [make_packet("a", i, latency_ms=i) for i in range(10)])
+    got = list(run_query([path], PacketQuery(min_latency_ms=3, max_latency_ms=4)))
+    assert [d["latency_ms"] for d in got] == [3, 4]
+
+
+def test_query_cli(tmp_path, capsys, make_packet) -> None:
+    """CLI streams matching packets as JSONL."""
+    _write_segments(tmp_path, make_packet)
+    assert main([str(tmp_path), "--run-id", "r2", "--action", "STOP"]) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line)["step"] for line in lines] == [4, 5, 8]
+    assert main([str(tmp_path), "--external", "ops_state=RED", "--count"]) == 0
+    assert capsys.readouterr().out.strip() == "15"
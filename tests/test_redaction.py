@@ -0,0 +1,59 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for size-bounded packet redaction."""
+
+import json
+
+import pytest
+
+from decision_schema.redaction import (
+    REDACTED,
+    TRUNCATED_KEY,
+    RedactionBudget,
+    RedactionPolicy,
+    RedactionStats,
+)
+
+
+def test_key_pattern_redaction_at_any_depth(make_packet) -> None:
+    """Matching keys are redacted; others pass through unchanged."""
+    policy = RedactionPolicy()
+    packet = make_packet(
+        input={"user": {"API_KEY": "abc", "name": "n"}},
+        external={"auth_token": "t", "now_ms": 5},
+    )
+    out = policy.apply(packet)
+    assert out.input == {"user": {"API_KEY": REDACTED, "name": "n"}}
+    assert out.external == {"auth_token": REDACTED, "now_ms": 5}
+    assert packet.input["user"]["API_KEY"] == "abc"
+
+
+def test_depth_items_and_string_limits() -> None:
+    """Oversize subtrees become size-tagged placeholders."""
+    budget = RedactionBudget(max_depth=2, max_items=3, max_str_len=4)
+    policy = RedactionPolicy(default_budget=budget)
+    stats = RedactionStats()
+    value = {"deep": {"a": {"b": 1}}, "list": [1, 2, 3, 4, 5], "s": "abcdefgh"}
+    out = policy.redact_value(value, budget, stats)
+    assert out["deep"]["a"] == {TRUNCATED_KEY: "depth", "type": "dict", "size": 1}
+    assert out["list"] == [1, 2, 3, {TRUNCATED_KEY: "items", "omitted": 2}]
+    assert out["s"] == "abcd...[+4 chars]"
+    assert stats.truncated_nodes == 2
+    assert stats.truncated_strings == 1
+
+
+def test_byte_budget_bounds_output_size(make_packet) -> None:
+    """A huge snapshot is cut down to roughly the field byte budget."""
+    big = {f"k{i}": "x" * 100 for i in range(5000)}
+    policy = RedactionPolicy(field_budgets={"input": RedactionBudget(max_bytes=2048)})
+    out = policy.apply(make_packet(input=big))
+    encoded = json.dumps(out.input)
+    assert len(encoded) < 2048 + 512
+    assert out.input[TRUNCATED_KEY]["reason"] == "bytes"
+
+
+def test_unknown_field_rejected() -> None:
+    """Only PacketV2 dict fields can be processed."""
+    with pytest.raises(ValueError):
+        RedactionPolicy(fields=("latency_ms",))
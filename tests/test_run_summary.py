@@ -0,0 +1,188 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for incrementally maintained run summaries."""
+
+import json
+
+import pytest
+
+from decision_schema.run_summary import (
+    RunSummaryIndex,
+    build_run_summaries,
+    disable_run_summaries,
+    enable_run_summaries,
+    main,
+)
+from decision_schema.segments import SegmentedTraceWriter
+from decision_schema.trace_io import write_packets
+
+
+@pytest.fixture(autouse=True)
+def _no_hook():
+    yield
+    disable_run_summaries()
+
+
+def _packets(make_packet, n: int = 20) -> list[dict]:
+    out = []
+    for i in range(n):
+        action = "STOP" if i % 4 == 0 else "ACT"
+        fields = {
+            "final_action": {"action": action, "allowed": action != "STOP"},
+            "latency_ms": i // 2 + 1,
+        }
+        if i % 5 == 0:
+            fields["mismatch"] = {"flags": ["ops_deny"], "reason_codes": []}
+        if i % 10 == 0:
+            fields["external"] = {"exec.fail_closed": True}
+        out.append(make_packet(f"r{i % 2}", i // 2, as_dict=True, **fields))
+    return out
+
+
+def test_summary_fields(tmp_path, make_packet) -> None:
+    """A rebuilt summary has the expected counts, ratios and latency stats."""
+    write_packets(tmp_path / "t.jsonl", _packets(make_packet))
+    index = build_run_summaries([tmp_path / "t.jsonl"])
+    r0 = index.get("r0")
+    assert len(index) == 2 and "r1" in index and index.get("zz") is None
+    assert (r0.count, r0.min_step, r0.max_step) == (10, 0, 9)
+    assert r0.action_counts == {"STOP": 5, "ACT": 5}
+    assert r0.allowed_ratio == 0.5
+    assert r0.fail_closed == 2
+    assert r0.mismatch_packets == 2 and r0.mismatch_flags == {"ops_deny": 2}
+    assert (r0.latency_min, r0.latency_max, r0.latency_sum) == (1, 10, 55)
+    assert r0.latency_mean == 5.5
+    assert r0.schema_versions == ["0.2.2"]
+    assert index.get("r1").action_counts == {"ACT": 10}
+
+
+def test_write_hook_matches_rebuild(tmp_path, make_packet) -> None:
+    """Summaries from the write hook equal a rebuild from the files."""
+    index = RunSummaryIndex()
+    enable_run_summaries(index)
+    packets = _packets(make_packet, 40)
+    write_packets(tmp_path / "t.jsonl", packets[:25])
+    write_packets(tmp_path / "t.jsonl", packets[25:], append=True)
+    with SegmentedTraceWriter(tmp_path / "seg", max_bytes=2000) as writer:
+        for p in packets:
+            writer.write(p)
+    disable_run_summaries()
+    assert index.catch_up(tmp_path / "t.jsonl") == 0  # hook already covered the file
+    rebuilt = build_run_summaries([tmp_path / "t.jsonl", tmp_path / "seg"])
+    assert index.to_dict() == rebuilt.to_dict()
+
+
+def test_recovery_replays_only_the_tail(tmp_path, make_packet) -> None:
+    """After load, catch_up folds only packets written since the save; partial lines wait."""
+    trace, state = tmp_path / "t.jsonl", tmp_path / "runs.json"
+    packets = _packets(make_packet, 30)
+    write_packets(trace, packets[:20])
+    index = build_run_summaries([trace])
+    index.save(state)
+    assert not (tmp_path / "runs.json.tmp").exists()
+
+    # Writer keeps going after the last save, then crashes mid-line.
+    write_packets(trace, packets[20:], append=True)
+    with open(trace, "ab") as f:
+        f.write(b'{"run_id":"r0","st')
+    recovered = RunSummaryIndex.load(state)
+    assert recovered.catch_up(trace) == 10
+    expected = RunSummaryIndex()
+    expected.catch_up(trace)
+    assert recovered.to_dict() == expected.to_dict()
+
+    # Completing the partial line is picked up by the next catch_up.
+    with open(trace, "ab") as f:
+        f.write(b'ep":99,"latency_ms":1}\n')
+    assert recovered.catch_up(trace) == 1
+    assert recovered.get("r0").max_step == 99
+
+
+def test_write_outside_offset_is_left_to_catch_up(tmp_path, make_packet) -> None:
+    """The hook ignores writes that do not start at the summarized offset."""
+    trace = tmp_path / "t.jsonl"
+    write_packets(trace, _packets(make_packet, 4))  # not observed
+    index = RunSummaryIndex()
+    enable_run_summaries(index)
+    write_packets(trace, _packets(make_packet, 4), append=True)
+    assert len(index) == 0
+    assert index.catch_up(trace) == 8
+    assert index.get("r0").count == 4
+
+
+def test_rewrite_marks_file_stale(tmp_path, make_packet) -> None:
+    """A default-mode rewrite of a summarized file stops folding it and asks for a rebuild."""
+    trace, state = tmp_path / "t.jsonl", tmp_path / "runs.json"
+    index = RunSummaryIndex()
+    enable_run_summaries(index)
+    write_packets(trace, [make_packet("a", i) for i in range(3)])
+    write_packets(trace, [make_packet("b", i) for i in range(10)])
+    assert {run_id: s.count for run_id, s in index.runs.items()} == {"a": 3}
+    with pytest.raises(ValueError, match="rebuild"):
+        index.catch_up(trace)
+    index.save(state)
+    with pytest.raises(ValueError, match="rebuild"):
+        RunSummaryIndex.load(state).catch_up(trace)
+    disable_run_summaries()
+    rebuilt = build_run_summaries([trace])
+    assert {run_id: s.count for run_id, s in rebuilt.runs.items()} == {"b": 10}
+
+
+def test_truncated_file_raises(tmp_path, make_packet) -> None:
+    """catch_up raises on a file shorter than its recorded offset."""
+    trace = tmp_path / "t.jsonl"
+    write_packets(trace, _packets(make_packet, 10))
+    index = build_run_summaries([trace])
+    write_packets(trace, _packets(make_packet, 2))
+    with pytest.raises(ValueError, match="rebuild"):
+        index.catch_up(trace)
+
+
+def test_bad_lines_and_state_format(tmp_path, make_packet) -> None:
+    """Non-packet lines are counted as bad, and an unknown state format raises."""
+    trace = tmp_path / "t.jsonl"
+    trace.write_text(
+        'not json\n\n[1]\n{"step": 1}\n' + json.dumps(make_packet("a", 0, as_dict=True)) + "\n"
+    )
+    index = build_run_summaries([trace])
+    assert index.bad_lines == 3 and index.get("a").count == 1
+    with pytest.raises(ValueError, match="format"):
+        RunSummaryIndex.from_dict({"format": 99})
+
+
+def test_malformed_external_is_skipped_and_offset_advances(tmp_path, make_packet) -> None:
+    """A non-dict external is a bad line; catch_up moves past it instead of failing forever."""
+    trace = tmp_path / "t.jsonl"
+    trace.write_text(
+        '{"run_id":"r","external":[1]}\n' + json.dumps(make_packet("r", 0, as_dict=True)) + "\n"
+    )
+    index = RunSummaryIndex()
+    assert index.catch_up(trace) == 1
+    assert index.bad_lines == 1 and index.get("r").count == 1
+    assert index.catch_up(trace) == 0
+
+
+def test_empty_mismatch_is_not_counted(tmp_path, make_packet) -> None:
+    """asdict(MismatchInfo()) (empty flags and reason codes) is not a mismatch packet."""
+    trace = tmp_path / "t.jsonl"
+    empty = make_packet(
+        "r", 0, as_dict=True, mismatch={"flags": [], "reason_codes": [], "metadata": None}
+    )
+    codes_only = make_packet(
+        "r", 1, as_dict=True, mismatch={"flags": [], "reason_codes": ["guard"]}
+    )
+    write_packets(trace, [empty, codes_only])
+    summary = build_run_summaries([trace]).get("r")
+    assert summary.mismatch_packets == 1 and summary.mismatch_flags == {}
+
+
+def test_cli(tmp_path, capsys, make_packet) -> None:
+    """The CLI updates the state file and prints one run, exiting 1 for unknown runs."""
+    write_packets(tmp_path / "t.jsonl", _packets(make_packet))
+    state = tmp_path / "runs.json"
+    assert main([str(tmp_path / "t.jsonl"), "--state", str(state), "--run", "r1"]) == 0
+    out = json.loads(capsys.readouterr().out)
+    assert out["count"] == 10 and out["allowed_ratio"] == 1.0
+    assert main([str(tmp_path / "t.jsonl"), "--state", str(state), "--run", "nope"]) == 1
+    assert "folded=0" in capsys.readouterr().err
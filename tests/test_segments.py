@@ -0,0 +1,98 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for segmented trace writer and segment summaries."""
+
+import pytest
+
+from decision_schema.segments import (
+    SegmentedTraceWriter,
+    iter_segment_summaries,
+    list_segments,
+    load_summary,
+)
+from decision_schema.trace_io import read_packets
+
+
+def test_summary_contents_and_run_offsets(tmp_path, make_packet) -> None:
+    """Sidecar records step/latency range, run_ids, action counts, versions, offsets."""
+    with SegmentedTraceWriter(tmp_path) as w:
+        w.write(make_packet("a", 3, "ACT", latency_ms=7))
+        w.write(make_packet("b", 1, "STOP", latency_ms=2))
+        w.write(make_packet("a", 4, "ACT", latency_ms=9))
+    (segment,) = list_segments(tmp_path)
+    s = load_summary(segment)
+    assert s.count == 3
+    assert (s.min_step, s.max_step) == (1, 4)
+    assert (s.latency_min, s.latency_max) == (2, 9)
+    assert s.run_ids == ["a", "b"]
+    assert s.action_counts == {"ACT": 2, "STOP": 1}
+    assert s.schema_versions == [make_packet().schema_version]
+    start, end = s.run_ranges["b"]
+    with open(segment, "rb") as f:
+        f.seek(start)
+        assert b'"run_id":"b"' in f.read(end - start)
+
+
+def test_rotate_by_size(tmp_path, make_packet) -> None:
+    """Segments rotate before exceeding max_bytes; all packets survive."""
+    with SegmentedTraceWriter(tmp_path, max_bytes=300) as w:
+        for i in range(10):
+            w.write(make_packet("a", i))
+    segments = list_segments(tmp_path)
+    assert len(segments) > 1
+    steps = [p.step for seg in segments for p in read_packets(seg)]
+    assert steps == list(range(10))
+    assert all(load_summary(seg).bytes <= 300 for seg in segments)
+
+
+def test_rotate_by_run_count_and_time(tmp_path, make_packet) -> None:
+    """max_runs and max_age_s trigger rotation."""
+    with SegmentedTraceWriter(tmp_path, prefix="runs", max_runs=2, max_bytes=None) as w:
+        for run in ("a", "b", "a", "c", "d"):
+            w.write(make_packet(run, 0))
+    runs = [s.run_ids for _, s in iter_segment_summaries(tmp_path, "runs")]
+    assert runs == [["a", "b"], ["c", "d"]]
+
+    now = [0.0]
+    with SegmentedTraceWriter(tmp_path, prefix="age", max_age_s=10, clock=lambda: now[0]) as w:
+        w.write(make_packet("a", 0))
+        now[0] = 11.0
+        w.write(make_packet("a", 1))
+    assert len(list_segments(tmp_path, "age")) == 2
+
+
+def test_writer_continues_numbering(tmp_path, make_packet) -> None:
+    """A new writer on an existing directory does not overwrite segments."""
+    with SegmentedTraceWriter(tmp_path) as w:
+        w.write(make_packet("a", 0))
+    with SegmentedTraceWriter(tmp_path) as w:
+        w.write(make_packet("a", 1))
+    assert [p.name for p in list_segments(tmp_path)] == ["trace-000000.jsonl", "trace-000001.jsonl"]
+
+
+def test_errors_do_not_leave_segments_open(tmp_path, make_packet) -> None:
+    """Errors while opening or finishing a segment leave no open handle behind."""
+    fail = False
+
+    def clock() -> float:
+        if fail:
+            raise OSError("clock unavailable")
+        return 0.0
+
+    w = SegmentedTraceWriter(tmp_path, clock=clock)
+    fail = True
+    with pytest.raises(OSError):
+        w.write(make_packet("a", 0))
+    assert list_segments(tmp_path) == []  # failed before any file was opened
+    fail = False
+    w.write(make_packet("a", 0))
+    fail = True
+    with pytest.raises(OSError):
+        w.close()
+    fail = False
+    w.close()  # nothing left open
+    with w:
+        w.write(make_packet("a", 1))
+    assert [p.name for p in list_segments(tmp_path)] == ["trace-000000.jsonl", "trace-000001.jsonl"]
+    assert [p.step for p in read_packets(list_segments(tmp_path)[0])] == [0]
@@ -0,0 +1,106 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for the shared-memory PacketV2 ring buffer."""
+
+import multiprocessing
+import subprocess
+import sys
+
+import pytest
+
+from decision_schema.shm_ring import PacketRing, RingConsumer, RingProducer
+
+
+def test_fan_out_to_multiple_consumers(make_packet) -> None:
+    """Every consumer sees every record in order."""
+    with PacketRing.create(capacity=8, slot_size=512) as ring:
+        producer = RingProducer(ring)
+        a = RingConsumer(ring, 0)
+        b = RingConsumer(PacketRing.attach(ring.name), 1)
+        for i in range(5):
+            assert producer.publish(make_packet(step=i)) == i
+        assert a.lag == 5
+        assert [p.step for p in a.poll()] == list(range(5))
+        assert [p.step for p in b.poll(max_records=3)] == [0, 1, 2]
+        assert b.lag == 2
+        assert a.poll() == []
+        b.ring.close()
+
+
+def test_overwrite_mode_reports_dropped_records() -> None:
+    """A slow consumer skips overwritten records and counts them."""
+    with PacketRing.create(capacity=4, slot_size=256) as ring:
+        producer = RingProducer(ring, mode="overwrite")
+        consumer = RingConsumer(ring, 0, start="earliest")
+        for i in range(10):
+            producer.publish_bytes(b"%d" % i)
+        got = consumer.poll_bytes()
+        assert [seq for seq, _ in got] == [6, 7, 8, 9]
+        assert [payload for _, payload in got] == [b"6", b"7", b"8", b"9"]
+        assert consumer.dropped == 6
+
+
+def test_block_mode_waits_for_consumers() -> None:
+    """Block mode times out while the slowest active consumer is a full ring behind."""
+    with PacketRing.create(capacity=2, slot_size=64) as ring:
+        producer = RingProducer(ring, mode="block", timeout_s=0.05)
+        consumer = RingConsumer(ring, 0)
+        producer.publish_bytes(b"a")
+        producer.publish_bytes(b"b")
+        with pytest.raises(TimeoutError):
+            producer.publish_bytes(b"c")
+        assert [p for _, p in consumer.poll_bytes()] == [b"a", b"b"]
+        producer.publish_bytes(b"c")
+        consumer.close()
+        producer.publish_bytes(b"d")
+        producer.publish_bytes(b"e")
+
+
+def test_record_larger_than_slot_rejected() -> None:
+    """Records must fit in one slot."""
+    with PacketRing.create(capacity=2, slot_size=8) as ring:
+        with pytest.raises(ValueError):
+            RingProducer(ring).publish_bytes(b"x" * 9)
+
+
+def test_attaching_process_does_not_unlink_on_exit() -> None:
+    """A process that attaches and exits leaves the segment to its owner."""
+    with PacketRing.create(capacity=2, slot_size=8) as ring:
+        # Stopping the tracker runs its exit cleanup before the child returns.
+        code = (
+            "import sys\n"
+            "from multiprocessing import resource_tracker\n"
+            "from decision_schema.shm_ring import PacketRing\n"
+            "PacketRing.attach(sys.argv[1]).close()\n"
+            "resource_tracker._resource_tracker._stop()\n"
+        )
+        subprocess.run([sys.executable, "-c", code, ring.name], check=True)
+        PacketRing.attach(ring.name).close()
+
+
+def _child_consume(name: str, count: int, queue) -> None:
+    ring = PacketRing.attach(name)
+    consumer = RingConsumer(ring, 1, start="earliest")
+    steps: list[int] = []
+    while len(steps) < count:
+        steps.extend(p.step for p in consumer.poll())
+    consumer.close()
+    ring.close()
+    queue.put(steps)
+
+
+def test_cross_process_consumer(make_packet) -> None:
+    """A consumer in another process reads packets published here."""
+    if "fork" not in multiprocessing.get_all_start_methods():
+        pytest.skip("fork start method required")
+    ctx = multiprocessing.get_context("fork")
+    with PacketRing.create(capacity=64, slot_size=512) as ring:
+        producer = RingProducer(ring, mode="block", timeout_s=5.0)
+        queue = ctx.Queue()
+        proc = ctx.Process(target=_child_consume, args=(ring.name, 50, queue))
+        proc.start()
+        for i in range(50):
+            producer.publish(make_packet(step=i))
+        assert queue.get(timeout=10) == list(range(50))
+        proc.join(timeout=10)
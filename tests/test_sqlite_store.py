@@ -0,0 +1,83 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for the SQLite trace store."""
+
+import pytest
+
+from decision_schema.packet_v2 import PacketV2
+from decision_schema.query import PacketQuery
+from decision_schema.sqlite_store import INDEXES, TraceStore
+from decision_schema.trace_io import write_packets
+
+
+@pytest.fixture
+def store(tmp_path):
+    with TraceStore(tmp_path / "t.sqlite") as s:
+        yield s
+
+
+def test_roundtrip_and_wal(store, make_packet) -> None:
+    """Ingested packets come back equal, ordered by (run_id, step), in WAL mode."""
+    packets = [
+        make_packet("r", 1, "ACT", input={"x": 1}, external={"ops_state": "RED"}),
+        make_packet("r", 0, "ACT", mismatch={"flags": ["f"]}),
+    ]
+    assert store.ingest(packets, batch_size=1) == 2
+    assert store.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    got = [PacketV2.from_dict(d) for d in store.query()]
+    assert got == [packets[1], packets[0]]
+
+
+def test_indexes_exist_after_deferred_ingest(store, make_packet) -> None:
+    """defer_indexes still leaves every index in place, and queries use them."""
+    store.ingest([make_packet("r", i) for i in range(10)], defer_indexes=True)
+    names = {r[0] for r in store.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert set(INDEXES) <= names
+    plan = " ".join(
+        str(r) for r in store.execute("EXPLAIN QUERY PLAN SELECT * FROM packets WHERE run_id = 'r'")
+    )
+    assert "idx_packets_run_step" in plan
+
+
+def test_query_predicates(store, make_packet) -> None:
+    """PacketQuery filters give the same rows in SQL as they do on traces."""
+    store.ingest(
+        [
+            make_packet(
+                "a",
+                i,
+                "STOP" if i > 5 else "HOLD",
+                external={"ops_state": "RED" if i % 2 else "GREEN", "exec.attempt_count": i},
+                latency_ms=i * 10,
+            )
+            for i in range(10)
+        ]
+        + [make_packet("b", i) for i in range(3)]
+    )
+    assert store.count() == 13
+    assert store.run_ids() == ["a", "b"]
+    q = PacketQuery(run_id="a", min_step=2, max_step=8, actions=frozenset({"STOP"}))
+    assert [d["step"] for d in store.query(q)] == [6, 7, 8]
+    assert store.count(PacketQuery(min_latency_ms=50, max_latency_ms=70)) == 3
+    ext = PacketQuery(run_id="a", external={"ops_state": "RED", "exec.attempt_count": 3})
+    assert [d["step"] for d in store.query(ext)] == [3]
+    assert store.count(ext) == 1
+    assert len(list(store.query(limit=4))) == 4
+
+
+def test_ingest_files(tmp_path, store, make_packet) -> None:
+    """ingest_files loads JSONL traces from disk."""
+    src = tmp_path / "in.jsonl"
+    write_packets(src, [make_packet("r", i) for i in range(4)])
+    assert store.ingest_files([src]) == 4
+    assert store.count(PacketQuery(run_id="r")) == 4
+
+
+def test_reopen_keeps_data(tmp_path, make_packet) -> None:
+    """Packets persist across closing and reopening the store."""
+    path = tmp_path / "t.sqlite"
+    with TraceStore(path) as s:
+        s.ingest([make_packet("r", 0)])
+    with TraceStore(path) as s:
+        assert s.count() == 1
@@ -0,0 +1,181 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for local socket packet streaming."""
+
+import socket
+import time
+
+import pytest
+
+from decision_schema import stream
+from decision_schema.packet_v2 import PacketV2
+from decision_schema.stream import (
+    FRAME_BATCH,
+    PacketPublisher,
+    PacketStreamServer,
+    PacketSubscriber,
+    recv_frame,
+    send_frame,
+)
+
+
+def _collect(sub: PacketSubscriber, n: int, timeout_s: float = 5.0) -> list[PacketV2]:
+    out: list[PacketV2] = []
+    deadline = time.monotonic() + timeout_s
+    while len(out) < n and time.monotonic() < deadline:
+        out.extend(sub.recv_batch(timeout_s=0.2))
+    return out
+
+
+@pytest.fixture
+def sock_path(tmp_path):
+    return str(tmp_path / "s.sock")
+
+
+def test_frame_roundtrip() -> None:
+    a, b = socket.socketpair()
+    with a, b:
+        send_frame(a, FRAME_BATCH, b"x" * 1000)
+        assert recv_frame(b) == (FRAME_BATCH, b"x" * 1000)
+
+
+def test_unix_publish_subscribe(sock_path, make_packet) -> None:
+    """Packets arrive in order; count-based batching sends full batches."""
+    with PacketStreamServer(sock_path) as server:
+        sub = PacketSubscriber(server.address)
+        sub.recv_batch(timeout_s=0.05)  # connect before publishing
+        with PacketPublisher(server.address, max_batch=4, max_delay_ms=1000) as pub:
+            for i in range(8):
+                pub.publish(make_packet("r", i))
+            assert pub.sent_batches == 2
+        got = _collect(sub, 8)
+        assert [p.step for p in got] == list(range(8))
+        sub.close()
+
+
+def test_latency_budget_flushes_partial_batch(sock_path, make_packet) -> None:
+    with PacketStreamServer(sock_path) as server:
+        sub = PacketSubscriber(server.address)
+        with PacketPublisher(server.address, max_batch=1000, max_delay_ms=10) as pub:
+            pub.publish(make_packet("r", 0))
+            got = _collect(sub, 1)
+            assert [p.step for p in got] == [0]
+        assert pub.sent_batches == 1
+        sub.close()
+
+
+def test_subscriber_filters(sock_path, make_packet) -> None:
+    """Server-side filtering by run_id prefix and action."""
+    with PacketStreamServer(sock_path) as server:
+        with PacketPublisher(server.address) as pub:
+            for i in range(6):
+                pub.publish(make_packet("a-1" if i % 2 else "b-1", i, "HOLD" if i < 3 else "STOP"))
+        by_prefix = PacketSubscriber(server.address, run_id_prefix="a-")
+        by_action = PacketSubscriber(server.address, actions=["STOP"])
+        assert [p.step for p in _collect(by_prefix, 3)] == [1, 3, 5]
+        assert [p.step for p in _collect(by_action, 3)] == [3, 4, 5]
+        by_prefix.close()
+        by_action.close()
+
+
+def test_reconnect_resumes_after_last_ack(sock_path, make_packet) -> None:
+    """After a dropped connection only packets after the last ack are redelivered."""
+    with PacketStreamServer(sock_path) as server:
+        with PacketPublisher(server.address) as pub:
+            for i in range(5):
+                pub.publish(make_packet("r", i))
+        sub = PacketSubscriber(server.address, retry_delay_s=0.01)
+        got = _collect(sub, 5)
+        sub.ack(got[2])
+        sub._sock.shutdown(socket.SHUT_RDWR)  # simulate a dropped connection
+        assert [p.step for p in _collect(sub, 2)] == [3, 4]
+        assert sub.reconnects == 1
+        sub.close()
+
+
+def test_resume_after_initial_position(sock_path, make_packet) -> None:
+    with PacketStreamServer(sock_path, backlog_size=4) as server:
+        with PacketPublisher(server.address) as pub:
+            for i in range(6):
+                pub.publish(make_packet("r", i))
+        # Expired resume point: whole backlog (at-least-once).
+        old = PacketSubscriber(server.address, resume_after=("r", 0))
+        assert [p.step for p in _collect(old, 4)] == [2, 3, 4, 5]
+        recent = PacketSubscriber(server.address, resume_after=("r", 4))
+        assert [p.step for p in _collect(recent, 1)] == [5]
+        old.close()
+        recent.close()
+
+
+def test_failed_send_keeps_the_batch(sock_path, make_packet, monkeypatch) -> None:
+    """A batch whose send raises stays queued and goes out on the next flush."""
+    with PacketStreamServer(sock_path) as server:
+        sub = PacketSubscriber(server.address)
+        sub.recv_batch(timeout_s=0.05)
+        with PacketPublisher(server.address, max_batch=1000, max_delay_ms=60_000) as pub:
+            pub.publish(make_packet("r", 0))
+            pub.publish(make_packet("r", 1))
+
+            def reset(*args) -> None:
+                raise ConnectionResetError
+
+            with monkeypatch.context() as m:
+                m.setattr(stream, "send_frame", reset)
+                with pytest.raises(ConnectionResetError):
+                    pub.flush()
+            assert pub.sent_batches == 0
+            pub.flush()
+            assert pub.sent_batches == 1
+        assert [p.step for p in _collect(sub, 2)] == [0, 1]
+        sub.close()
+
+
+def test_tcp_transport(make_packet) -> None:
+    with PacketStreamServer(("127.0.0.1", 0)) as server:
+        with PacketPublisher(server.address) as pub:
+            pub.publish(make_packet("r", 7))
+        sub = PacketSubscriber(server.address)
+        assert [p.step for p in _collect(sub, 1)] == [7]
+        sub.close()
+
+
+def test_no_reconnect_raises(sock_path) -> None:
+    server = PacketStreamServer(sock_path).start()
+    sub = PacketSubscriber(server.address, reconnect=False)
+    sub.recv_batch(timeout_s=0.05)
+    server.stop()
+    with pytest.raises(ConnectionError):
+        sub.recv_batch(timeout_s=1.0)
+
+
+def test_malformed_lines_are_skipped_and_publisher_stays_connected(sock_path, make_packet) -> None:
+    """Bad run_id/step types and non-JSON lines are counted; later packets still arrive."""
+    with PacketStreamServer(sock_path) as server:
+        with PacketPublisher(server.address) as pub:
+            pub.publish(make_packet("r", 0))
+            pub.flush()
+            bad = [
+                b"not json",
+                b"[1, 2]",
+                b'{"run_id": 5, "step": 1}',
+                b'{"run_id": "r", "step": [1]}',
+                b'{"run_id": "r", "step": true}',
+            ]
+            send_frame(pub._sock, FRAME_BATCH, b"\n".join(bad))
+            pub.publish(make_packet("r", 1))
+        sub = PacketSubscriber(server.address, run_id_prefix="r")
+        assert [p.step for p in _collect(sub, 2)] == [0, 1]
+        assert server.bad_lines == 5
+        sub.close()
+
+
+def test_malformed_resume_point_sends_whole_backlog(sock_path, make_packet) -> None:
+    """An unhashable resume_after is treated like an expired resume point."""
+    with PacketStreamServer(sock_path) as server:
+        with PacketPublisher(server.address) as pub:
+            pub.publish(make_packet("r", 0))
+        sub = PacketSubscriber(server.address)
+        sub.last_acked = (["r"], {"step": 0})
+        assert [p.step for p in _collect(sub, 1)] == [0]
+        sub.close()
@@ -0,0 +1,85 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for the synthetic packet generator."""
+
+import json
+
+import pytest
+
+from decision_schema.packet_v2 import PacketV2
+from decision_schema.synthetic import (
+    SyntheticConfig,
+    SyntheticGenerator,
+    generate_packets,
+    write_synthetic_trace,
+)
+from decision_schema.trace_io import read_packets
+from decision_schema.trace_registry import EXTERNAL_KEY_REGISTRY
+from decision_schema.types import FinalDecision, MismatchInfo, Proposal
+
+
+def _config(**overrides) -> SyntheticConfig:
+    return SyntheticConfig(**{"runs": 3, "steps_per_run": 50, "seed": 11, **overrides})
+
+
+def test_same_seed_same_output() -> None:
+    """The same seed gives identical lines; a different seed does not."""
+    a = list(SyntheticGenerator(_config()).jsonl_lines())
+    b = list(SyntheticGenerator(_config()).jsonl_lines())
+    assert a == b
+    assert a != list(SyntheticGenerator(_config(seed=12)).jsonl_lines())
+
+
+def test_all_outputs_carry_the_same_data() -> None:
+    """Dicts, JSONL lines and PacketV2 objects describe the same packets."""
+    gen = SyntheticGenerator(_config())
+    dicts = list(gen.packet_dicts())
+    assert [json.loads(line) for line in gen.jsonl_lines()] == dicts
+    assert [p.to_dict() for p in gen.packets()] == dicts
+    assert len(dicts) == 150
+
+
+def test_packets_are_valid(tmp_path) -> None:
+    """Written traces read back as valid packets with registered keys and consistent mismatches."""
+    path = tmp_path / "synthetic.jsonl"
+    assert write_synthetic_trace(path, _config()) == 150
+    packets = list(read_packets(path))
+    assert all(isinstance(p, PacketV2) for p in packets)
+    for p in packets:
+        assert set(p.external) - set(_config().context_keys) <= set(EXTERNAL_KEY_REGISTRY)
+        if p.final_action["allowed"]:
+            assert p.mismatch is None
+        else:
+            assert p.mismatch["flags"]
+
+
+def test_contract_objects() -> None:
+    """Proposals and final decisions are contract types with namespaced params."""
+    gen = SyntheticGenerator(_config())
+    proposal = gen.proposal()
+    assert isinstance(proposal, Proposal)
+    assert all(k.startswith("synthetic:") for k in proposal.params)
+    denied = gen.final_decision(proposal, denied=True)
+    assert isinstance(denied, FinalDecision) and not denied.allowed
+    assert isinstance(denied.mismatch, MismatchInfo)
+    assert gen.final_decision(proposal).action == proposal.action
+
+
+def test_mismatch_rate_and_interleave() -> None:
+    """mismatch_rate sets the denied fraction; interleave alternates runs per step."""
+    packets = list(generate_packets(_config(runs=4, steps_per_run=1000, mismatch_rate=0.2)))
+    denied = sum(1 for p in packets if not p.final_action["allowed"])
+    assert 0.15 < denied / len(packets) < 0.25
+    order = [(p.run_id, p.step) for p in generate_packets(_config(interleave=True))]
+    assert order[:3] == [("run-000000", 0), ("run-000001", 0), ("run-000002", 0)]
+
+
+def test_config_validation() -> None:
+    """Unknown keys and an out-of-range mismatch_rate raise ValueError."""
+    with pytest.raises(ValueError, match="context_keys"):
+        SyntheticConfig(context_keys=("not_a_key",))
+    with pytest.raises(ValueError, match="not registered"):
+        SyntheticConfig(trace_keys=("exec.unknown",))
+    with pytest.raises(ValueError, match="mismatch_rate"):
+        SyntheticConfig(mismatch_rate=1.5)
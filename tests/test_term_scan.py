@@ -0,0 +1,74 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for the Aho-Corasick term scanner."""
+
+import random
+import re
+
+from decision_schema.packet_v2 import PacketV2
+from decision_schema.term_scan import TermScanner, load_terms, main, scan_packets
+from decision_schema.trace_io import write_packets
+
+TERMS = ["he", "she", "his", "hers", "post-only", "take_profit", "ab", "bab"]
+
+
+def _regex_hits(text: str, terms: list[str]) -> list[tuple[int, int, str]]:
+    hits = []
+    for term in terms:
+        for m in re.finditer(r"(?=(\b" + re.escape(term) + r"\b))", text.lower()):
+            hits.append((m.start(1), m.end(1), term))
+    return sorted(hits)
+
+
+def test_matches_regex_word_boundary_semantics() -> None:
+    """On random text the scanner finds exactly what per-term \b regexes find."""
+    scanner = TermScanner(TERMS)
+    rng = random.Random(3)
+    for _ in range(3000):
+        text = "".join(rng.choice("abehirsoSH_-. ") for _ in range(rng.randint(0, 24)))
+        assert sorted(scanner.find(text)) == _regex_hits(text, TERMS), text
+
+
+def test_word_boundaries_and_case() -> None:
+    """Matches respect word boundaries and are case-insensitive by default."""
+    scanner = TermScanner(TERMS)
+    assert scanner.terms_in("She said HERS") == ("hers", "she")
+    assert scanner.terms_in("ushers and sheets") == ()
+    assert scanner.terms_in("post-only.mode") == ("post-only",)
+    assert scanner.terms_in("take_profit_x") == ()  # "_" is a word character
+    assert TermScanner(["He"], case_sensitive=True).terms_in("he He") == ("He",)
+    assert list(scanner.scan_lines(["none", "he and she"])) == [
+        (2, "he", "he and she"),
+        (2, "she", "he and she"),
+    ]
+
+
+def test_scan_packets_reports_fields(tmp_path) -> None:
+    """scan_packets reports the field and text of each hit, and the CLI exits 1 on hits."""
+    packet = PacketV2(
+        run_id="r",
+        step=4,
+        input={"she": 1},  # input is not scanned
+        external={"exec.he": 1, "now_ms": 1},
+        mdm={"reasons": ["fine", "ab_limit"], "params": {"robotics:bab": 1}},
+        final_action={"action": "HOLD", "reasons": ["his turn"]},
+        latency_ms=1,
+        mismatch={"flags": ["hers"], "reason_codes": []},
+    )
+    hits = list(scan_packets([packet, packet.to_dict()], TermScanner(TERMS)))
+    found = {(h.step, h.field, h.term, h.text) for h in hits}
+    assert found == {
+        (4, "external", "he", "exec.he"),
+        (4, "mdm.params", "bab", "robotics:bab"),
+        (4, "final_action.reasons", "his", "his turn"),
+        (4, "mismatch.flags", "hers", "hers"),
+    }
+    assert len(hits) == 8
+
+    trace, terms = tmp_path / "trace.jsonl", tmp_path / "terms.txt"
+    write_packets(trace, [packet])
+    terms.write_text("# one per line\nhis\n\n")
+    assert load_terms(terms) == ["his"]
+    assert main([str(trace), "--terms-file", str(terms)]) == 1
+    assert main([str(trace), "--term", "absent"]) == 0
@@ -0,0 +1,61 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for stage timing instrumentation."""
+
+import time
+
+from decision_schema.timing import (
+    NULL_STAGE_TIMER,
+    STAGE_LATENCY_KEYS,
+    StageTimer,
+    new_stage_timer,
+    set_timing_enabled,
+)
+from decision_schema.trace_registry import EXTERNAL_KEY_REGISTRY, validate_external_dict
+
+
+def test_stage_keys_are_registered() -> None:
+    """Every key the timer writes is in EXTERNAL_KEY_REGISTRY."""
+    for key in STAGE_LATENCY_KEYS.values():
+        assert key in EXTERNAL_KEY_REGISTRY
+
+
+def test_timer_fills_latency_and_trace_keys(make_packet) -> None:
+    """apply() writes total latency_ms and per-stage registered keys."""
+    timer = StageTimer()
+    with timer.stage("proposal"):
+        time.sleep(0.002)
+    for _ in range(2):
+        t0 = timer.start()
+        timer.stop("exec", t0)
+    timer.record("ops", 1_500_000)
+    packet = timer.apply(make_packet())
+    assert packet.latency_ms >= 2
+    assert packet.external["harness.proposal_latency_ms"] >= 2.0
+    assert packet.external["harness.ops_latency_ms"] == 1.5
+    assert "exec.attempt_count" not in packet.external  # owned by the execution layer
+    assert timer.stage_counts()["exec"] == 2
+    assert "exec.total_latency_ms" in packet.external
+    assert "harness.modulation_latency_ms" not in packet.external
+    errors = validate_external_dict(
+        packet.external, require_registry_for_prefixes={"harness", "exec"}, mode="trace"
+    )
+    assert errors == []
+
+
+def test_disabled_timing_is_noop(make_packet) -> None:
+    """When disabled, new_stage_timer() returns the shared no-op timer."""
+    set_timing_enabled(False)
+    try:
+        timer = new_stage_timer()
+        assert timer is NULL_STAGE_TIMER
+        with timer.stage("proposal"):
+            pass
+        timer.stop("exec", timer.start())
+        packet = timer.apply(make_packet())
+        assert packet.external == {}
+        assert packet.latency_ms == 0
+    finally:
+        set_timing_enabled(True)
+    assert isinstance(new_stage_timer(), StageTimer)
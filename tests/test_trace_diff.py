@@ -0,0 +1,118 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for the streaming trace diff."""
+
+import json
+
+import pytest
+
+from decision_schema.trace_diff import (
+    ONLY_BASELINE,
+    ONLY_CANDIDATE,
+    diff_streams,
+    diff_traces,
+    main,
+)
+from decision_schema.trace_io import write_packets
+
+
+def test_identical_streams(make_packet) -> None:
+    """PacketV2 and dict inputs compare equal; run summaries are kept on request."""
+    packets = [make_packet("r", i) for i in range(5)]
+    assert diff_streams(packets, packets).runs == {}
+    report = diff_streams(packets, [p.to_dict() for p in packets], keep_runs=True)
+    assert report.identical
+    assert report.steps_compared == 5
+    assert report.runs["r"].steps_differing == 0
+
+
+def test_reports_each_kind_of_change(make_packet) -> None:
+    """Action, allowed, flag, latency and one-sided differences are reported per step."""
+    baseline = [
+        make_packet("a", 0, latency_ms=10),
+        make_packet("a", 1, final_action={"action": "ACT", "allowed": True}, latency_ms=10),
+        make_packet("a", 2, mismatch={"flags": ["f1"]}, latency_ms=10),
+        make_packet("a", 3),
+        make_packet("b", 0, latency_ms=10),
+    ]
+    candidate = [
+        make_packet("a", 0, latency_ms=13),
+        make_packet("a", 1, final_action={"action": "STOP", "allowed": False}, latency_ms=10),
+        make_packet("a", 2, mismatch={"flags": ["f2"]}, latency_ms=10),
+        make_packet("a", 4),
+        make_packet("b", 0, latency_ms=50),
+    ]
+    diffs, runs = [], []
+    report = diff_streams(
+        baseline,
+        candidate,
+        latency_threshold_ms=20,
+        on_diff=diffs.append,
+        on_run=runs.append,
+        keep_runs=True,
+    )
+    by_key = {(d.run_id, d.step): d for d in diffs}
+    assert set(by_key) == {("a", 1), ("a", 2), ("a", 3), ("a", 4), ("b", 0)}
+    assert by_key[("a", 1)].action == ("ACT", "STOP")
+    assert by_key[("a", 1)].allowed == (True, False)
+    assert (by_key[("a", 2)].flags_added, by_key[("a", 2)].flags_removed) == (["f2"], ["f1"])
+    assert by_key[("a", 3)].kind == ONLY_BASELINE
+    assert by_key[("a", 4)].kind == ONLY_CANDIDATE
+    assert by_key[("b", 0)].latency_delta_ms == 40
+
+    a = report.runs["a"]
+    assert a.steps_compared == 3
+    assert a.steps_differing == 4
+    assert a.action_changes == {"ACT->STOP": 1}
+    assert a.allowed_flips == 1
+    assert a.flags_added == {"f2": 1}
+    assert a.latency_delta_max_ms == 3
+    assert (a.latency_compared, a.latency_delta_mean_ms) == (3, 1.0)
+    assert a.first_differing_step == 1
+    assert [s.run_id for s in runs] == ["a", "b"]
+    assert report.runs_differing == 2
+
+
+def test_latency_mean_ignores_steps_without_numeric_latency(make_packet) -> None:
+    """The mean latency delta divides by steps with a number on both sides only."""
+    baseline = [make_packet("r", 0, latency_ms=10), make_packet("r", 1, as_dict=True)]
+    candidate = [
+        make_packet("r", 0, latency_ms=14),
+        make_packet("r", 1, as_dict=True, latency_ms=None),
+    ]
+    summary = diff_streams(baseline, candidate, keep_runs=True).runs["r"]
+    assert summary.steps_compared == 2 and summary.latency_compared == 1
+    assert summary.latency_delta_mean_ms == 4.0
+
+
+def test_unordered_input_rejected(make_packet) -> None:
+    """Out-of-order or duplicate keys raise ValueError naming the stream."""
+    with pytest.raises(ValueError, match="baseline stream not ordered"):
+        diff_streams([make_packet("r", 1), make_packet("r", 0)], [])
+    with pytest.raises(ValueError, match="candidate"):
+        diff_streams([], [make_packet("r", 1), make_packet("r", 1)])
+
+
+def test_diff_traces_writes_only_differences(tmp_path, make_packet) -> None:
+    """diff_traces writes differing steps and run summaries as JSONL; the CLI exits 1 on diffs."""
+    base, cand = tmp_path / "base.jsonl", tmp_path / "cand.jsonl"
+    write_packets(base, [make_packet("r", i, "HOLD") for i in range(4)])
+    write_packets(cand, [make_packet("r", i, "STOP" if i == 2 else "HOLD") for i in range(4)])
+    out, summary = tmp_path / "diff.jsonl", tmp_path / "runs.jsonl"
+    report = diff_traces(base, cand, out, summary_output=summary)
+    assert report.steps_differing == 1
+    assert report.runs == {}  # streamed to summary_output instead
+    lines = [json.loads(line) for line in out.read_text().splitlines()]
+    assert lines == [
+        {
+            "run_id": "r",
+            "step": 2,
+            "kind": "changed",
+            "action": ["HOLD", "STOP"],
+            "latency_delta_ms": 0,
+        }
+    ]
+    assert json.loads(summary.read_text())["steps_differing"] == 1
+    assert main([str(base), str(base)]) == 0
+    assert main([str(base), str(cand)]) == 1
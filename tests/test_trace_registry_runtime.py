@@ -0,0 +1,148 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for runtime trace key registration (copy-on-write snapshots)."""
+
+import threading
+
+import pytest
+
+from decision_schema import trace_registry
+from decision_schema.trace_registry import (
+    EXTERNAL_KEY_REGISTRY,
+    register_external_key,
+    registry_keys,
+    registry_snapshot,
+    validate_external_dict,
+)
+
+
+@pytest.fixture(autouse=True)
+def _restore_registry():
+    saved = trace_registry._snapshot
+    runtime = dict(trace_registry._runtime_entries)
+    yield
+    trace_registry._runtime_entries.clear()
+    trace_registry._runtime_entries.update(runtime)
+    trace_registry._snapshot = saved
+
+
+def _register(key: str, **meta):
+    return register_external_key(
+        key,
+        owner=meta.get("owner", "test-plugin"),
+        introduced_in="0.2.2",
+        description=meta.get("description", "Test key."),
+        replace=meta.get("replace", False),
+    )
+
+
+def test_initial_snapshot_matches_builtin_registry() -> None:
+    """The first snapshot holds the built-in keys and read-only entries."""
+    snap = registry_snapshot()
+    assert snap.keys == frozenset(EXTERNAL_KEY_REGISTRY)
+    assert "exec.success_count" in snap.namespace_keys("exec")
+    assert snap.namespace_keys("nope") == frozenset()
+    with pytest.raises(TypeError):
+        snap.entries["harness.fail_closed"]["owner"] = "x"
+
+
+def test_register_publishes_new_snapshot() -> None:
+    """Registering a key publishes a new snapshot and leaves the previous one unchanged."""
+    before = registry_snapshot()
+    after = _register("plugin.queue_depth")
+    assert registry_snapshot() is after
+    assert "plugin.queue_depth" in after and "plugin.queue_depth" not in before
+    assert after.version == before.version + 1
+    assert after.namespace_keys("plugin") == {"plugin.queue_depth"}
+    assert "plugin.queue_depth" in registry_keys()
+    assert "plugin.queue_depth" not in EXTERNAL_KEY_REGISTRY
+
+
+def test_reregister_is_idempotent_and_conflicts_raise() -> None:
+    """Same metadata is a no-op; different metadata raises unless replace=True."""
+    first = _register("plugin.queue_depth")
+    assert _register("plugin.queue_depth") is first
+    with pytest.raises(ValueError, match="INV-T1:key_already_registered"):
+        _register("plugin.queue_depth", owner="other")
+    replaced = _register("plugin.queue_depth", owner="other", replace=True)
+    assert replaced.entries["plugin.queue_depth"]["owner"] == "other"
+    with pytest.raises(ValueError, match="INV-T1:invalid_trace_key_format"):
+        _register("NoDot")
+
+
+def test_strict_validation_sees_runtime_keys() -> None:
+    """Strict validation accepts a key once it is registered at runtime."""
+    external = {"exec.queue_depth": 3}
+    assert validate_external_dict(external, require_registry_for_prefixes={"exec"}) == [
+        "INV-T1:unregistered_key:exec.queue_depth"
+    ]
+    _register("exec.queue_depth")
+    assert validate_external_dict(external, require_registry_for_prefixes={"exec"}) == []
+
+
+def test_writes_to_builtin_dict_are_seen_by_validation() -> None:
+    """Plugins that mutate EXTERNAL_KEY_REGISTRY directly (pre-runtime API) still register keys."""
+    external = {"exec.queue_depth": 3}
+    strict = {"require_registry_for_prefixes": {"exec"}}
+    meta = {"owner": "test-plugin", "introduced_in": "0.2.2", "description": "Test key."}
+    before = registry_snapshot()
+    EXTERNAL_KEY_REGISTRY["exec.queue_depth"] = meta
+    try:
+        assert validate_external_dict(external, **strict) == []
+        assert "exec.queue_depth" in registry_keys()
+        assert registry_snapshot().version > before.version
+    finally:
+        del EXTERNAL_KEY_REGISTRY["exec.queue_depth"]
+    assert validate_external_dict(external, **strict) == [
+        "INV-T1:unregistered_key:exec.queue_depth"
+    ]
+
+    EXTERNAL_KEY_REGISTRY.update({"exec.queue_depth": meta})
+    try:
+        assert "exec.queue_depth" in registry_snapshot()
+    finally:
+        EXTERNAL_KEY_REGISTRY.pop("exec.queue_depth")
+    assert "exec.queue_depth" not in registry_snapshot()
+
+
+def test_runtime_keys_survive_builtin_dict_writes() -> None:
+    """Republishing after a dict write keeps keys registered via register_external_key."""
+    _register("plugin.queue_depth")
+    EXTERNAL_KEY_REGISTRY.setdefault(
+        "plugin.other", {"owner": "p", "introduced_in": "0.2.2", "description": "d"}
+    )
+    try:
+        assert {"plugin.queue_depth", "plugin.other"} <= registry_snapshot().keys
+    finally:
+        del EXTERNAL_KEY_REGISTRY["plugin.other"]
+    assert "plugin.queue_depth" in registry_snapshot()
+
+
+def test_concurrent_registration_and_reads() -> None:
+    """Readers never see a torn snapshot while writers register keys."""
+    errors: list[str] = []
+    stop = threading.Event()
+
+    def reader() -> None:
+        while not stop.is_set():
+            snap = registry_snapshot()
+            if len(snap.keys) != len(snap.entries):
+                errors.append("inconsistent snapshot")
+
+    readers = [threading.Thread(target=reader) for _ in range(2)]
+    for t in readers:
+        t.start()
+    writers = [
+        threading.Thread(target=lambda i=i: [_register(f"plugin{i}.key_{j}") for j in range(50)])
+        for i in range(4)
+    ]
+    for t in writers:
+        t.start()
+    for t in writers:
+        t.join()
+    stop.set()
+    for t in readers:
+        t.join()
+    assert errors == []
+    assert len(registry_snapshot().keys) == len(EXTERNAL_KEY_REGISTRY) + 200
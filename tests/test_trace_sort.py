@@ -0,0 +1,92 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for the external (run_id, step) trace sort."""
+
+import random
+
+import pytest
+
+from decision_schema.segments import SegmentedTraceWriter
+from decision_schema.trace_io import read_packets, write_packets
+from decision_schema.trace_sort import main, sort_traces
+
+
+def test_sort_spills_and_merges_in_multiple_passes(tmp_path, make_packet) -> None:
+    """Output is (run_id, step)-ordered even with tiny buffers and fan-in."""
+    keys = [(f"r{r}", s) for r in range(5) for s in range(40)]
+    random.Random(7).shuffle(keys)
+    for i in range(3):
+        chunk = keys[i::3]
+        write_packets(tmp_path / f"w{i}.jsonl", [make_packet(r, s) for r, s in chunk])
+    out = tmp_path / "sorted.jsonl"
+    stats = sort_traces([tmp_path / f"w{i}.jsonl" for i in range(3)], out, max_records=7, fan_in=3)
+    got = [(p.run_id, p.step) for p in read_packets(out)]
+    assert got == sorted(keys)
+    assert stats.records == stats.written == 200
+    assert stats.runs > 3
+    assert stats.merge_passes > 1
+    assert list(tmp_path.glob("ds-sort-*")) == []
+
+
+def test_segment_directory_source(tmp_path, make_packet) -> None:
+    """Segment directories are read like JSONL files."""
+    with SegmentedTraceWriter(tmp_path / "seg", max_bytes=300) as writer:
+        for step in (3, 1, 2, 0):
+            writer.write(make_packet("r", step))
+    out = tmp_path / "sorted.jsonl"
+    sort_traces([tmp_path / "seg"], out)
+    assert [p.step for p in read_packets(out)] == [0, 1, 2, 3]
+
+
+@pytest.mark.parametrize(
+    "policy, expected",
+    [("first", [1]), ("last", [2]), ("keep", [1, 1, 2])],
+)
+def test_duplicate_policies(tmp_path, policy, expected, make_packet) -> None:
+    """first/last keep one record per step; keep writes all of them in input order."""
+    src = tmp_path / "in.jsonl"
+    write_packets(
+        src,
+        [
+            make_packet("r", 0, latency_ms=1),
+            make_packet("r", 0, latency_ms=1),
+            make_packet("r", 0, latency_ms=2),
+        ],
+    )
+    out = tmp_path / "out.jsonl"
+    stats = sort_traces([src], out, on_duplicate=policy, max_records=1)
+    assert [p.latency_ms for p in read_packets(out)] == expected
+    assert stats.duplicates == 2
+    assert stats.conflicts == 1
+
+
+def test_error_policy(tmp_path, make_packet) -> None:
+    """Conflicting duplicates raise and leave the previous output untouched."""
+    src, out = tmp_path / "in.jsonl", tmp_path / "out.jsonl"
+    write_packets(src, [make_packet("r", 0), make_packet("r", 0)])
+    stats = sort_traces([src], out, on_duplicate="error")
+    assert stats.written == 1  # identical copies are dropped
+    before = out.read_bytes()
+    write_packets(src, [make_packet("a", 0), make_packet("r", 0, latency_ms=5)], append=True)
+    with pytest.raises(ValueError, match="conflicting"):
+        sort_traces([src], out, on_duplicate="error")
+    assert out.read_bytes() == before
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["in.jsonl", "out.jsonl"]
+
+
+def test_malformed_line(tmp_path) -> None:
+    """A line without run_id/step raises ValueError naming the file and line."""
+    src = tmp_path / "in.jsonl"
+    src.write_text('{"run_id": "r"}\n')
+    with pytest.raises(ValueError, match="in.jsonl:1"):
+        sort_traces([src], tmp_path / "out.jsonl")
+
+
+def test_cli(tmp_path, make_packet) -> None:
+    """The CLI writes the sorted trace to -o."""
+    src = tmp_path / "in.jsonl"
+    write_packets(src, [make_packet("b", 0), make_packet("a", 1), make_packet("a", 0)])
+    out = tmp_path / "out.jsonl"
+    assert main([str(src), "-o", str(out)]) == 0
+    assert [(p.run_id, p.step) for p in read_packets(out)] == [("a", 0), ("a", 1), ("b", 0)]
@@ -0,0 +1,79 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for sliding-window context counters."""
+
+import random
+
+import pytest
+
+from decision_schema.trace_registry import validate_external_dict
+from decision_schema.window import WINDOW_CONTEXT_KEYS, WindowContextCounters, WindowedCounter
+
+
+def test_windowed_counter_expires_old_buckets() -> None:
+    """Events leave the window after window_ms."""
+    c = WindowedCounter(window_ms=10_000, bucket_ms=1000)
+    c.add(0)
+    c.add(500)
+    c.add(5_000)
+    assert c.total(5_000) == 3
+    assert c.total(9_999) == 3
+    assert c.total(10_000) == 1
+    assert c.total(15_000) == 0
+    c.add(100_000)
+    assert c.total(100_000) == 1
+
+
+def test_windowed_counter_matches_naive_scan() -> None:
+    """Bucketed totals equal a naive scan at bucket granularity."""
+    rng = random.Random(7)
+    c = WindowedCounter(window_ms=5_000, bucket_ms=100)
+    events: list[int] = []
+    now = 0
+    for _ in range(2000):
+        now += rng.randint(0, 300)
+        c.add(now)
+        events.append(now)
+        lo = now // 100 - 50
+        expected = sum(1 for t in events if t // 100 > lo)
+        assert c.total(now) == expected
+
+
+def test_context_has_exactly_parameter_index_keys() -> None:
+    """context() emits exactly the documented keys, all valid context keys."""
+    counters = WindowContextCounters(window_ms=60_000)
+    ctx = counters.context(0)
+    assert tuple(ctx) == WINDOW_CONTEXT_KEYS
+    assert validate_external_dict(ctx, mode="context") == []
+
+
+def test_failures_reset_on_success_and_cooldown_expiry() -> None:
+    """recent_failures resets on success; cooldown_until_ms clears once passed."""
+    counters = WindowContextCounters(window_ms=60_000)
+    for t in range(3):
+        counters.record_step(t)
+        counters.record_failure(t)
+        counters.record_error(t)
+    counters.record_rate_limit(3)
+    counters.start_cooldown(3, 1000)
+    ctx = counters.context(10)
+    assert ctx == {
+        "errors_in_window": 3,
+        "steps_in_window": 3,
+        "rate_limit_events": 1,
+        "recent_failures": 3,
+        "cooldown_until_ms": 1003,
+    }
+    counters.record_success(20)
+    counters.record_failure(30)
+    ctx = counters.context(2000)
+    assert ctx["recent_failures"] == 1
+    assert ctx["errors_in_window"] == 3
+    assert ctx["cooldown_until_ms"] is None
+
+
+def test_invalid_window_rejected() -> None:
+    """window_ms must cover at least one bucket."""
+    with pytest.raises(ValueError):
+        WindowedCounter(window_ms=10, bucket_ms=100)
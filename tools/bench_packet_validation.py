@@ -0,0 +1,50 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""
+Per-packet throughput benchmark for decision_schema.packet_validation.
+
+Run from decision-schema repo root:
+    python tools/bench_packet_validation.py --packets 200000 [--fail-fast] [--objects]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+
+def main() -> int:
+    from decision_schema.packet_validation import PacketValidator, validate_packets
+    from decision_schema.synthetic import SyntheticConfig, SyntheticGenerator
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--packets", type=int, default=200_000)
+    parser.add_argument("--fail-fast", action="store_true")
+    parser.add_argument("--objects", action="store_true", help="Validate PacketV2 objects")
+    parser.add_argument("--strict-prefixes", default="exec,harness")
+    args = parser.parse_args()
+
+    gen = SyntheticGenerator(SyntheticConfig(runs=100, steps_per_run=max(1, args.packets // 100)))
+    packets = list(gen.packets() if args.objects else gen.packet_dicts())
+    validator = PacketValidator(
+        require_registry_for_prefixes=[p for p in args.strict_prefixes.split(",") if p]
+    )
+
+    t0 = time.perf_counter()
+    report = validate_packets(packets, fail_fast=args.fail_fast, validator=validator)
+    elapsed = time.perf_counter() - t0
+    print(
+        f"validated={report.checked} invalid={report.invalid} elapsed={elapsed:.2f}s "
+        f"rate={report.checked / elapsed:,.0f}/s per_packet={elapsed / report.checked * 1e6:.2f}us"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
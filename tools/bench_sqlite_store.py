@@ -0,0 +1,72 @@
+# Decision Ecosystem — decision-schema
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""
+Ingest-rate benchmark for decision_schema.sqlite_store.TraceStore.
+
+Run from decision-schema repo root:
+    python tools/bench_sqlite_store.py --packets 1000000 --batch-size 50000 [--defer-indexes]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+ACTIONS = ("ACT", "HOLD", "STOP", "EXIT", "CANCEL")
+
+
+def packets(n: int, runs: int):
+    for i in range(n):
+        yield {
+            "run_id": f"run-{i % runs}",
+            "step": i // runs,
+            "input": {"signal": i % 97},
+            "external": {"ops_state": "GREEN", "exec.attempt_count": 1},
+            "mdm": {"score": (i % 1000) / 1000},
+            "final_action": {"action": ACTIONS[i % len(ACTIONS)], "allowed": True},
+            "latency_ms": i % 50,
+            "mismatch": None,
+            "schema_version": "0.2.2",
+        }
+
+
+def main() -> int:
+    from decision_schema.query import PacketQuery
+    from decision_schema.sqlite_store import TraceStore
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--packets", type=int, default=1_000_000)
+    parser.add_argument("--runs", type=int, default=100)
+    parser.add_argument("--batch-size", type=int, default=50_000)
+    parser.add_argument("--defer-indexes", action="store_true")
+    parser.add_argument("--db", help="Database path (default: temporary file)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = args.db or str(Path(tmp) / "bench.sqlite")
+        with TraceStore(db) as store:
+            t0 = time.perf_counter()
+            n = store.ingest(
+                packets(args.packets, args.runs),
+                batch_size=args.batch_size,
+                defer_indexes=args.defer_indexes,
+            )
+            elapsed = time.perf_counter() - t0
+            print(f"ingested {n} packets in {elapsed:.2f}s: {n / elapsed:,.0f} packets/s")
+            t0 = time.perf_counter()
+            hits = store.count(PacketQuery(run_id="run-7", min_step=100, max_step=199))
+            print(
+                f"indexed run/step range count: {hits} in {(time.perf_counter() - t0) * 1e3:.2f} ms"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())